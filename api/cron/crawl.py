@@ -1,174 +1,68 @@
-"""Vercel Cron Job - RSS 크롤링 작업"""
+"""Vercel Cron Job - RSS 크롤링 작업
+
+vercel.json에서 /api/cron/crawl 요청을 이 함수로 보내므로
+index.py의 maxDuration(60초)이 아니라 이 함수의 maxDuration 안에서 실행된다.
+(시간 예산은 CRAWL_FUNCTION_MAX_DURATION_SECONDS에서 여유 시간을 뺀 값)
+"""
 import sys
 import os
 from pathlib import Path
-import asyncio
 from datetime import datetime
 
 # 프로젝트 루트 경로 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "backend"))
 sys.path.insert(0, str(project_root / "backend" / "shared"))
 sys.path.insert(0, str(project_root / "backend" / "ingestor" / "src"))
 sys.path.insert(0, str(project_root / "backend" / "nlp-service" / "src"))
 
-import asyncpg
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+# 크롤러 워커는 스케줄러 서비스의 구현을 그대로 사용
+from scheduler.src.worker import CrawlerWorker
 from config.settings import settings
-from collectors.rss_collector import RSSCollector
-from processors.deduplicator import Deduplicator
-from sentiment.rule_based import RuleBasedSentimentAnalyzer
 
+app = FastAPI(title="#onmi Cron")
 
-class CrawlerWorker:
-    """크롤러 워커 클래스"""
-    
-    def __init__(self):
-        self.rss_collector = RSSCollector()
-        self.deduplicator = Deduplicator()
-        self.sentiment_analyzer = RuleBasedSentimentAnalyzer()
-    
-    async def crawl_keyword(self, keyword_id: str, keyword_text: str, db_conn):
-        """키워드별 기사 수집 및 처리"""
-        print(f"키워드 수집 시작: {keyword_text} (ID: {keyword_id})")
-        
-        # RSS 소스에서 기사 수집
-        all_articles = []
-        for rss_url in settings.rss_sources:
-            articles = self.rss_collector.collect_from_rss(rss_url)
-            # 키워드 매칭 필터링
-            matched_articles = [
-                article for article in articles
-                if keyword_text.lower() in article['title'].lower() or
-                   keyword_text.lower() in article.get('snippet', '').lower()
-            ]
-            all_articles.extend(matched_articles)
-        
-        # 중복 제거
-        unique_articles = self.deduplicator.filter_duplicates(all_articles)
-        
-        # 데이터베이스에 저장
-        saved_count = 0
-        for article in unique_articles:
-            try:
-                # 기사 저장 또는 조회
-                article_id = await db_conn.fetchval(
-                    """
-                    INSERT INTO articles (url, title, snippet, source, published_at, lang)
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                    ON CONFLICT (url) DO UPDATE SET title = EXCLUDED.title
-                    RETURNING id
-                    """,
-                    article['url'],
-                    article['title'],
-                    article.get('snippet', ''),
-                    article.get('source', ''),
-                    article.get('published_at'),
-                    article.get('lang', 'ko')
-                )
-                
-                # 키워드-기사 매핑 저장
-                await db_conn.execute(
-                    """
-                    INSERT INTO keyword_articles (keyword_id, article_id, match_score, match_type)
-                    VALUES ($1, $2, 1.0, 'exact')
-                    ON CONFLICT (keyword_id, article_id) DO NOTHING
-                    """,
-                    keyword_id, article_id
-                )
-                
-                # 감성 분석 수행
-                sentiment_result = self.sentiment_analyzer.analyze(
-                    article['title'],
-                    article.get('snippet', '')
-                )
-                
-                # 감성 분석 결과 저장
-                await db_conn.execute(
-                    """
-                    INSERT INTO sentiments (article_id, label, score, rationale, model_ver)
-                    VALUES ($1, $2, $3, $4, 'rule-based-v1')
-                    ON CONFLICT (article_id) DO UPDATE SET
-                        label = EXCLUDED.label,
-                        score = EXCLUDED.score,
-                        rationale = EXCLUDED.rationale
-                    """,
-                    article_id,
-                    sentiment_result['label'],
-                    sentiment_result['score'],
-                    sentiment_result['rationale']
-                )
-                
-                saved_count += 1
-            
-            except Exception as e:
-                print(f"기사 저장 오류: {e}")
-                continue
-        
-        # 키워드의 last_crawled_at 업데이트
-        await db_conn.execute(
-            "UPDATE keywords SET last_crawled_at = NOW() WHERE id = $1",
-            keyword_id
-        )
-        
-        print(f"키워드 수집 완료: {keyword_text} - {saved_count}개 기사 저장")
-        return saved_count
-    
-    async def run_crawl_job(self):
-        """크롤링 작업 실행"""
-        print(f"크롤링 작업 시작: {datetime.now()}")
-        
-        # 데이터베이스 연결
-        conn = await asyncpg.connect(settings.database_url)
-        
-        try:
-            # 활성 키워드 조회
-            keywords = await conn.fetch(
-                """
-                SELECT id, text FROM keywords WHERE status = 'active'
-                """
-            )
-            
-            print(f"수집 대상 키워드 수: {len(keywords)}")
-            
-            # 각 키워드별 수집
-            for keyword in keywords:
-                try:
-                    await self.crawl_keyword(
-                        str(keyword['id']),
-                        keyword['text'],
-                        conn
-                    )
-                except Exception as e:
-                    print(f"키워드 수집 오류 ({keyword['text']}): {e}")
-                    continue
-        
-        finally:
-            await conn.close()
-        
-        print(f"크롤링 작업 완료: {datetime.now()}")
 
+@app.get("/api/cron/crawl")
+@app.post("/api/cron/crawl")
+async def cron_crawl(request: Request):
+    """Vercel Cron Job - 크롤링 작업"""
+    # Cron Job 인증 확인 (선택사항)
+    # Vercel Cron은 자동으로 호출하지만, 추가 보안을 위해 CRON_SECRET 사용 가능
+    cron_secret = os.getenv("CRON_SECRET", "")
+    if cron_secret:
+        auth_header = request.headers.get("Authorization", "")
+        if auth_header != f"Bearer {cron_secret}":
+            return JSONResponse(
+                status_code=401,
+                content={"error": "Unauthorized"}
+            )
 
-async def handler(request):
-    """Vercel Cron Job 핸들러"""
     try:
         worker = CrawlerWorker()
-        await worker.run_crawl_job()
+        # 시간 예산 안에서 처리하고 남은 키워드는 다음 호출에서 이어서 수집
+        result = await worker.run_crawl_job(settings.crawl_time_budget_seconds)
         return {
-            "statusCode": 200,
-            "body": {
-                "message": "크롤링 작업이 완료되었습니다",
-                "timestamp": datetime.now().isoformat()
-            }
+            "status": "success",
+            "message": (
+                "크롤링 작업이 완료되었습니다" if result['round_completed']
+                else "시간 예산 내 처리를 마쳤습니다 (남은 키워드는 다음 실행에서 이어서 수집)"
+            ),
+            "result": result,
+            "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
-        print(f"크롤링 작업 오류: {e}")
-        return {
-            "statusCode": 500,
-            "body": {
+        import traceback
+        print(f"Cron job error: {traceback.format_exc()}")
+        return JSONResponse(
+            status_code=500,
+            content={
+                "status": "error",
                 "error": str(e),
                 "timestamp": datetime.now().isoformat()
             }
-        }
-
-
-
+        )
@@ -1,6 +1,5 @@
 """Vercel 서버리스 함수 진입점 - FastAPI 앱"""
 import sys
-import os
 from pathlib import Path
 
 # 프로젝트 루트 경로 추가
@@ -11,7 +10,6 @@ sys.path.insert(0, str(project_root / "backend" / "api-gateway" / "src"))
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 # 라우터 import
 from routes import auth, keywords, feed, articles, stats, share, notifications
@@ -58,45 +56,17 @@ async def health():
 
 
 # Cron Job 엔드포인트
+# 배포 환경에서는 vercel.json이 이 경로를 api/cron/crawl.py(더 긴 maxDuration)로 보내고,
+# 로컬에서 이 앱만 실행할 때를 위해 같은 구현을 연결해 둔다.
 @app.get("/api/cron/crawl")
 @app.post("/api/cron/crawl")
 async def cron_crawl(request: Request):
-    """Vercel Cron Job - 크롤링 작업"""
-    # Cron Job 인증 확인 (선택사항)
-    # Vercel Cron은 자동으로 호출하지만, 추가 보안을 위해 CRON_SECRET 사용 가능
-    cron_secret = os.getenv("CRON_SECRET", "")
-    if cron_secret:
-        auth_header = request.headers.get("Authorization", "")
-        if auth_header != f"Bearer {cron_secret}":
-            return JSONResponse(
-                status_code=401,
-                content={"error": "Unauthorized"}
-            )
+    """Vercel Cron Job - 크롤링 작업 (api/cron/crawl.py와 같은 구현)"""
+    # 경로 조정: api/cron/crawl.py에서 import
+    sys.path.insert(0, str(project_root / "api"))
+    from cron.crawl import cron_crawl as run_cron_crawl
     
-    # 크롤링 작업 실행
-    try:
-        # 경로 조정: api/cron/crawl.py에서 import
-        sys.path.insert(0, str(project_root / "api"))
-        from cron.crawl import CrawlerWorker
-        
-        worker = CrawlerWorker()
-        await worker.run_crawl_job()
-        
-        return {
-            "status": "success",
-            "message": "크롤링 작업이 완료되었습니다"
-        }
-    except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"Cron job error: {error_trace}")
-        return JSONResponse(
-            status_code=500,
-            content={
-                "status": "error",
-                "error": str(e)
-            }
-        )
+    return await run_cron_crawl(request)
 
 
 # Vercel은 자동으로 ASGI 앱을 감지하므로 별도 핸들러 불필요
@@ -0,0 +1,244 @@
+"""NLP 서비스 어댑터 (프로세스 내 분석기 / 원격 nlp-service)"""
+import asyncio
+import os
+import sys
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+# 공통 모듈 / NLP 서비스 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../shared'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../nlp-service/src'))
+from text_processing.normalized_text import NormalizedText
+from sentiment.rule_based import RuleBasedSentimentAnalyzer
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
+
+class SentimentAdapter(ABC):
+    """감성 분석 어댑터 공통 인터페이스
+    
+    - model_version: sentiments.model_ver에 기록할 모델 버전
+    - languages: 분석 가능한 언어 코드 (SentimentAnalyzerRegistry에 등록할 때 사용)
+    
+    open()을 호출한 뒤부터 model_version과 languages가 유효하다.
+    analyze_many를 구현하지 않은 어댑터는 생성 시점에 TypeError가 난다.
+    """
+    
+    model_version: Optional[str] = None
+    languages: Tuple[str, ...] = ()
+    
+    async def open(self):
+        """어댑터 준비 (여러 번 호출해도 한 번만 수행)"""
+    
+    async def close(self):
+        """어댑터 자원 해제"""
+    
+    async def analyze(self, title: str, content: str = "") -> Dict:
+        """기사 하나 감성 분석"""
+        results = await self.analyze_many([NormalizedText(title, content)])
+        return results[0]
+    
+    @abstractmethod
+    async def analyze_many(self, texts: List[NormalizedText]) -> List[Dict]:
+        """여러 기사 감성 분석 (결과 순서는 입력 순서와 같음)"""
+
+
+class InProcessSentimentAdapter(SentimentAdapter):
+    """현재 프로세스에서 RuleBasedSentimentAnalyzer로 분석"""
+    
+    def __init__(self, analyzer: Optional[RuleBasedSentimentAnalyzer] = None):
+        self.analyzer = analyzer or RuleBasedSentimentAnalyzer()
+        self.model_version = self.analyzer.model_version
+        self.languages = tuple(self.analyzer.languages)
+    
+    async def analyze_many(self, texts: List[NormalizedText]) -> List[Dict]:
+        """정규화 텍스트의 전처리 결과를 재사용해 분석"""
+        return [self.analyzer.analyze_normalized(text) for text in texts]
+
+
+class RemoteSentimentAdapter(SentimentAdapter):
+    """별도로 실행 중인 nlp-service(src/server.py)에 분석을 요청
+    
+    요청을 바로 보내지 않고 큐에 모았다가 max_batch_size개가 차거나
+    첫 요청 후 max_wait_ms가 지나면 한 번의 배치 요청으로 보낸다.
+    동시에 진행되는 배치 요청 수는 max_concurrent_batches로 제한한다.
+    
+    url: 'http://host:port' 또는 'unix:///path/to/nlp.sock'
+    """
+    
+    # 유닉스 소켓 연결 시 요청 URL에 쓰는 호스트 (실제 연결은 소켓 경로로)
+    UNIX_SOCKET_HOST = 'http://nlp-service'
+    
+    def __init__(
+        self,
+        url: str,
+        max_batch_size: int = 64,
+        max_wait_ms: int = 10,
+        max_concurrent_batches: int = 4,
+        timeout: int = 30
+    ):
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError(
+                "aiohttp 모듈이 설치되지 않았습니다. 'pip install aiohttp'를 실행하세요."
+            )
+        self.url = url
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_concurrent_batches = max_concurrent_batches
+        self.timeout = timeout
+        
+        self._session = None
+        self._base_url = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._requests: set = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def open(self):
+        """세션 생성, 서비스 정보(model_version, languages) 조회, 배치 태스크 시작"""
+        if self._session is not None:
+            return
+        
+        if self.url.startswith('unix://'):
+            connector = aiohttp.UnixConnector(path=self.url[len('unix://'):])
+            self._base_url = self.UNIX_SOCKET_HOST
+        else:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrent_batches)
+            self._base_url = self.url.rstrip('/')
+        
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        try:
+            async with self._session.get(f"{self._base_url}/v1/info") as response:
+                response.raise_for_status()
+                info = await response.json()
+        except Exception:
+            await self._session.close()
+            self._session = None
+            raise
+        
+        self.model_version = info['model_version']
+        self.languages = tuple(info['languages'])
+        
+        self._queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        self._batcher = asyncio.create_task(self._run_batcher())
+    
+    async def close(self):
+        """배치 태스크 중단 후 세션 종료
+        
+        이미 전송 중인 배치는 끝날 때까지 기다리고, 아직 전송되지 않은 요청은 실패 처리한다.
+        """
+        if self._session is None:
+            return
+        
+        self._batcher.cancel()
+        await asyncio.gather(self._batcher, return_exceptions=True)
+        await asyncio.gather(*self._requests, return_exceptions=True)
+        
+        unsent = []
+        while not self._queue.empty():
+            unsent.append(self._queue.get_nowait())
+        self._fail(unsent, RuntimeError("NLP 서비스 어댑터가 종료되었습니다"))
+        
+        await self._session.close()
+        self._session = None
+    
+    async def analyze_many(self, texts: List[NormalizedText]) -> List[Dict]:
+        """요청을 배치 큐에 넣고 결과를 기다림"""
+        await self.open()
+        
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._queue.put_nowait(({'title': text.title, 'content': text.snippet}, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+    
+    async def _run_batcher(self):
+        """큐의 요청을 크기/대기 시간 기준으로 묶어 전송"""
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait
+                
+                while len(batch) < self.max_batch_size:
+                    # 이미 쌓인 요청은 기다리지 않고 바로 꺼냄
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                await self._semaphore.acquire()
+                task = asyncio.create_task(self._send(batch))
+                self._requests.add(task)
+                task.add_done_callback(self._requests.discard)
+                batch = []
+        
+        except asyncio.CancelledError:
+            # 모으는 중이던 요청은 전송되지 않으므로 실패 처리
+            self._fail(batch, RuntimeError("NLP 서비스 어댑터가 종료되었습니다"))
+            raise
+    
+    async def _send(self, batch: List[Tuple[Dict, asyncio.Future]]):
+        """배치 하나를 요청하고 각 요청의 결과를 채움"""
+        try:
+            async with self._session.post(
+                f"{self._base_url}/v1/sentiment/batch",
+                json={'articles': [article for article, _ in batch]}
+            ) as response:
+                response.raise_for_status()
+                payload = await response.json()
+            
+            results = payload['results']
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"NLP 서비스 응답 개수 불일치 (요청 {len(batch)}, 응답 {len(results)})"
+                )
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        
+        except Exception as e:
+            self._fail(batch, e)
+        
+        finally:
+            self._semaphore.release()
+    
+    def _fail(self, batch: List[Tuple[Dict, asyncio.Future]], error: Exception):
+        """아직 결과가 없는 요청을 오류로 완료"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+
+def create_sentiment_adapter(
+    backend: str = 'inprocess',
+    url: Optional[str] = None,
+    max_batch_size: int = 64,
+    max_wait_ms: int = 10
+) -> SentimentAdapter:
+    """설정에 따른 감성 분석 어댑터 생성 (backend: 'inprocess', 'remote')"""
+    if backend == 'remote':
+        if not url:
+            raise ValueError("원격 NLP 서비스 URL(NLP_SERVICE_URL)이 설정되지 않았습니다.")
+        return RemoteSentimentAdapter(url, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    if backend == 'inprocess':
+        return InProcessSentimentAdapter()
+    raise ValueError(f"알 수 없는 NLP 백엔드: {backend}")
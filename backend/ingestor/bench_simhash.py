@@ -0,0 +1,124 @@
+"""SimHash 벤치마크 스크립트
+
+일괄 계산(SimhashFingerprinter)과 simhash 패키지(Simhash(features).value)의
+지문이 같은지 확인하고 배치 크기별 처리 속도를 비교한다.
+
+사용법:
+    python bench_simhash.py [--titles 20000] [--batch-sizes 100,1000,10000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+from simhash import Simhash
+
+# ingestor 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from processors.fast_simhash import SimhashFingerprinter, shingle_features
+
+
+HANGUL_SYLLABLES = [chr(code) for code in range(0xAC00, 0xAC00 + 400)]
+
+SAMPLE_TITLES = [
+    "삼성전자 실적 개선 기대감에 주가 상승",
+    "신제품 출시 논란, 소비자 불안 확대",
+    "정부 규제 완화로 스타트업 성장 돌파구 마련",
+    "대규모 손실 우려에 투자 심리 위축",
+    "[속보] AI 혁신 기술로 생산성 향상, 업계 최고 수준",
+    "경기 침체 위기 속 수출 감소세 지속",
+    "Apple unveils new product lineup with great success",
+    "NVIDIA shares hit record high on AI demand",
+]
+
+
+def random_word(rng: random.Random, min_len: int = 1, max_len: int = 4) -> str:
+    """임의의 한글 단어 생성"""
+    return ''.join(rng.choice(HANGUL_SYLLABLES) for _ in range(rng.randint(min_len, max_len)))
+
+
+def build_titles(rng: random.Random, count: int):
+    """실제 기사 제목과 임의 단어를 섞은 제목 생성 (신디케이션 중복 포함)"""
+    titles = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.2 and titles:
+            # 다른 매체가 같은 기사를 재전송한 경우
+            titles.append(rng.choice(titles))
+        elif roll < 0.5:
+            titles.append(f"{rng.choice(SAMPLE_TITLES)} {random_word(rng)}")
+        else:
+            titles.append(' '.join(random_word(rng) for _ in range(rng.randint(3, 12))))
+    # 토큰화 경계 사례 (빈 제목, 4글자 미만, 기호만 있는 제목)
+    titles.extend(["", "AI", "!!", "   "])
+    return titles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SimHash 일괄 계산 벤치마크")
+    parser.add_argument('--titles', type=int, default=20000, help="계산할 제목 수")
+    parser.add_argument(
+        '--batch-sizes',
+        default='100,1000,10000',
+        help="비교할 배치 크기 (쉼표 구분)"
+    )
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    titles = build_titles(rng, args.titles)
+    # 특징 추출은 수집 단계에서 NormalizedText가 한 번 수행하므로 측정에서 제외
+    features = [shingle_features(title) for title in titles]
+
+    # 결과 일치 확인
+    reference = [Simhash(feature).value for feature in features]
+    fingerprinter = SimhashFingerprinter()
+    mismatches = sum(
+        1 for expected, actual in zip(reference, fingerprinter.fingerprint_many(features))
+        if expected != actual
+    )
+    mismatches += sum(
+        1 for title, expected in zip(titles, fingerprinter.fingerprint_texts(titles))
+        if Simhash(title).value != expected
+    )
+
+    started = time.perf_counter()
+    for feature in features:
+        Simhash(feature).value
+    reference_time = time.perf_counter() - started
+
+    print(f"제목 수: {len(titles)}")
+    print(f"{'배치 크기':>10} {'기준(초)':>10} {'일괄(초)':>10} {'배속':>8} {'캐시 없음(초)':>14} {'배속':>8}")
+
+    for batch_size in [int(size) for size in args.batch_sizes.split(',')]:
+        batches = [features[i:i + batch_size] for i in range(0, len(features), batch_size)]
+
+        # 장시간 실행되는 워커처럼 다이제스트 캐시가 채워진 상태
+        warm = SimhashFingerprinter()
+        warm.fingerprint_many(features)
+        started = time.perf_counter()
+        for batch in batches:
+            warm.fingerprint_many(batch)
+        warm_time = time.perf_counter() - started
+
+        # 첫 배치처럼 다이제스트를 모두 새로 계산하는 경우
+        started = time.perf_counter()
+        for batch in batches:
+            SimhashFingerprinter().fingerprint_many(batch)
+        cold_time = time.perf_counter() - started
+
+        warm_speedup = reference_time / warm_time if warm_time else float('inf')
+        cold_speedup = reference_time / cold_time if cold_time else float('inf')
+        print(
+            f"{batch_size:>10} {reference_time:>10.3f} {warm_time:>10.3f} {warm_speedup:>7.1f}x "
+            f"{cold_time:>14.3f} {cold_speedup:>7.1f}x"
+        )
+
+    print("일치" if mismatches == 0 else f"불일치 {mismatches}건")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
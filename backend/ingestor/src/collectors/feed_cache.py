@@ -0,0 +1,47 @@
+"""프로세스 안에서 공유하는 RSS 피드 스냅샷 캐시 (일부 키워드 수집 작업용)"""
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class FeedSnapshotCache:
+    """소스별 마지막 응답의 검증자(ETag/Last-Modified)와 파싱된 전체 항목 보관
+    
+    일부 키워드만 수집하는 작업(적응형 스케줄, 작업 큐)은 전역 워터마크를 쓸 수 없어
+    피드의 전체 항목이 필요하다. 이 캐시를 쓰면 같은 프로세스의 다음 작업은
+    - max_age_seconds 안이면 요청 없이 캐시된 항목을 그대로 쓰고
+    - 그 뒤에는 캐시된 검증자로 조건부 요청을 보내 변경이 없으면(304) 다시 파싱하지 않는다.
+    항목별로 어느 키워드가 이미 봤는지는 키워드의 last_crawled_at으로 거른다.
+    """
+    
+    def __init__(self, max_age_seconds: float = 300, clock: Callable[[], float] = time.monotonic):
+        self.max_age_seconds = max_age_seconds
+        self.clock = clock
+        # 소스 URL -> {'etag', 'last_modified', 'articles', 'fetched_at'}
+        self.entries: Dict[str, Dict] = {}
+    
+    def get(self, source_url: str) -> Optional[Dict]:
+        """소스의 캐시 항목 (없으면 None)"""
+        return self.entries.get(source_url)
+    
+    def is_fresh(self, entry: Dict) -> bool:
+        """요청 없이 재사용할 수 있을 만큼 최근에 확인한 항목인지"""
+        return self.clock() - entry['fetched_at'] < self.max_age_seconds
+    
+    def put(
+        self,
+        source_url: str,
+        articles: List[Dict],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """새로 받은 피드의 항목과 검증자 저장"""
+        self.entries[source_url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'articles': articles,
+            'fetched_at': self.clock()
+        }
+    
+    def touch(self, source_url: str):
+        """변경 없음(304)을 확인한 시각 기록"""
+        self.entries[source_url]['fetched_at'] = self.clock()
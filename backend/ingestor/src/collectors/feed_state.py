@@ -0,0 +1,116 @@
+"""RSS 소스별 수집 상태 저장소 (조건부 요청 검증자)"""
+import json
+import os
+from datetime import datetime
+from typing import Dict, List
+
+
+class FileFeedStateStore:
+    """로컬 JSON 파일 기반 피드 상태 저장소"""
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    async def load(self, source_urls: List[str]) -> Dict[str, Dict]:
+        """소스별 상태 조회"""
+        if not os.path.exists(self.path):
+            return {}
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                states = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"피드 상태 파일 읽기 오류 ({self.path}): {e}")
+            return {}
+        
+        return {url: states[url] for url in source_urls if url in states}
+    
+    async def save(self, states: Dict[str, Dict]):
+        """소스별 상태 저장 (기존 항목과 병합)"""
+        merged = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    merged = json.load(f)
+            except (OSError, ValueError):
+                merged = {}
+        
+        merged.update(states)
+        
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # 중간에 종료되어도 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+class DatabaseFeedStateStore:
+    """feed_states 테이블 기반 피드 상태 저장소"""
+    
+    def __init__(self, db_conn):
+        self.db_conn = db_conn
+    
+    async def load(self, source_urls: List[str]) -> Dict[str, Dict]:
+        """소스별 상태 조회"""
+        rows = await self.db_conn.fetch(
+            """
+            SELECT source_url, etag, last_modified,
+                   last_entry_guid, last_published_at, recent_guids
+            FROM feed_states
+            WHERE source_url = ANY($1::text[])
+            """,
+            source_urls
+        )
+        return {
+            row['source_url']: {
+                'etag': row['etag'],
+                'last_modified': row['last_modified'],
+                'last_entry_guid': row['last_entry_guid'],
+                'last_published_at': row['last_published_at'],
+                'recent_guids': json.loads(row['recent_guids'] or '[]')
+            }
+            for row in rows
+        }
+    
+    async def save(self, states: Dict[str, Dict]):
+        """소스별 상태 저장"""
+        if not states:
+            return
+        
+        await self.db_conn.executemany(
+            """
+            INSERT INTO feed_states (
+                source_url, etag, last_modified,
+                last_entry_guid, last_published_at, recent_guids
+            )
+            VALUES ($1, $2, $3, $4, $5, $6::jsonb)
+            ON CONFLICT (source_url) DO UPDATE SET
+                etag = EXCLUDED.etag,
+                last_modified = EXCLUDED.last_modified,
+                last_entry_guid = EXCLUDED.last_entry_guid,
+                last_published_at = EXCLUDED.last_published_at,
+                recent_guids = EXCLUDED.recent_guids,
+                updated_at = NOW()
+            """,
+            [
+                (
+                    url,
+                    state.get('etag'),
+                    state.get('last_modified'),
+                    state.get('last_entry_guid'),
+                    self._to_datetime(state.get('last_published_at')),
+                    json.dumps(state.get('recent_guids') or [])
+                )
+                for url, state in states.items()
+            ]
+        )
+    
+    def _to_datetime(self, value):
+        """ISO 문자열로 저장된 시각을 datetime으로 변환"""
+        if value is None or isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(value)
@@ -1,17 +1,62 @@
 """RSS 피드 수집기"""
+import asyncio
 import feedparser
 import requests
+import os
+import sys
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import calendar
 import hashlib
 from urllib.parse import urlparse, urlunparse
 
+from collectors.feed_cache import FeedSnapshotCache
+from collectors.watermark import FeedWatermark
+
+# 공통 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../shared'))
+from text_processing.normalized_text import NormalizedText
+
+try:
+    from collectors.streaming_parser import StreamingFeedParser
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    StreamingFeedParser = None
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    aiohttp = None
+
 
 class RSSCollector:
     """RSS 피드 수집 클래스"""
     
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_connections: int = 20,
+        max_connections_per_host: int = 4,
+        watermark_lookback: timedelta = timedelta(hours=6),
+        parser_backend: str = 'feedparser'
+    ):
         self.timeout = timeout
+        # 비동기 수집 시 전체/호스트별 동시 연결 수 제한
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        # 증분 수집 시 워터마크 이전 항목을 다시 확인하는 구간
+        self.watermark_lookback = watermark_lookback
+        # 비동기 수집 파서: 'feedparser' 또는 'lxml' (스트리밍, 조기 종료)
+        if parser_backend == 'lxml' and not LXML_AVAILABLE:
+            raise RuntimeError(
+                "lxml 모듈이 설치되지 않았습니다. 'pip install lxml'을 실행하세요."
+            )
+        self.parser_backend = parser_backend
+        # 마지막 비동기 수집 실행의 소스별 결과 카운터
+        self.last_run_stats = self._empty_stats()
     
     def normalize_url(self, url: str) -> str:
         """URL 정규화"""
@@ -31,47 +76,209 @@ class RSSCollector:
         """RSS 피드에서 기사 수집"""
         try:
             feed = feedparser.parse(rss_url)
-            articles = []
-            
-            for entry in feed.entries:
-                # 필수 필드 확인
-                if not entry.get('title') or not entry.get('link'):
-                    continue
-                
-                # URL 정규화
-                normalized_url = self.normalize_url(entry.link)
+            return self._attach_normalized(self._extract_articles(feed))
+        
+        except Exception as e:
+            print(f"RSS 수집 오류 ({rss_url}): {e}")
+            return []
+    
+    async def collect_many(
+        self,
+        rss_urls: List[str],
+        feed_states: Optional[Dict[str, Dict]] = None,
+        feed_cache: Optional[FeedSnapshotCache] = None
+    ) -> Dict[str, List[Dict]]:
+        """여러 RSS 피드를 동시에 수집 (연결 풀 공유)
+        
+        전체 수집 시간이 피드 지연 시간의 합이 아니라 가장 느린 피드에
+        가깝도록 모든 소스를 하나의 keep-alive 세션에서 병렬로 가져온다.
+        
+        feed_states가 주어지면 소스별 ETag/Last-Modified로 조건부 요청을
+        보내고, 응답으로 받은 새 검증자를 같은 dict에 기록한다.
+        변경되지 않은(304) 소스는 빈 목록을 반환한다.
+        또한 소스별 워터마크 이후의 새 항목만 반환하고 워터마크를 갱신한다.
+        
+        feed_cache가 주어지면(feed_states 대신) 워터마크 없이 전체 항목을 반환하되
+        캐시의 검증자로 조건부 요청을 보내고, 변경이 없거나 최근에 받은 소스는 캐시된 항목을 쓴다.
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError(
+                "aiohttp 모듈이 설치되지 않았습니다. 'pip install aiohttp'를 실행하세요."
+            )
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        self.last_run_stats = self._empty_stats()
+        self.last_run_stats['sources'] = len(rss_urls)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(*[
+                self.collect_from_rss_async(rss_url, session, feed_states, feed_cache)
+                for rss_url in rss_urls
+            ])
+        
+        return dict(zip(rss_urls, results))
+    
+    async def collect_from_rss_async(
+        self,
+        rss_url: str,
+        session,
+        feed_states: Optional[Dict[str, Dict]] = None,
+        feed_cache: Optional[FeedSnapshotCache] = None
+    ) -> List[Dict]:
+        """RSS 피드에서 기사 비동기 수집 (파싱은 스레드 풀에서 수행)"""
+        state = feed_states.get(rss_url, {}) if feed_states is not None else {}
+        
+        cached = feed_cache.get(rss_url) if feed_cache is not None else None
+        if cached is not None:
+            if feed_cache.is_fresh(cached):
+                self.last_run_stats['cached'] += 1
+                return list(cached['articles'])
+            state = cached
+        
+        # 조건부 요청 헤더
+        request_headers = {}
+        if state.get('etag'):
+            request_headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            request_headers['If-Modified-Since'] = state['last_modified']
+        
+        try:
+            async with session.get(rss_url, headers=request_headers) as response:
+                if response.status == 304:
+                    # 변경 없음: 파싱과 매칭을 모두 건너뜀 (캐시가 있으면 캐시된 항목 재사용)
+                    self.last_run_stats['not_modified'] += 1
+                    if cached is not None:
+                        feed_cache.touch(rss_url)
+                        return list(cached['articles'])
+                    return []
                 
-                # 기사 정보 추출
-                article = {
-                    'url': normalized_url,
-                    'title': entry.title,
-                    'snippet': entry.get('summary', '')[:500],  # 최대 500자
-                    'source': feed.feed.get('title', 'Unknown'),
-                    'published_at': self._parse_date(entry.get('published')),
-                    'lang': 'ko'  # 기본값, 실제로는 언어 감지 필요
+                response.raise_for_status()
+                body = await response.read()
+                response_headers = {
+                    key.lower(): value for key, value in response.headers.items()
                 }
-                
-                articles.append(article)
             
-            return articles
+            watermark = FeedWatermark(state, self.watermark_lookback)
+            
+            loop = asyncio.get_running_loop()
+            if self.parser_backend == 'lxml':
+                # 워터마크보다 오래된 항목에 도달하면 파싱 중단
+                articles = await loop.run_in_executor(
+                    None,
+                    lambda: self._parse_streaming(
+                        body,
+                        watermark if feed_states is not None else None
+                    )
+                )
+            else:
+                feed = await loop.run_in_executor(
+                    None,
+                    lambda: feedparser.parse(body, response_headers=response_headers)
+                )
+                articles = self._extract_articles(feed)
+            self.last_run_stats['fetched'] += 1
+            
+            if feed_cache is not None:
+                articles = self._attach_normalized(articles)
+                feed_cache.put(
+                    rss_url,
+                    articles,
+                    response_headers.get('etag'),
+                    response_headers.get('last-modified')
+                )
+                return list(articles)
+            
+            if feed_states is None:
+                return self._attach_normalized(articles)
+            
+            # 워터마크 이후의 새 항목만 전달
+            new_articles = watermark.filter_new(articles)
+            self.last_run_stats['skipped_seen'] += len(articles) - len(new_articles)
+            watermark.advance(articles)
+            
+            feed_states[rss_url] = {
+                **state,
+                **watermark.to_state(),
+                'etag': response_headers.get('etag'),
+                'last_modified': response_headers.get('last-modified')
+            }
+            return self._attach_normalized(new_articles)
         
         except Exception as e:
+            self.last_run_stats['failed'] += 1
             print(f"RSS 수집 오류 ({rss_url}): {e}")
             return []
     
-    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """날짜 문자열 파싱"""
-        if not date_str:
+    def _parse_streaming(
+        self,
+        body: bytes,
+        watermark: Optional[FeedWatermark] = None
+    ) -> List[Dict]:
+        """스트리밍 파서로 기사 목록 추출 (워터마크 이전 항목에서 조기 종료)"""
+        parser = StreamingFeedParser(self.normalize_url)
+        if watermark is None:
+            return list(parser.iter_entries(body))
+        return list(parser.iter_entries(
+            body,
+            stop_before=watermark.cutoff,
+            stop_at_guid=watermark.last_entry_guid
+        ))
+    
+    def _attach_normalized(self, articles: List[Dict]) -> List[Dict]:
+        """기사마다 정규화 텍스트를 붙이고 언어를 감지 (매칭/중복 제거/감성 분석이 공유)"""
+        for article in articles:
+            normalized = NormalizedText(article['title'], article.get('snippet', ''))
+            article['normalized'] = normalized
+            article['lang'] = normalized.lang
+        return articles
+    
+    def _empty_stats(self) -> Dict[str, int]:
+        """수집 실행 카운터 초기값"""
+        return {
+            'sources': 0, 'fetched': 0, 'not_modified': 0, 'cached': 0, 'failed': 0, 'skipped_seen': 0
+        }
+    
+    def _extract_articles(self, feed) -> List[Dict]:
+        """파싱된 피드에서 기사 목록 추출"""
+        articles = []
+        
+        for entry in feed.entries:
+            # 필수 필드 확인
+            if not entry.get('title') or not entry.get('link'):
+                continue
+            
+            # URL 정규화
+            normalized_url = self.normalize_url(entry.link)
+            
+            # 기사 정보 추출
+            article = {
+                'url': normalized_url,
+                'title': entry.title,
+                'snippet': entry.get('summary', '')[:500],  # 최대 500자
+                'source': feed.feed.get('title', 'Unknown'),
+                'guid': entry.get('id') or normalized_url,
+                'published_at': self._parse_date(
+                    entry.get('published_parsed') or entry.get('updated_parsed')
+                ),
+                'lang': 'ko'  # 기본값 (수집기가 정규화 텍스트로 언어를 감지해 갱신)
+            }
+            
+            articles.append(article)
+        
+        return articles
+    
+    def _parse_date(self, date_parsed) -> Optional[datetime]:
+        """feedparser가 파싱한 날짜(UTC struct_time)를 datetime으로 변환"""
+        if not date_parsed:
             return None
         
         try:
-            # feedparser의 날짜 파싱 활용
-            import time
-            if hasattr(date_str, 'parsed'):
-                return datetime.fromtimestamp(time.mktime(date_str.parsed))
-            return None
-        except:
+            return datetime.fromtimestamp(calendar.timegm(date_parsed), tz=timezone.utc)
+        except (TypeError, ValueError, OverflowError):
             return None
-
-
-
@@ -0,0 +1,147 @@
+"""lxml iterparse 기반 스트리밍 RSS/Atom 파서"""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import Callable, Dict, Iterator, Optional
+
+from lxml import etree
+
+
+ENTRY_TAGS = {'item', 'entry'}
+FEED_TAGS = {'channel', 'feed'}
+
+
+class StreamingFeedParser:
+    """피드 전체 트리를 만들지 않고 항목 단위로 파싱하는 파서
+    
+    항목은 파싱되는 즉시 생성기로 반환되고, 처리한 요소는 바로 메모리에서 해제된다.
+    stop_before 시각보다 오래된 항목이 연속으로 max_old_entries개 나오거나
+    (발행 시각이 없는 피드에서) stop_at_guid 항목에 도달하면 나머지 문서는 읽지 않고 종료한다.
+    """
+    
+    def __init__(self, normalize_url: Callable[[str], str], max_old_entries: int = 3):
+        self.normalize_url = normalize_url
+        # 순서가 조금 어긋난 피드를 위해 오래된 항목이 연속으로 몇 개 나와야 중단할지
+        self.max_old_entries = max_old_entries
+    
+    def iter_entries(
+        self,
+        body: bytes,
+        stop_before: Optional[datetime] = None,
+        stop_at_guid: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """피드 본문에서 기사 dict를 순서대로 생성"""
+        source = 'Unknown'
+        old_entries = 0
+        context = etree.iterparse(
+            BytesIO(body),
+            events=('end',),
+            recover=True,
+            resolve_entities=False,
+            no_network=True
+        )
+        
+        for _, element in context:
+            name = self._local_name(element)
+            
+            if name == 'title':
+                parent = element.getparent()
+                if parent is not None and self._local_name(parent) in FEED_TAGS:
+                    source = self._text(element) or source
+                continue
+            
+            if name not in ENTRY_TAGS:
+                continue
+            
+            article = self._build_article(element, source)
+            
+            # 처리한 항목과 앞선 형제 요소를 해제해 메모리 사용량을 항목 하나 수준으로 유지
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+            
+            if article is None:
+                continue
+            
+            published_at = article['published_at']
+            if stop_before is not None and published_at is not None and published_at <= stop_before:
+                old_entries += 1
+                if old_entries >= self.max_old_entries:
+                    break
+                continue
+            if published_at is None and stop_at_guid is not None and article['guid'] == stop_at_guid:
+                break
+            
+            old_entries = 0
+            yield article
+    
+    def _build_article(self, element, source: str) -> Optional[Dict]:
+        """항목 요소에서 기사 정보 추출 (RSSCollector와 같은 형태)"""
+        fields = {}
+        link = None
+        
+        for child in element:
+            if not isinstance(child.tag, str):
+                continue
+            name = self._local_name(child)
+            
+            if name == 'link':
+                # Atom은 href 속성, RSS는 본문 텍스트
+                href = child.get('href')
+                if href is not None:
+                    if child.get('rel', 'alternate') == 'alternate' and link is None:
+                        link = href
+                elif link is None:
+                    link = self._text(child)
+            elif name not in fields:
+                fields[name] = self._text(child)
+        
+        title = fields.get('title')
+        if not title or not link:
+            return None
+        
+        normalized_url = self.normalize_url(link)
+        summary = fields.get('description') or fields.get('summary') or fields.get('content') or ''
+        
+        return {
+            'url': normalized_url,
+            'title': title,
+            'snippet': summary[:500],  # 최대 500자
+            'source': source,
+            'guid': fields.get('guid') or fields.get('id') or normalized_url,
+            'published_at': self._parse_date(
+                fields.get('pubDate') or fields.get('published')
+                or fields.get('date') or fields.get('updated')
+            ),
+            'lang': 'ko'  # 기본값 (수집기가 정규화 텍스트로 언어를 감지해 갱신)
+        }
+    
+    def _local_name(self, element) -> str:
+        """네임스페이스를 제외한 태그 이름"""
+        tag = element.tag
+        if not isinstance(tag, str):
+            return ''
+        return tag.rsplit('}', 1)[-1]
+    
+    def _text(self, element) -> str:
+        """요소의 전체 텍스트"""
+        return ''.join(element.itertext()).strip()
+    
+    def _parse_date(self, value: Optional[str]) -> Optional[datetime]:
+        """RFC 822(RSS) 또는 ISO 8601(Atom) 날짜를 UTC datetime으로 변환"""
+        if not value:
+            return None
+        
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            try:
+                parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return None
+        
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
@@ -0,0 +1,110 @@
+"""RSS 소스별 수집 워터마크 (증분 수집)"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+
+class FeedWatermark:
+    """소스별 마지막 수집 지점(최신 항목 GUID, 발행 시각)을 기준으로 새 항목만 통과시키는 필터
+    
+    - 워터마크 이후에 발행된 항목은 새 항목
+    - 워터마크 직전 lookback 구간의 항목은 그 구간에서 이미 본 GUID가 아닐 때만 새 항목
+      (늦게 게시되거나 발행 시각이 수정된 항목 대응)
+    - 발행 시각이 없는 항목은 피드 순서상 마지막으로 본 GUID보다 앞에 있을 때만 새 항목
+    """
+    
+    def __init__(self, state: Optional[Dict] = None, lookback: timedelta = timedelta(hours=6)):
+        state = state or {}
+        self.lookback = lookback
+        self.last_entry_guid: Optional[str] = state.get('last_entry_guid')
+        self.last_published_at: Optional[datetime] = self._parse_timestamp(
+            state.get('last_published_at')
+        )
+        self.recent_guids = set(state.get('recent_guids') or [])
+    
+    @property
+    def cutoff(self) -> Optional[datetime]:
+        """이 시각 이전에 발행된 항목은 확인하지 않음"""
+        if self.last_published_at is None:
+            return None
+        return self.last_published_at - self.lookback
+    
+    def filter_new(self, articles: List[Dict]) -> List[Dict]:
+        """이미 수집한 항목을 제외한 새 항목 목록 (피드 순서 유지)"""
+        if self.last_published_at is None and self.last_entry_guid is None:
+            return list(articles)
+        
+        cutoff = self.cutoff
+        new_articles = []
+        reached_last_guid = False
+        
+        for article in articles:
+            guid = article.get('guid')
+            if guid is not None and guid == self.last_entry_guid:
+                reached_last_guid = True
+            
+            published_at = article.get('published_at')
+            if published_at is None or self.last_published_at is None:
+                is_new = not reached_last_guid and guid not in self.recent_guids
+            elif published_at > self.last_published_at:
+                is_new = True
+            elif published_at > cutoff:
+                is_new = guid not in self.recent_guids
+            else:
+                is_new = False
+            
+            if is_new:
+                new_articles.append(article)
+        
+        return new_articles
+    
+    def advance(self, articles: List[Dict]):
+        """이번 수집에서 본 항목으로 워터마크 갱신"""
+        if not articles:
+            return
+        
+        # 피드는 최신 항목이 먼저 오므로 첫 항목을 마지막으로 본 GUID로 기록
+        if articles[0].get('guid'):
+            self.last_entry_guid = articles[0]['guid']
+        
+        timestamps = [a['published_at'] for a in articles if a.get('published_at')]
+        if timestamps:
+            newest = max(timestamps)
+            if self.last_published_at is None or newest > self.last_published_at:
+                self.last_published_at = newest
+        
+        # lookback 구간 안의 GUID만 보관해 상태 크기를 피드 크기 이내로 제한
+        cutoff = self.cutoff
+        recent = set()
+        for article in articles:
+            guid = article.get('guid')
+            if not guid:
+                continue
+            published_at = article.get('published_at')
+            if published_at is None or cutoff is None or published_at > cutoff:
+                recent.add(guid)
+        self.recent_guids = recent
+    
+    def to_state(self) -> Dict:
+        """저장용 상태 dict (JSON 직렬화 가능)"""
+        return {
+            'last_entry_guid': self.last_entry_guid,
+            'last_published_at': (
+                self.last_published_at.isoformat() if self.last_published_at else None
+            ),
+            'recent_guids': sorted(self.recent_guids)
+        }
+    
+    def _parse_timestamp(self, value) -> Optional[datetime]:
+        """저장된 시각 값 파싱"""
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            timestamp = value
+        else:
+            try:
+                timestamp = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                return None
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp
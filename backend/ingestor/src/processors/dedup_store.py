@@ -0,0 +1,149 @@
+"""메모리 상한이 있는 중복 판별 저장소 (세대 교체형 Bloom 필터)"""
+import math
+import time
+from typing import Callable, Dict, List, Tuple
+
+
+KEY_MASK = (1 << 64) - 1
+
+
+def mix64(key: int) -> int:
+    """64비트 키 섞기 (splitmix64 마무리 단계)
+    
+    SimHash 지문처럼 비슷한 키끼리 비트가 몰려 있어도 Bloom 필터 위치가 고르게 퍼지도록 한다.
+    """
+    key = (key + 0x9E3779B97F4A7C15) & KEY_MASK
+    key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & KEY_MASK
+    key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & KEY_MASK
+    return key ^ (key >> 31)
+
+
+class BloomFilter:
+    """고정 크기 Bloom 필터 (64비트 정수 키)
+    
+    capacity개를 넣었을 때 오탐률이 error_rate가 되도록 비트 수와 해시 수를 정한다.
+    위치는 섞은 키의 상위/하위 32비트로 이중 해싱해 구한다.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.bit_count = max(
+            int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))),
+            8
+        )
+        self.hash_count = max(int(round(self.bit_count / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, key: int) -> List[int]:
+        """키가 차지하는 비트 위치"""
+        mixed = mix64(key)
+        first = mixed & 0xFFFFFFFF
+        step = (mixed >> 32) | 1
+        return [(first + i * step) % self.bit_count for i in range(self.hash_count)]
+    
+    def __contains__(self, key: int) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+    
+    def add(self, key: int):
+        """키 추가 (이미 있으면 개수를 늘리지 않음)"""
+        added = False
+        bits = self.bits
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+    
+    def false_positive_rate(self) -> float:
+        """현재 들어간 개수 기준 예상 오탐률"""
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_count)) ** self.hash_count
+    
+    @property
+    def memory_bytes(self) -> int:
+        """비트 배열 크기"""
+        return len(self.bits)
+
+
+class RotatingBloomFilter:
+    """시간 구간별 세대로 나눈 Bloom 필터
+    
+    새 키는 현재 세대에만 넣고, 조회는 남아 있는 모든 세대에서 한다.
+    현재 세대가 generation_seconds를 넘기거나 capacity개가 차면 새 세대를 열고
+    generations개를 넘는 가장 오래된 세대는 버린다.
+    따라서 최근 generations x generation_seconds 동안 본 키를 기억하며
+    메모리는 실행 시간과 무관하게 세대 수 x 세대 크기로 고정된다.
+    (용량이 먼저 차면 기억 기간이 그만큼 짧아지고 오탐률은 유지된다.)
+    """
+    
+    def __init__(
+        self,
+        generation_seconds: float = 86400,
+        generations: int = 2,
+        capacity: int = 100000,
+        error_rate: float = 0.001,
+        clock: Callable[[], float] = time.time
+    ):
+        self.generation_seconds = generation_seconds
+        self.generations = max(generations, 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.clock = clock
+        # (세대 시작 시각, 필터), 최신 세대가 마지막
+        self._filters: List[Tuple[float, BloomFilter]] = []
+        self.rotations = 0
+        self._open_generation(self.clock())
+    
+    def _open_generation(self, now: float):
+        """새 세대를 열고 오래된 세대 정리"""
+        self._filters.append((now, BloomFilter(self.capacity, self.error_rate)))
+        while len(self._filters) > self.generations:
+            self._filters.pop(0)
+    
+    def _rotate(self):
+        """현재 세대의 기간이 지났거나 가득 찼으면 새 세대 시작"""
+        now = self.clock()
+        started_at, current = self._filters[-1]
+        if now - started_at >= self.generation_seconds or current.count >= self.capacity:
+            self._open_generation(now)
+            self.rotations += 1
+    
+    def __contains__(self, key: int) -> bool:
+        self._rotate()
+        return any(key in bloom for _, bloom in reversed(self._filters))
+    
+    def add(self, key: int):
+        """현재 세대에 키 추가 (이전 세대에서 본 키도 다시 넣어 기억 기간을 늘림)"""
+        self._rotate()
+        current = self._filters[-1][1]
+        if key not in current:
+            current.add(key)
+    
+    def false_positive_rate(self) -> float:
+        """남아 있는 세대 전체의 예상 오탐률 (어느 한 세대라도 오탐이면 오탐)"""
+        miss = 1.0
+        for _, bloom in self._filters:
+            miss *= 1 - bloom.false_positive_rate()
+        return 1 - miss
+    
+    @property
+    def memory_bytes(self) -> int:
+        """남아 있는 세대의 비트 배열 크기 합"""
+        return sum(bloom.memory_bytes for _, bloom in self._filters)
+    
+    def stats(self) -> Dict:
+        """세대 수, 기억 중인 키 수(근사), 메모리 사용량, 예상 오탐률"""
+        return {
+            'generations': len(self._filters),
+            'items': sum(bloom.count for _, bloom in self._filters),
+            'memory_bytes': self.memory_bytes,
+            'false_positive_rate': self.false_positive_rate(),
+            'rotations': self.rotations
+        }
+    
+    def __len__(self) -> int:
+        return sum(bloom.count for _, bloom in self._filters)
@@ -1,52 +1,153 @@
 """중복 제거 프로세서"""
-from simhash import Simhash
-from typing import List, Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 import hashlib
 
+from processors.dedup_store import RotatingBloomFilter
+from processors.fast_simhash import SimhashFingerprinter, shingle_features
+from processors.simhash_index import SimhashIndex
+
 
 class Deduplicator:
     """기사 중복 제거 클래스"""
     
-    def __init__(self):
-        self.seen_urls = set()
-        self.seen_hashes = set()
+    def __init__(
+        self,
+        near_duplicate_index: Optional[SimhashIndex] = None,
+        seen_urls: Optional[RotatingBloomFilter] = None,
+        seen_hashes: Optional[RotatingBloomFilter] = None
+    ):
+        # 최근에 본 URL 해시/제목 SimHash (세대 교체형 Bloom 필터라 오래 실행해도 메모리 고정)
+        self.seen_urls = seen_urls if seen_urls is not None else RotatingBloomFilter()
+        self.seen_hashes = seen_hashes if seen_hashes is not None else RotatingBloomFilter()
+        # 주어지면 제목 SimHash가 k비트 이내인 기사까지 중복으로 판단
+        self.near_duplicate_index = near_duplicate_index
+        # simhash 패키지와 같은 지문을 배치 단위로 계산
+        self.fingerprinter = SimhashFingerprinter()
+        # 저장이 커밋될 때까지 기록을 미룬 새 기사 (URL -> (URL 키, 제목 SimHash))
+        self.pending: Dict[str, Tuple[int, int]] = {}
     
     def compute_simhash(self, text: str) -> int:
         """텍스트의 SimHash 계산"""
-        return Simhash(text).value
+        return self.fingerprinter.fingerprint(shingle_features(text))
+    
+    def title_features(self, article: Dict) -> Dict[str, int]:
+        """기사 제목의 SimHash 특징 (정규화 텍스트가 있으면 미리 만든 특징 사용)"""
+        normalized = article.get('normalized')
+        if normalized is not None:
+            return normalized.title_shingles
+        return shingle_features(article.get('title', ''))
+    
+    def compute_title_simhash(self, article: Dict) -> int:
+        """기사 제목의 SimHash 계산"""
+        return self.fingerprinter.fingerprint(self.title_features(article))
+    
+    def compute_title_simhashes(self, articles: List[Dict]) -> List[int]:
+        """기사 목록의 제목 SimHash 일괄 계산 (입력 순서 유지)"""
+        return self.fingerprinter.fingerprint_many(
+            [self.title_features(article) for article in articles]
+        )
     
     def compute_url_hash(self, url: str) -> str:
         """URL 해시 계산"""
         return hashlib.md5(url.encode()).hexdigest()
     
-    def is_duplicate(self, article: Dict) -> bool:
-        """기사가 중복인지 확인"""
+    def url_key(self, url: str) -> int:
+        """URL 해시의 상위 64비트 (중복 판별 저장소 키)"""
+        return int(self.compute_url_hash(url)[:16], 16)
+    
+    def is_duplicate(self, article: Dict, title_hash: Optional[int] = None) -> bool:
+        """기사가 중복인지 확인하고 새 기사면 바로 기록 (title_hash: 미리 계산한 제목 SimHash)"""
         url = article.get('url', '')
-        title = article.get('title', '')
-        
-        # URL 기반 중복 확인
-        url_hash = self.compute_url_hash(url)
-        if url_hash in self.seen_urls:
+        url_key = self.url_key(url)
+        if url_key in self.seen_urls:
+            # 계속 피드에 남아 있는 기사는 최근 세대로 다시 기록
+            self.seen_urls.add(url_key)
             return True
         
-        # 제목 기반 SimHash 중복 확인
-        title_hash = self.compute_simhash(title)
-        if title_hash in self.seen_hashes:
+        if title_hash is None:
+            title_hash = self.compute_title_simhash(article)
+        if self._is_seen_title(title_hash):
             return True
         
-        # 새로운 기사로 기록
-        self.seen_urls.add(url_hash)
-        self.seen_hashes.add(title_hash)
-        
+        self._record(url, url_key, title_hash)
         return False
     
-    def filter_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """중복 기사 필터링"""
+    def filter_duplicates(self, articles: List[Dict], defer: bool = False) -> List[Dict]:
+        """중복 기사 필터링 (제목 SimHash는 배치 전체를 한 번에 계산)
+        
+        defer면 새 기사를 바로 기록하지 않고 pending에 두었다가 commit()에서 기록한다.
+        (저장에 실패한 기사가 다음 실행에서 중복으로 걸러지거나
+        그 지문이 재시도 때 신디케이션 사본을 막지 않도록)
+        배치 안의 중복은 배치 전용 저장소로 판별한다.
+        """
+        title_hashes = self.compute_title_simhashes(articles)
+        if not defer:
+            return [
+                article for article, title_hash in zip(articles, title_hashes)
+                if not self.is_duplicate(article, title_hash)
+            ]
+        
+        self.pending = {}
+        batch_urls = set()
+        batch_hashes = set()
+        batch_index = (
+            SimhashIndex(self.near_duplicate_index.max_distance)
+            if self.near_duplicate_index is not None else None
+        )
         unique_articles = []
-        for article in articles:
-            if not self.is_duplicate(article):
-                unique_articles.append(article)
+        for article, title_hash in zip(articles, title_hashes):
+            url = article.get('url', '')
+            url_key = self.url_key(url)
+            if url_key in batch_urls or title_hash in batch_hashes:
+                continue
+            if url_key in self.seen_urls:
+                self.seen_urls.add(url_key)
+                continue
+            if self._is_seen_title(title_hash):
+                continue
+            if batch_index is not None:
+                if batch_index.find_near(title_hash) is not None:
+                    continue
+                batch_index.add(title_hash)
+            
+            batch_urls.add(url_key)
+            batch_hashes.add(title_hash)
+            self.pending[url] = (url_key, title_hash)
+            unique_articles.append(article)
         return unique_articles
-
-
-
+    
+    def commit(self, skip_urls: Iterable[str] = ()) -> int:
+        """보류한 새 기사를 중복 판별 저장소/근사 중복 인덱스에 기록하고 기록한 수 반환
+        
+        skip_urls: 저장하지 못해 다음 실행에서 다시 받아야 하는 기사 URL
+        """
+        skip_urls = set(skip_urls)
+        committed = 0
+        for url, (url_key, title_hash) in self.pending.items():
+            if url in skip_urls:
+                continue
+            self._record(url, url_key, title_hash)
+            committed += 1
+        self.pending = {}
+        return committed
+    
+    def _is_seen_title(self, title_hash: int) -> bool:
+        """기록된 제목과 같거나 (이전 실행/다른 소스 포함) 근사 중복인지"""
+        if title_hash in self.seen_hashes:
+            self.seen_hashes.add(title_hash)
+            return True
+        return (
+            self.near_duplicate_index is not None
+            and self.near_duplicate_index.find_near(title_hash) is not None
+        )
+    
+    def _record(self, url: str, url_key: int, title_hash: int):
+        """새 기사로 기록 (근사 중복 인덱스에는 영구 저장 대상으로 추가)"""
+        if self.near_duplicate_index is not None:
+            self.near_duplicate_index.add(title_hash, url)
+        self.seen_urls.add(url_key)
+        self.seen_hashes.add(title_hash)
+    
+    def stats(self) -> Dict[str, Dict]:
+        """URL/제목 중복 판별 저장소 통계"""
+        return {'urls': self.seen_urls.stats(), 'titles': self.seen_hashes.stats()}
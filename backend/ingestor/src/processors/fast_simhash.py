@@ -0,0 +1,129 @@
+"""SimHash 일괄 계산 (NumPy 비트 열 누적)
+
+simhash 패키지(Simhash(features).value)와 같은 64비트 지문을 만든다.
+- 특징(shingle)마다 md5 다이제스트의 마지막 8바이트를 비트 열로 사용
+- 비트별로 (비트 값 x 등장 횟수)를 더해 전체 가중치의 절반을 넘으면 1
+md5 기반이므로 프로세스/실행이 달라도 지문이 같다 (DB에 저장해도 안전).
+
+패키지 구현은 문서마다 다이제스트 바이트를 복제/결합해 비트 배열로 풀지만,
+여기서는 shingle마다 다이제스트를 한 번만 계산해 (shingle x 64) 비트 행렬에 쌓아 두고
+배치 전체의 문서별 가중 합을 reduceat으로 구한다.
+"""
+import hashlib
+import os
+import sys
+from itertools import chain
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+# 공통 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../shared'))
+from text_processing.normalized_text import shingle_features
+
+
+FINGERPRINT_BITS = 64
+FINGERPRINT_BYTES = FINGERPRINT_BITS // 8
+
+
+class SimhashFingerprinter:
+    """여러 문서의 SimHash를 한 번에 계산
+    
+    shingle별 비트 행은 호출 간에 유지된다 (크롤링 배치마다 같은 shingle이 반복됨).
+    등록된 shingle이 cache_size를 넘으면 비우고 다시 쌓는다.
+    """
+    
+    # 비트 합을 한 번에 계산하는 문서 수 (중간 행렬이 CPU 캐시에 들어가도록 제한)
+    CHUNK_SIZE = 256
+    
+    def __init__(self, cache_size: int = 200000):
+        self.cache_size = cache_size
+        self._reset()
+    
+    def _reset(self):
+        """등록된 shingle 비우기"""
+        # shingle -> 비트 행 번호
+        self._rows: Dict[str, int] = {}
+        # (등록된 shingle x 64) 비트 행렬 (상위 비트부터, 필요할 때 두 배로 늘림)
+        self._bits = np.zeros((1024, FINGERPRINT_BITS), dtype=np.uint8)
+    
+    def _register(self, feature_sets: Sequence[Dict[str, int]]):
+        """처음 보는 shingle의 md5 다이제스트(마지막 8바이트)를 비트 행으로 추가"""
+        new_shingles = set().union(*feature_sets).difference(self._rows)
+        if not new_shingles:
+            return
+        if len(self._rows) + len(new_shingles) > self.cache_size:
+            self._reset()
+            new_shingles = set().union(*feature_sets)
+        
+        new_shingles = list(new_shingles)
+        digests = b''.join(
+            hashlib.md5(shingle.encode('utf-8')).digest()[-FINGERPRINT_BYTES:]
+            for shingle in new_shingles
+        )
+        start = len(self._rows)
+        end = start + len(new_shingles)
+        if end > len(self._bits):
+            capacity = max(end, len(self._bits) * 2)
+            grown = np.zeros((capacity, FINGERPRINT_BITS), dtype=np.uint8)
+            grown[:start] = self._bits[:start]
+            self._bits = grown
+        self._bits[start:end] = np.unpackbits(
+            np.frombuffer(digests, dtype=np.uint8).reshape(-1, FINGERPRINT_BYTES),
+            axis=1
+        )
+        self._rows.update(zip(new_shingles, range(start, end)))
+    
+    def fingerprint_many(self, feature_sets: Sequence[Dict[str, int]]) -> List[int]:
+        """특징(shingle -> 등장 횟수) 목록의 SimHash 값 (입력 순서 유지)"""
+        count = len(feature_sets)
+        if not count:
+            return []
+        
+        # 특징이 없는 문서는 0 (자리만 채우고 결과를 덮어씀)
+        empty_rows = [row for row, features in enumerate(feature_sets) if not features]
+        if empty_rows:
+            feature_sets = [features or {'': 1} for features in feature_sets]
+        self._register(feature_sets)
+        
+        # 모든 문서의 특징을 이어 붙인 행 번호/가중치 배열과 문서별 시작 위치
+        lengths = np.fromiter(map(len, feature_sets), dtype=np.int64, count=count)
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        total = int(offsets[-1])
+        rows = np.fromiter(
+            map(self._rows.__getitem__, chain.from_iterable(feature_sets)),
+            dtype=np.int64,
+            count=total
+        )
+        weights = np.fromiter(
+            chain.from_iterable(features.values() for features in feature_sets),
+            dtype=np.int64,
+            count=total
+        )
+        
+        fingerprints = np.empty((count, FINGERPRINT_BYTES), dtype=np.uint8)
+        for first in range(0, count, self.CHUNK_SIZE):
+            last = min(first + self.CHUNK_SIZE, count)
+            start, end = offsets[first], offsets[last]
+            chunk_offsets = offsets[first:last] - start
+            # 문서별 비트 가중 합
+            chunk_weights = weights[start:end]
+            weighted = self._bits[rows[start:end]] * chunk_weights[:, None]
+            sums = np.add.reduceat(weighted, chunk_offsets, axis=0)
+            totals = np.add.reduceat(chunk_weights, chunk_offsets)
+            # 가중치 절반 초과 비트를 1로 (정수 비교: sum > total / 2)
+            fingerprints[first:last] = np.packbits(sums * 2 > totals[:, None], axis=1)
+        
+        values = fingerprints.view('>u8').ravel().tolist()
+        for row in empty_rows:
+            values[row] = 0
+        return values
+    
+    def fingerprint(self, features: Dict[str, int]) -> int:
+        """특징 하나의 SimHash 값"""
+        return self.fingerprint_many([features])[0]
+    
+    def fingerprint_texts(self, texts: Iterable[str]) -> List[int]:
+        """텍스트 목록의 SimHash 값 (Simhash(text).value와 같음)"""
+        return self.fingerprint_many([shingle_features(text) for text in texts])
@@ -0,0 +1,157 @@
+"""키워드 매칭 프로세서"""
+import os
+import sys
+from typing import Dict, List, Tuple
+
+# 공통 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../shared'))
+from text_processing.aho_corasick import AhoCorasickAutomaton
+
+
+# 키워드 뒤에 붙어도 독립된 단어로 보는 조사
+KOREAN_PARTICLES = {
+    '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '도', '로', '만',
+    '으로', '에서', '에게', '까지', '부터', '보다', '처럼', '이나', '라는', '이라는',
+    '께서', '한테', '마저', '조차', '에서는', '으로는', '에는', '과의', '와의'
+}
+
+# 영문 키워드 뒤에 붙어도 독립된 단어로 보는 복수형 어미 (startups, electric vehicles)
+# 소유격('s)은 아포스트로피가 단어 경계이므로 따로 두지 않음
+ENGLISH_PLURAL_SUFFIXES = {'s', 'es'}
+
+
+def normalize_keyword(keyword_text: str) -> str:
+    """키워드 매칭 형태 (같은 형태의 키워드는 하나의 패턴으로 매칭됨)"""
+    return keyword_text.strip().lower()
+
+
+class KeywordMatcher:
+    """활성 키워드 전체를 하나의 오토마톤으로 컴파일한 다중 키워드 매처
+    
+    기사마다 제목과 요약을 한 번만 소문자화하고 한 번만 훑어서
+    매칭된 모든 키워드 ID와 매칭 유형(exact/partial/synonym)을 반환한다.
+    수집기가 붙인 정규화 텍스트(article['normalized'])가 있으면 그 소문자 형태를 쓴다.
+    
+    단어 단위로 매칭되거나(한국어 조사, 영문 복수형 어미 허용) 영문 패턴 뒤에 한글이 붙은
+    합성어(AI반도체)면 exact, 그 밖에 다른 글자와 붙어 있으면(차세대반도체, OpenAI) partial이다.
+    
+    expander(KeywordIntentExpander)가 주어지면 키워드의 동의어/표기 변형도
+    같은 오토마톤에 패턴으로 컴파일한다. 동의어는 키워드 자체라면 exact였을 위치에서만
+    synonym으로 기록하므로 같은 텍스트에서 키워드 자체의 매칭보다 점수가 높아지지 않는다.
+    """
+    
+    EXACT_SCORE = 1.0
+    SYNONYM_SCORE = 0.7
+    PARTIAL_SCORE = 0.5
+    
+    def __init__(self, keywords: List[Tuple[str, str]], expander=None):
+        """keywords: (keyword_id, keyword_text) 목록"""
+        self.automaton = AhoCorasickAutomaton()
+        
+        # 같은 텍스트의 키워드는 하나의 패턴으로 묶음
+        keyword_ids_by_text: Dict[str, List[str]] = {}
+        for keyword_id, keyword_text in keywords:
+            normalized = normalize_keyword(keyword_text)
+            if not normalized:
+                continue
+            keyword_ids_by_text.setdefault(normalized, []).append(keyword_id)
+        
+        # 패턴 -> (키워드 자체로 등록한 ID, 동의어로 등록한 ID)
+        patterns: Dict[str, Tuple[List[str], List[str]]] = {}
+        for normalized, keyword_ids in keyword_ids_by_text.items():
+            patterns.setdefault(normalized, ([], []))[0].extend(keyword_ids)
+        
+        if expander is not None:
+            for normalized, keyword_ids in keyword_ids_by_text.items():
+                for synonym in expander.expand(normalized):
+                    patterns.setdefault(synonym, ([], []))[1].extend(keyword_ids)
+        
+        for pattern, (keyword_ids, synonym_ids) in patterns.items():
+            self.automaton.add(pattern, (pattern, keyword_ids, synonym_ids))
+        
+        self.automaton.build()
+        self.pattern_count = len(patterns)
+    
+    def match(self, article: Dict) -> Dict[str, Dict]:
+        """기사에 매칭된 키워드 조회
+        
+        반환값: {keyword_id: {'match_type': 'exact' | 'synonym' | 'partial', 'match_score': float}}
+        """
+        # 제목과 요약 사이를 개행으로 구분해 필드 경계를 넘는 매칭 방지
+        normalized = article.get('normalized')
+        if normalized is not None:
+            text = normalized.match_text
+        else:
+            text = f"{article['title']}\n{article.get('snippet', '')}".lower()
+        
+        matches: Dict[str, Dict] = {}
+        for start, end, (pattern, keyword_ids, synonym_ids) in self.automaton.iter_matches(text):
+            # 키워드와 동의어에 같은 경계 규칙 적용
+            word_match = (
+                self._is_word_match(text, start, end, pattern)
+                or self._is_compound_match(text, start, end, pattern)
+            )
+            
+            if keyword_ids:
+                if word_match:
+                    match = {'match_type': 'exact', 'match_score': self.EXACT_SCORE}
+                else:
+                    match = {'match_type': 'partial', 'match_score': self.PARTIAL_SCORE}
+                self._record(matches, keyword_ids, match)
+            
+            if synonym_ids and word_match:
+                self._record(
+                    matches,
+                    synonym_ids,
+                    {'match_type': 'synonym', 'match_score': self.SYNONYM_SCORE}
+                )
+        
+        return matches
+    
+    def _record(self, matches: Dict[str, Dict], keyword_ids: List[str], match: Dict):
+        """키워드별로 점수가 가장 높은 매칭만 유지"""
+        for keyword_id in keyword_ids:
+            current = matches.get(keyword_id)
+            if current is None or match['match_score'] > current['match_score']:
+                matches[keyword_id] = match
+    
+    def _is_compound_match(self, text: str, start: int, end: int, pattern: str) -> bool:
+        """영문 패턴 바로 뒤에 한글이 붙은 합성어인지 확인 (AI반도체, EV충전)"""
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        return (
+            end < len(text)
+            and pattern[-1].isascii()
+            and pattern[-1].isalnum()
+            and self._is_hangul(text[end])
+        )
+    
+    def _is_word_match(self, text: str, start: int, end: int, pattern: str) -> bool:
+        """매칭 위치가 단어 경계에 걸쳐 있는지 확인 (한국어 조사, 영문 복수형 어미 허용)"""
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        
+        if end >= len(text) or not text[end].isalnum():
+            return True
+        
+        word_end = end
+        while word_end < len(text) and text[word_end].isalnum():
+            word_end += 1
+        suffix = text[end:word_end]
+        
+        # 한글 키워드 뒤에 조사만 붙은 경우는 독립된 단어로 취급
+        if self._is_hangul(pattern[-1]):
+            return suffix in KOREAN_PARTICLES
+        # 영문 키워드의 복수형
+        if self._is_ascii_alnum(pattern[-1]):
+            return suffix in ENGLISH_PLURAL_SUFFIXES
+        
+        return False
+    
+    def _is_ascii_alnum(self, char: str) -> bool:
+        """영문/숫자 여부"""
+        return char.isascii() and char.isalnum()
+    
+    def _is_hangul(self, char: str) -> bool:
+        """한글 음절 여부"""
+        return '가' <= char <= '힣'
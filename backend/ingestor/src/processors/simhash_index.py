@@ -0,0 +1,185 @@
+"""SimHash 근사 중복 인덱스"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+
+SIMHASH_BITS = 64
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 해밍 거리"""
+    return bin(a ^ b).count('1')
+
+
+def to_signed64(value: int) -> int:
+    """부호 없는 64비트 지문을 BIGINT 저장용 부호 있는 값으로 변환"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def to_unsigned64(value: int) -> int:
+    """BIGINT로 저장된 값을 부호 없는 64비트 지문으로 변환"""
+    return value + (1 << 64) if value < 0 else value
+
+
+class SimhashIndex:
+    """해밍 거리 k 이내의 지문을 찾는 밴드 분할 SimHash 인덱스
+    
+    64비트를 k+1개 밴드로 나누면 거리 k 이내인 두 지문은 비둘기집 원리에 의해
+    적어도 하나의 밴드가 정확히 같다. 밴드별 해시 테이블에서 후보만 꺼내
+    거리를 확인하므로 전체 지문을 훑지 않는다.
+    
+    지문마다 기록 시각을 두고 evict_before()로 오래된 지문을 지운다
+    (장시간 실행되는 프로세스에서도 비교 기간만큼만 유지).
+    """
+    
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        band_count = max_distance + 1
+        
+        # 밴드별 (시프트, 마스크)
+        self.bands: List[Tuple[int, int]] = []
+        start = 0
+        for band in range(band_count):
+            width = SIMHASH_BITS // band_count + (1 if band < SIMHASH_BITS % band_count else 0)
+            self.bands.append((start, (1 << width) - 1))
+            start += width
+        
+        self.tables: List[Dict[int, Set[int]]] = [{} for _ in self.bands]
+        self.size = 0
+        # 지문별 기록 시각 (같은 지문이 다시 기록되면 최신 시각)
+        self.added_at: Dict[int, datetime] = {}
+        
+        # 영구 저장소에서 마지막으로 불러온 행 ID (증분 로드용)
+        self.loaded_until_id = 0
+        # 아직 저장되지 않은 새 지문 (지문, URL)
+        self.pending: List[Tuple[int, str]] = []
+    
+    def find_near(self, fingerprint: int) -> Optional[int]:
+        """거리 max_distance 이내의 기존 지문 조회"""
+        for table, (shift, mask) in zip(self.tables, self.bands):
+            candidates = table.get((fingerprint >> shift) & mask)
+            if not candidates:
+                continue
+            for candidate in candidates:
+                if hamming_distance(fingerprint, candidate) <= self.max_distance:
+                    return candidate
+        return None
+    
+    def add(
+        self,
+        fingerprint: int,
+        url: Optional[str] = None,
+        added_at: Optional[datetime] = None
+    ):
+        """지문 추가 (url이 주어지면 영구 저장 대상으로 기록, added_at 기본값은 현재 시각)"""
+        added = False
+        for table, (shift, mask) in zip(self.tables, self.bands):
+            bucket = table.setdefault((fingerprint >> shift) & mask, set())
+            if fingerprint not in bucket:
+                bucket.add(fingerprint)
+                added = True
+        
+        if added:
+            self.size += 1
+        added_at = added_at or datetime.now(timezone.utc)
+        if added or added_at > self.added_at[fingerprint]:
+            self.added_at[fingerprint] = added_at
+        if url is not None:
+            self.pending.append((fingerprint, url))
+    
+    def remove(self, fingerprint: int):
+        """지문 삭제 (없으면 무시)"""
+        if fingerprint not in self.added_at:
+            return
+        for table, (shift, mask) in zip(self.tables, self.bands):
+            band = (fingerprint >> shift) & mask
+            bucket = table.get(band)
+            if bucket is not None:
+                bucket.discard(fingerprint)
+                if not bucket:
+                    del table[band]
+        del self.added_at[fingerprint]
+        self.size -= 1
+    
+    def evict_before(self, cutoff: datetime) -> int:
+        """cutoff 이전에 기록된 지문을 지우고 지운 수 반환"""
+        expired = [
+            fingerprint for fingerprint, added_at in self.added_at.items() if added_at < cutoff
+        ]
+        for fingerprint in expired:
+            self.remove(fingerprint)
+        return len(expired)
+    
+    def drain_pending(self) -> List[Tuple[int, str]]:
+        """저장 대기 중인 지문을 꺼내고 비움"""
+        pending, self.pending = self.pending, []
+        return pending
+    
+    def __len__(self) -> int:
+        return self.size
+
+
+class DatabaseSimhashIndexStore:
+    """article_fingerprints 테이블 기반 SimHash 인덱스 저장소"""
+    
+    def __init__(self, db_conn, window_days: int = 7):
+        self.db_conn = db_conn
+        # 이 기간 안에 기록된 지문만 불러옴
+        self.window_days = window_days
+    
+    async def load(self, index: SimhashIndex, created_before: Optional[datetime] = None) -> int:
+        """인덱스에 아직 없는 지문만 증분으로 불러오고 불러온 수 반환
+        
+        불러오기 전에 비교 기간이 지난 지문을 인덱스에서 지운다.
+        created_before가 주어지면 그 시각 이전에 기록된 지문만 불러온다.
+        """
+        index.evict_before(datetime.now(timezone.utc) - timedelta(days=self.window_days))
+        
+        rows = await self.db_conn.fetch(
+            """
+            SELECT id, simhash, created_at
+            FROM article_fingerprints
+            WHERE id > $1
+              AND created_at > NOW() - make_interval(days => $2)
+              AND ($3::timestamptz IS NULL OR created_at < $3)
+            ORDER BY id
+            """,
+            index.loaded_until_id,
+            self.window_days,
+            created_before
+        )
+        
+        for row in rows:
+            index.add(to_unsigned64(row['simhash']), added_at=row['created_at'])
+        if rows:
+            index.loaded_until_id = rows[-1]['id']
+        
+        return len(rows)
+    
+    async def save(self, fingerprints: List[Tuple[int, str]]):
+        """새 지문 저장 (이미 지문이 저장된 URL은 건너뜀)
+        
+        라운드 중간 호출/일부 키워드 작업은 이전 호출이 저장한 지문을 인덱스에 불러오지 않으므로
+        같은 기사를 다시 기록할 수 있다.
+        """
+        if not fingerprints:
+            return
+        
+        await self.db_conn.executemany(
+            """
+            INSERT INTO article_fingerprints (simhash, url)
+            VALUES ($1, $2)
+            ON CONFLICT (url) DO NOTHING
+            """,
+            [(to_signed64(fingerprint), url) for fingerprint, url in fingerprints]
+        )
+    
+    async def prune(self) -> str:
+        """비교 기간이 지난 지문 삭제 (기간은 불러오기에만 쓰이므로 따로 지워야 테이블이 커지지 않음)"""
+        return await self.db_conn.execute(
+            """
+            DELETE FROM article_fingerprints
+            WHERE created_at < NOW() - make_interval(days => $1)
+            """,
+            self.window_days
+        )
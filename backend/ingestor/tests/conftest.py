@@ -0,0 +1,7 @@
+"""ingestor 테스트 공통 설정"""
+import os
+import sys
+
+# 서비스 모듈 경로 추가 (processors.*, intent.*)
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../nlp-service/src'))
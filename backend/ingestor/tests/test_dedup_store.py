@@ -0,0 +1,96 @@
+"""Bloom 필터 중복 판별 저장소 테스트"""
+import random
+
+import pytest
+
+from processors.dedup_store import BloomFilter, RotatingBloomFilter
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+def test_bloom_filter_has_no_false_negatives():
+    rng = random.Random(1)
+    bloom = BloomFilter(1000, 0.01)
+    keys = [rng.getrandbits(64) for _ in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    
+    assert all(key in bloom for key in keys)
+
+
+def test_bloom_filter_false_positive_rate_near_target():
+    rng = random.Random(2)
+    bloom = BloomFilter(5000, 0.01)
+    for _ in range(5000):
+        bloom.add(rng.getrandbits(64))
+    
+    false_positives = sum(rng.getrandbits(64) in bloom for _ in range(20000))
+    
+    assert false_positives / 20000 < 0.03
+    assert bloom.false_positive_rate() == pytest.approx(0.01, rel=0.5)
+
+
+def test_bloom_filter_counts_distinct_keys():
+    bloom = BloomFilter(10, 0.01)
+    bloom.add(1)
+    bloom.add(1)
+    
+    assert bloom.count == 1
+
+
+def test_rotating_filter_forgets_after_all_generations():
+    clock = FakeClock()
+    seen = RotatingBloomFilter(generation_seconds=60, generations=2, capacity=100, clock=clock)
+    seen.add(42)
+    
+    clock.now = 61
+    assert 42 in seen
+    assert seen.rotations == 1
+    
+    clock.now = 122
+    assert 42 not in seen
+    assert seen.stats()['generations'] == 2
+
+
+def test_rotating_filter_add_refreshes_old_key():
+    clock = FakeClock()
+    seen = RotatingBloomFilter(generation_seconds=60, generations=2, capacity=100, clock=clock)
+    seen.add(42)
+    
+    clock.now = 61
+    seen.add(42)
+    clock.now = 122
+    
+    assert 42 in seen
+
+
+def test_rotating_filter_rotates_when_full():
+    clock = FakeClock()
+    seen = RotatingBloomFilter(generation_seconds=3600, generations=3, capacity=10, clock=clock)
+    for key in range(25):
+        seen.add(key)
+    
+    stats = seen.stats()
+    assert stats['rotations'] == 2
+    assert stats['generations'] == 3
+    assert all(key in seen for key in range(25))
+
+
+def test_rotating_filter_memory_is_bounded():
+    clock = FakeClock()
+    seen = RotatingBloomFilter(generation_seconds=60, generations=2, capacity=100, clock=clock)
+    single = BloomFilter(100, seen.error_rate).memory_bytes
+    
+    for step in range(10):
+        clock.now = step * 60
+        for key in range(step * 100, step * 100 + 50):
+            seen.add(key)
+    
+    assert seen.memory_bytes == 2 * single
+    assert len(seen) == 100
@@ -0,0 +1,52 @@
+"""SimhashFingerprinter 일괄 계산 테스트 (simhash 패키지와 같은 지문인지)"""
+import pytest
+
+from processors.fast_simhash import SimhashFingerprinter, shingle_features
+
+
+TITLES = [
+    "삼성전자 실적 개선 기대감에 주가 상승",
+    "삼성전자 실적 개선 기대감에 주가 급등",
+    "[속보] AI 혁신 기술로 생산성 향상, 업계 최고 수준",
+    "NVIDIA shares hit record high on AI demand",
+    "가",
+    "",
+]
+
+
+def test_matches_simhash_package():
+    simhash = pytest.importorskip('simhash')
+    
+    fingerprints = SimhashFingerprinter().fingerprint_texts(TITLES)
+    
+    assert fingerprints == [simhash.Simhash(shingle_features(title)).value for title in TITLES]
+
+
+def test_matches_simhash_package_with_weights():
+    simhash = pytest.importorskip('simhash')
+    features = {'ab': 3, 'bc': 1, 'cd': 2}
+    
+    assert SimhashFingerprinter().fingerprint(features) == simhash.Simhash(features).value
+
+
+def test_batch_matches_single():
+    fingerprinter = SimhashFingerprinter()
+    
+    batch = fingerprinter.fingerprint_texts(TITLES)
+    
+    assert batch == [SimhashFingerprinter().fingerprint(shingle_features(title)) for title in TITLES]
+
+
+def test_empty_features_are_zero():
+    assert SimhashFingerprinter().fingerprint_many([{}, {'ab': 1}, {}])[0::2] == [0, 0]
+
+
+def test_chunks_and_cache_reset_do_not_change_result():
+    titles = [f"{title} {index}" for index in range(300) for title in TITLES[:2]]
+    expected = SimhashFingerprinter().fingerprint_texts(titles)
+    
+    # 청크 경계와 캐시 초기화가 여러 번 일어나도 같은 지문
+    fingerprinter = SimhashFingerprinter(cache_size=50)
+    fingerprinter.CHUNK_SIZE = 7
+    assert fingerprinter.fingerprint_texts(titles) == expected
+    assert fingerprinter.fingerprint_texts(titles) == expected
@@ -0,0 +1,42 @@
+"""FeedSnapshotCache 재사용/만료 테스트"""
+from collectors.feed_cache import FeedSnapshotCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_entry_is_fresh_until_max_age():
+    clock = FakeClock()
+    cache = FeedSnapshotCache(max_age_seconds=300, clock=clock)
+    cache.put('http://feed', [{'guid': 'a'}], etag='E1', last_modified='Thu, 01 Oct 2026 00:00:00 GMT')
+    
+    entry = cache.get('http://feed')
+    assert entry['articles'] == [{'guid': 'a'}]
+    assert entry['etag'] == 'E1'
+    assert cache.is_fresh(entry)
+    
+    clock.now = 300
+    assert not cache.is_fresh(entry)
+
+
+def test_touch_renews_entry_without_replacing_articles():
+    clock = FakeClock()
+    cache = FeedSnapshotCache(max_age_seconds=300, clock=clock)
+    cache.put('http://feed', [{'guid': 'a'}], etag='E1')
+    
+    clock.now = 500
+    cache.touch('http://feed')
+    
+    entry = cache.get('http://feed')
+    assert cache.is_fresh(entry)
+    assert entry['articles'] == [{'guid': 'a'}]
+    assert entry['etag'] == 'E1'
+
+
+def test_unknown_source_has_no_entry():
+    assert FeedSnapshotCache().get('http://missing') is None
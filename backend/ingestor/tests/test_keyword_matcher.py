@@ -0,0 +1,108 @@
+"""KeywordMatcher 매칭 유형/점수 테스트"""
+import pytest
+
+from intent.keyword_intent import KeywordIntentExpander
+from processors.keyword_matcher import KeywordMatcher
+
+
+def article(title, snippet=''):
+    return {'title': title, 'snippet': snippet}
+
+
+@pytest.fixture
+def expander():
+    return KeywordIntentExpander([['인공지능', 'AI']])
+
+
+def test_exact_word_match():
+    matcher = KeywordMatcher([('k1', 'AI')])
+    
+    assert matcher.match(article("AI 규제 법안 통과")) == {
+        'k1': {'match_type': 'exact', 'match_score': KeywordMatcher.EXACT_SCORE}
+    }
+
+
+def test_korean_particle_is_word_match():
+    matcher = KeywordMatcher([('k1', '반도체')])
+    
+    assert matcher.match(article("반도체가 수출을 이끌었다"))['k1']['match_type'] == 'exact'
+
+
+def test_korean_compound_is_partial():
+    matcher = KeywordMatcher([('k1', '반도체')])
+    
+    assert matcher.match(article("차세대반도체 공장 착공")) == {
+        'k1': {'match_type': 'partial', 'match_score': KeywordMatcher.PARTIAL_SCORE}
+    }
+
+
+@pytest.mark.parametrize('title', ["He said nothing", "OpenAI releases a model", "Email marketing"])
+def test_ascii_keyword_inside_english_word_is_partial(title):
+    matcher = KeywordMatcher([('k1', 'AI')])
+    
+    assert matcher.match(article(title)) == {
+        'k1': {'match_type': 'partial', 'match_score': KeywordMatcher.PARTIAL_SCORE}
+    }
+
+
+@pytest.mark.parametrize('keyword, title', [
+    ('startup', "Startups raise funds"),
+    ('electric vehicle', "Electric vehicles sell out"),
+    ('bus', "New buses arrive"),
+    ('Apple', "Apple's new phone"),
+])
+def test_english_plural_and_possessive_are_word_matches(keyword, title):
+    matcher = KeywordMatcher([('k1', keyword)])
+    
+    assert matcher.match(article(title))['k1']['match_type'] == 'exact'
+
+
+def test_synonym_accepts_english_plural():
+    matcher = KeywordMatcher([('k1', '전기차')], KeywordIntentExpander([['전기차', 'electric vehicle']]))
+    
+    assert matcher.match(article("Electric vehicles sell out"))['k1']['match_type'] == 'synonym'
+
+
+def test_ascii_keyword_before_hangul_is_compound_match():
+    matcher = KeywordMatcher([('k1', 'AI')])
+    
+    assert matcher.match(article("AI반도체 투자 확대"))['k1']['match_type'] == 'exact'
+
+
+def test_synonym_never_outscores_literal_keyword(expander):
+    matcher = KeywordMatcher([('literal', 'AI'), ('synonym', '인공지능')], expander)
+    
+    for title in ["AI반도체 투자 확대", "AI 규제", "삼성AI 공개", "OpenAI releases"]:
+        matches = matcher.match(article(title))
+        literal = matches.get('literal', {'match_score': 0})
+        synonym = matches.get('synonym', {'match_score': 0})
+        assert synonym['match_score'] <= literal['match_score'], title
+
+
+def test_synonym_requires_word_or_compound_match(expander):
+    matcher = KeywordMatcher([('k1', '인공지능')], expander)
+    
+    assert matcher.match(article("AI반도체 투자 확대")) == {
+        'k1': {'match_type': 'synonym', 'match_score': KeywordMatcher.SYNONYM_SCORE}
+    }
+    assert matcher.match(article("He said nothing")) == {}
+    assert matcher.match(article("삼성AI 공개")) == {}
+
+
+def test_literal_match_beats_synonym_for_same_keyword(expander):
+    matcher = KeywordMatcher([('k1', '인공지능')], expander)
+    
+    assert matcher.match(article("AI와 인공지능 정책"))['k1']['match_type'] == 'exact'
+
+
+def test_match_does_not_cross_title_and_snippet():
+    matcher = KeywordMatcher([('k1', '삼성 전자')])
+    
+    assert matcher.match(article("삼성", "전자 부품")) == {}
+
+
+def test_same_text_keywords_share_pattern():
+    matcher = KeywordMatcher([('k1', 'AI'), ('k2', ' ai ')])
+    
+    assert matcher.pattern_count == 1
+    assert set(matcher.match(article("AI 규제"))) == {'k1', 'k2'}
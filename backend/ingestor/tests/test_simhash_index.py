@@ -0,0 +1,99 @@
+"""SimhashIndex 밴드 분할 근사 중복 인덱스 테스트"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from processors.simhash_index import SimhashIndex, hamming_distance, to_signed64, to_unsigned64
+
+
+BASE = 0x0123456789ABCDEF
+NOW = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def flip(fingerprint, *bits):
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+@pytest.mark.parametrize('max_distance', [1, 3, 5])
+def test_bands_cover_all_bits(max_distance):
+    index = SimhashIndex(max_distance)
+    
+    assert len(index.bands) == max_distance + 1
+    assert sum(bin(mask).count('1') for _, mask in index.bands) == 64
+
+
+def test_finds_fingerprint_within_distance():
+    index = SimhashIndex(3)
+    index.add(BASE)
+    
+    # 서로 다른 밴드에 흩어진 비트가 바뀌어도 거리 3 이내면 찾음
+    near = flip(BASE, 0, 20, 63)
+    assert hamming_distance(BASE, near) == 3
+    assert index.find_near(near) == BASE
+
+
+def test_ignores_fingerprint_beyond_distance():
+    index = SimhashIndex(3)
+    index.add(BASE)
+    
+    assert index.find_near(flip(BASE, 0, 1, 2, 3)) is None
+
+
+def test_matches_brute_force():
+    import random
+    
+    rng = random.Random(7)
+    fingerprints = [rng.getrandbits(64) for _ in range(200)]
+    index = SimhashIndex(3)
+    for fingerprint in fingerprints:
+        index.add(fingerprint)
+    
+    for fingerprint in fingerprints[:50]:
+        query = flip(fingerprint, *rng.sample(range(64), rng.randint(0, 4)))
+        expected = any(hamming_distance(query, other) <= 3 for other in fingerprints)
+        assert (index.find_near(query) is not None) == expected
+
+
+def test_add_is_idempotent_and_remove():
+    index = SimhashIndex(3)
+    index.add(BASE)
+    index.add(BASE)
+    assert len(index) == 1
+    
+    index.remove(BASE)
+    index.remove(BASE)
+    assert len(index) == 0
+    assert index.find_near(BASE) is None
+    assert all(not table for table in index.tables)
+
+
+def test_evict_before_keeps_latest_time():
+    index = SimhashIndex(3)
+    old = flip(BASE, 10, 11, 12, 13, 14, 15, 16, 17)
+    index.add(BASE, added_at=NOW - timedelta(days=10))
+    index.add(old, added_at=NOW - timedelta(days=10))
+    # 다시 기록된 지문은 최신 시각 기준으로 남음
+    index.add(BASE, added_at=NOW)
+    
+    assert index.evict_before(NOW - timedelta(days=7)) == 1
+    assert index.find_near(BASE) == BASE
+    assert index.find_near(old) is None
+
+
+def test_pending_only_for_urls():
+    index = SimhashIndex(3)
+    index.add(BASE)
+    index.add(flip(BASE, 30), url='https://example.com/a')
+    
+    assert index.drain_pending() == [(flip(BASE, 30), 'https://example.com/a')]
+    assert index.drain_pending() == []
+
+
+@pytest.mark.parametrize('value', [0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1])
+def test_bigint_round_trip(value):
+    signed = to_signed64(value)
+    
+    assert -(1 << 63) <= signed < (1 << 63)
+    assert to_unsigned64(signed) == value
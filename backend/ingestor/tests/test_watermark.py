@@ -0,0 +1,87 @@
+"""FeedWatermark 증분 수집 필터 테스트"""
+from datetime import datetime, timedelta, timezone
+
+from collectors.watermark import FeedWatermark
+
+
+NOW = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def entry(guid, hours_ago=None):
+    return {
+        'guid': guid,
+        'published_at': NOW - timedelta(hours=hours_ago) if hours_ago is not None else None
+    }
+
+
+def guids(articles):
+    return [article['guid'] for article in articles]
+
+
+def test_empty_watermark_passes_everything():
+    articles = [entry('a', 1), entry('b', 100)]
+    
+    assert FeedWatermark().filter_new(articles) == articles
+
+
+def test_only_entries_after_watermark_are_new():
+    watermark = FeedWatermark()
+    watermark.advance([entry('b', 2), entry('c', 30)])
+    
+    new = watermark.filter_new([entry('a', 1), entry('b', 2), entry('c', 30)])
+    
+    assert guids(new) == ['a']
+
+
+def test_late_entry_within_lookback_is_new():
+    watermark = FeedWatermark(lookback=timedelta(hours=6))
+    watermark.advance([entry('b', 2), entry('c', 4)])
+    
+    # 워터마크(2시간 전)보다 먼저 발행되었지만 lookback 구간에서 처음 보는 항목
+    new = watermark.filter_new([entry('b', 2), entry('late', 3), entry('c', 4), entry('old', 10)])
+    
+    assert guids(new) == ['late']
+
+
+def test_entries_without_timestamp_use_last_guid():
+    watermark = FeedWatermark()
+    watermark.advance([entry('b'), entry('c')])
+    
+    new = watermark.filter_new([entry('a'), entry('b'), entry('c'), entry('d')])
+    
+    assert guids(new) == ['a']
+
+
+def test_advance_keeps_watermark_monotonic():
+    watermark = FeedWatermark()
+    watermark.advance([entry('b', 2)])
+    watermark.advance([entry('old', 5)])
+    
+    assert watermark.last_published_at == NOW - timedelta(hours=2)
+
+
+def test_recent_guids_limited_to_lookback():
+    watermark = FeedWatermark(lookback=timedelta(hours=6))
+    watermark.advance([entry('a', 1), entry('b', 5), entry('c', 10)])
+    
+    assert watermark.recent_guids == {'a', 'b'}
+
+
+def test_state_round_trip():
+    watermark = FeedWatermark()
+    watermark.advance([entry('a', 1), entry('b', 2)])
+    
+    restored = FeedWatermark(watermark.to_state())
+    
+    assert restored.last_entry_guid == 'a'
+    assert restored.last_published_at == watermark.last_published_at
+    assert restored.recent_guids == {'a', 'b'}
+    assert guids(restored.filter_new([entry('new', 0), entry('a', 1)])) == ['new']
+
+
+def test_naive_or_invalid_timestamp_in_state():
+    naive = FeedWatermark({'last_published_at': '2026-10-01T12:00:00'})
+    invalid = FeedWatermark({'last_published_at': 'not a timestamp'})
+    
+    assert naive.last_published_at == NOW
+    assert invalid.last_published_at is None
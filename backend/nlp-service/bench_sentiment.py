@@ -0,0 +1,141 @@
+"""감성 분석 벤치마크 스크립트
+
+컴파일된 사전(analyze), 일괄 분석(analyze_batch)과 기준 구현(analyze_reference)의
+결과가 같은지 확인하고 사전 크기별 처리 속도를 비교한다.
+
+사용법:
+    python bench_sentiment.py [--docs 2000] [--lexicon-sizes 40,1000,5000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# nlp-service 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from sentiment.rule_based import RuleBasedSentimentAnalyzer
+
+
+HANGUL_SYLLABLES = [chr(code) for code in range(0xAC00, 0xAC00 + 400)]
+
+SAMPLE_SENTENCES = [
+    "삼성전자 실적 개선 기대감에 주가 상승",
+    "신제품 출시 논란, 소비자 불안 확대",
+    "정부 규제 완화로 스타트업 성장 돌파구 마련",
+    "대규모 손실 우려에 투자 심리 위축",
+    "AI 혁신 기술로 생산성 향상, 업계 최고 수준",
+    "사기 의혹 제기된 업체 대표 조사 착수",
+    "경기 침체 위기 속 수출 감소세 지속",
+    "Apple unveils new product lineup with great success",
+]
+
+
+def random_word(rng: random.Random, min_len: int = 1, max_len: int = 4) -> str:
+    """임의의 한글 단어 생성"""
+    return ''.join(rng.choice(HANGUL_SYLLABLES) for _ in range(rng.randint(min_len, max_len)))
+
+
+def build_documents(rng: random.Random, analyzer: RuleBasedSentimentAnalyzer, count: int):
+    """실제 기사 문장과 사전 단어를 섞은 임의 문서 생성"""
+    vocabulary = (
+        list(analyzer.positive_words)
+        + list(analyzer.negative_words)
+        + analyzer.negation_words
+    )
+    # 일반 단어는 고정된 어휘에서 빈도 편향을 두고 선택 (실제 기사처럼 토큰이 반복됨)
+    filler = [random_word(rng) for _ in range(20000)]
+    filler_weights = [1 / (rank + 1) for rank in range(len(filler))]
+    documents = []
+    for _ in range(count):
+        words = []
+        for _ in range(rng.randint(20, 80)):
+            roll = rng.random()
+            if roll < 0.15:
+                # 사전 단어에 조사/접미어를 붙여 부분 포함 매칭을 유도
+                words.append(rng.choice(vocabulary) + random_word(rng, 0, 2))
+            elif roll < 0.25:
+                words.append(rng.choice(SAMPLE_SENTENCES))
+            else:
+                words.append(rng.choices(filler, filler_weights)[0])
+        title = rng.choice(SAMPLE_SENTENCES) + " " + random_word(rng)
+        documents.append((title, ' '.join(words)))
+    return documents
+
+
+def grow_lexicon(rng: random.Random, analyzer: RuleBasedSentimentAnalyzer, size: int):
+    """긍정/부정 사전을 합계 size개가 되도록 임의 단어로 확장"""
+    while len(analyzer.positive_words) + len(analyzer.negative_words) < size:
+        word = random_word(rng, 2, 4)
+        target = analyzer.positive_words if rng.random() < 0.5 else analyzer.negative_words
+        if word not in analyzer.positive_words and word not in analyzer.negative_words:
+            target[word] = round(rng.uniform(1.0, 2.0), 1)
+    analyzer.compile_lexicon()
+
+
+def measure(func, documents) -> float:
+    """문서 전체 분석 소요 시간(초)"""
+    started = time.perf_counter()
+    for title, content in documents:
+        func(title, content)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감성 분석 사전 컴파일 벤치마크")
+    parser.add_argument('--docs', type=int, default=2000, help="분석할 문서 수")
+    parser.add_argument(
+        '--lexicon-sizes',
+        default='40,1000,5000',
+        help="비교할 긍정+부정 사전 크기 (쉼표 구분)"
+    )
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    sizes = [int(size) for size in args.lexicon_sizes.split(',')]
+    
+    print(f"문서 수: {args.docs}")
+    print(
+        f"{'사전 크기':>10} {'기준(초)':>10} {'컴파일(초)':>12} {'배속':>8} "
+        f"{'일괄(초)':>10} {'배속':>8}  일치"
+    )
+    
+    analyzer = RuleBasedSentimentAnalyzer()
+    for size in sizes:
+        grow_lexicon(rng, analyzer, size)
+        documents = build_documents(rng, analyzer, args.docs)
+        
+        # 결과 일치 확인 (라벨/점수/근거 토큰 모두)
+        mismatches = 0
+        for title, content in documents:
+            if analyzer.analyze(title, content) != analyzer.analyze_reference(title, content):
+                mismatches += 1
+        batch_results = analyzer.analyze_batch(documents)
+        mismatches += sum(
+            1 for (title, content), result in zip(documents, batch_results)
+            if result != analyzer.analyze(title, content)
+        )
+        
+        # 토큰 사전이 채워진 상태(장시간 실행되는 워커)에서 측정
+        reference_time = measure(analyzer.analyze_reference, documents)
+        compiled_time = measure(analyzer.analyze, documents)
+        started = time.perf_counter()
+        analyzer.analyze_batch(documents)
+        batch_time = time.perf_counter() - started
+        
+        speedup = reference_time / compiled_time if compiled_time else float('inf')
+        batch_speedup = reference_time / batch_time if batch_time else float('inf')
+        parity = "OK" if mismatches == 0 else f"불일치 {mismatches}건"
+        print(
+            f"{len(analyzer.positive_words) + len(analyzer.negative_words):>10} "
+            f"{reference_time:>10.3f} {compiled_time:>12.3f} {speedup:>7.1f}x "
+            f"{batch_time:>10.3f} {batch_speedup:>7.1f}x  {parity}"
+        )
+        
+        if mismatches:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
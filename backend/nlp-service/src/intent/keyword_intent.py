@@ -0,0 +1,99 @@
+"""키워드 의도 확장 (동의어/표기 변형)"""
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+
+# 같은 대상을 가리키는 표현 묶음 (한국어/영어 표기 포함)
+DEFAULT_SYNONYM_GROUPS: List[List[str]] = [
+    ['인공지능', 'AI', 'A.I.', 'artificial intelligence'],
+    ['생성형 AI', '생성형 인공지능', 'generative AI'],
+    ['챗GPT', '챗지피티', 'ChatGPT'],
+    ['반도체', 'semiconductor'],
+    ['전기차', '전기자동차', 'EV', 'electric vehicle'],
+    ['자율주행', 'autonomous driving', 'self-driving'],
+    ['메타버스', 'metaverse'],
+    ['블록체인', 'blockchain'],
+    ['가상화폐', '암호화폐', '가상자산', 'cryptocurrency'],
+    ['대체불가토큰', 'NFT'],
+    ['빅데이터', 'big data'],
+    ['클라우드', 'cloud'],
+    ['스타트업', 'startup'],
+    ['코로나19', '코로나바이러스', 'COVID-19'],
+    ['삼성전자', 'Samsung Electronics'],
+    ['애플', 'Apple'],
+    ['구글', 'Google'],
+    ['테슬라', 'Tesla'],
+    ['엔비디아', 'NVIDIA'],
+    ['마이크로소프트', 'Microsoft'],
+]
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class KeywordIntentExpander:
+    """키워드를 미리 계산된 동의어/표기 변형 집합으로 확장
+    
+    - 동의어: 같은 묶음에 속한 다른 표현 (인공지능 <-> AI)
+    - 표기 변형: 띄어쓰기 유무, 하이픈 유무 (삼성 전자 <-> 삼성전자, e-sports <-> esports)
+    
+    확장 결과는 키워드별로 캐시되므로 매처를 만들 때 한 번만 계산된다.
+    모든 표현은 매처와 같은 형태(소문자, 공백 한 칸)로 정규화된다.
+    """
+    
+    def __init__(self, synonym_groups: Optional[Iterable[Iterable[str]]] = None):
+        # 표현 -> 같은 묶음의 표현 전체
+        self.synonyms: Dict[str, Set[str]] = {}
+        # 키워드 -> 확장 결과
+        self._cache: Dict[str, FrozenSet[str]] = {}
+        for group in (DEFAULT_SYNONYM_GROUPS if synonym_groups is None else synonym_groups):
+            self.add_group(group)
+    
+    def add_group(self, terms: Iterable[str]):
+        """동의어 묶음 추가 (기존 묶음과 겹치면 합침)"""
+        merged: Set[str] = set()
+        for term in terms:
+            normalized = self.normalize(term)
+            if normalized:
+                merged.add(normalized)
+                merged |= self.synonyms.get(normalized, set())
+        
+        for term in merged:
+            self.synonyms[term] = merged
+        self._cache.clear()
+    
+    def normalize(self, term: str) -> str:
+        """매칭 형태로 정규화 (소문자, 연속 공백 한 칸)"""
+        return WHITESPACE_PATTERN.sub(' ', term).strip().lower()
+    
+    def variants(self, term: str) -> Set[str]:
+        """표기 변형 (정규화된 표현 기준, 자기 자신 포함)"""
+        forms = {term}
+        if '-' in term:
+            forms.add(term.replace('-', ' '))
+            forms.add(term.replace('-', ''))
+        if ' ' in term:
+            forms.add(term.replace(' ', ''))
+            # 하이픈 표기는 영문 표현에서만 쓰임 (self driving -> self-driving)
+            if term.isascii():
+                forms.add(term.replace(' ', '-'))
+        return forms
+    
+    def expand(self, keyword: str) -> FrozenSet[str]:
+        """키워드의 동의어/표기 변형 (키워드 자신은 제외)"""
+        normalized = self.normalize(keyword)
+        cached = self._cache.get(normalized)
+        if cached is not None:
+            return cached
+        
+        # 표기 변형으로도 동의어 묶음을 찾음 (삼성 전자 -> 삼성전자 묶음)
+        terms = self.variants(normalized)
+        for variant in list(terms):
+            terms |= self.synonyms.get(variant, set())
+        expanded: Set[str] = set()
+        for term in terms:
+            expanded |= self.variants(term)
+        # 한 글자 표현은 오탐이 많아 제외
+        result = frozenset(term for term in expanded if term != normalized and len(term) >= 2)
+        
+        self._cache[normalized] = result
+        return result
@@ -0,0 +1,90 @@
+"""내용 주소 기반 감성 분석 결과 캐시"""
+import json
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class SentimentCache:
+    """(내용 해시, 모델 버전) -> 분석 결과 LRU 캐시
+    
+    통신사 기사처럼 제목/요약이 같은 기사가 여러 URL로 들어오면
+    분석기를 다시 호출하지 않고 같은 결과를 재사용한다.
+    내용 해시는 전처리된 제목/요약의 해시(compute_content_hash)이므로
+    분석 결과는 해시와 모델 버전만으로 결정된다.
+    """
+    
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._entries: 'OrderedDict[Tuple[str, str], Dict]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, content_hash: str, model_version: str) -> Optional[Dict]:
+        """캐시된 결과 조회 (적중/실패 횟수 기록)"""
+        key = (content_hash, model_version)
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+    
+    def put(self, content_hash: str, model_version: str, result: Dict):
+        """결과 저장 (최대 크기를 넘으면 가장 오래 사용되지 않은 항목 제거)"""
+        if self.max_size <= 0:
+            return
+        
+        key = (content_hash, model_version)
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def stats(self) -> Dict[str, int]:
+        """캐시 크기와 적중/실패 횟수"""
+        return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DatabaseSentimentLookup:
+    """sentiments 테이블에서 같은 내용 해시/모델 버전의 기존 분석 결과 조회"""
+    
+    def __init__(self, db_conn):
+        self.db_conn = db_conn
+    
+    async def load(self, content_hashes: Iterable[str], model_version: str) -> Dict[str, Dict]:
+        """내용 해시별 기존 분석 결과 (단일 ANY 쿼리)"""
+        content_hashes = list(set(content_hashes))
+        if not content_hashes:
+            return {}
+        
+        rows = await self.db_conn.fetch(
+            """
+            SELECT DISTINCT ON (content_hash) content_hash, label, score, rationale
+            FROM sentiments
+            WHERE content_hash = ANY($1::text[]) AND model_ver = $2
+            ORDER BY content_hash, updated_at DESC
+            """,
+            content_hashes,
+            model_version
+        )
+        return {
+            row['content_hash']: {
+                'label': row['label'],
+                'score': row['score'],
+                'rationale': self._to_dict(row['rationale'])
+            }
+            for row in rows
+        }
+    
+    def _to_dict(self, value) -> Dict:
+        """JSONB 컬럼 값(문자열로 반환됨)을 dict로 변환"""
+        if value is None:
+            return {}
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
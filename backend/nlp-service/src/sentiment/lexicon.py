@@ -0,0 +1,188 @@
+"""컴파일된 감성 사전 (단일 패스 점수 계산)"""
+import os
+import sys
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# 공통 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../shared'))
+from text_processing.aho_corasick import AhoCorasickAutomaton
+
+
+POSITIVE = 0
+NEGATIVE = 1
+NEGATION = 2
+
+
+class CompiledLexicon:
+    """긍정/부정 사전과 부정어를 하나의 오토마톤으로 컴파일한 채점 엔진
+    
+    RuleBasedSentimentAnalyzer의 규칙을 그대로 따른다.
+    - 토큰마다 사전 순서상 처음으로 포함된 긍정/부정 단어 하나씩만 점수에 반영
+    - 근거 토큰은 텍스트에 포함된 사전 단어를 가중치 내림차순으로 나열
+    - 부정어가 하나라도 포함되면 부정문
+    
+    토큰별 결과는 캐시되므로 반복되는 토큰은 오토마톤도 다시 훑지 않는다.
+    사전 크기와 무관하게 비용은 텍스트 길이에 비례한다.
+    """
+    
+    def __init__(
+        self,
+        positive_words: Dict[str, float],
+        negative_words: Dict[str, float],
+        negation_words: List[str],
+        token_cache_size: int = 100000
+    ):
+        self.automaton = AhoCorasickAutomaton()
+        # 항목 ID -> (종류, 단어, 가중치, 사전 내 순서)
+        self.entries: List[Tuple[int, str, float, int]] = []
+        # 공백이 들어간 항목은 토큰 안에서 매칭될 수 없으므로 전체 텍스트에서 따로 확인
+        self.spaced_entries: List[int] = []
+        # 빈 문자열 항목은 모든 텍스트에 포함된 것으로 취급 (기존 `in` 연산과 동일)
+        self.empty_entries: FrozenSet[int] = frozenset()
+        
+        for kind, words in (
+            (POSITIVE, list(positive_words.items())),
+            (NEGATIVE, list(negative_words.items())),
+            (NEGATION, [(word, 0.0) for word in negation_words])
+        ):
+            for order, (word, weight) in enumerate(words):
+                entry_id = len(self.entries)
+                self.entries.append((kind, word, weight, order))
+                if not word:
+                    self.empty_entries = self.empty_entries | {entry_id}
+                elif any(char.isspace() for char in word):
+                    self.spaced_entries.append(entry_id)
+                else:
+                    self.automaton.add(word, entry_id)
+        self.automaton.build()
+        
+        self.negation_entries: FrozenSet[int] = frozenset(
+            entry_id for entry_id, entry in enumerate(self.entries) if entry[0] == NEGATION
+        )
+        
+        # 근거 토큰 출력 순서: 긍정(가중치 내림차순, 동률은 사전 순서) 다음 부정
+        self.rationale_rank: Dict[int, int] = {}
+        for kind in (POSITIVE, NEGATIVE):
+            ids = [i for i, entry in enumerate(self.entries) if entry[0] == kind]
+            for entry_id in sorted(ids, key=lambda i: -self.entries[i][2]):
+                self.rationale_rank[entry_id] = len(self.rationale_rank)
+        
+        # 토큰 사전: 한 번 조회한 토큰은 ID로 결과를 재사용 (일괄 분석 시 배열 인덱스)
+        self.token_cache_size = token_cache_size
+        self.token_generation = 0
+        self._token_ids: Dict[str, int] = {}
+        self.token_results: List[Tuple[Optional[float], Optional[float], FrozenSet[int]]] = []
+    
+    def scan_token(self, token: str) -> Tuple[Optional[float], Optional[float], FrozenSet[int]]:
+        """토큰 하나의 (긍정 가중치, 부정 가중치, 포함된 항목 ID 집합)"""
+        token_id = self._token_ids.get(token)
+        if token_id is None:
+            if len(self.token_results) >= self.token_cache_size:
+                self._reset_tokens()
+            token_id = self._add_token(token)
+        return self.token_results[token_id]
+    
+    def token_ids(self, tokens: List[str]) -> List[int]:
+        """토큰 목록을 토큰 사전 ID로 변환 (처음 보는 토큰만 오토마톤으로 조회)
+        
+        반환된 ID는 다음 호출 전까지 token_results의 인덱스로 유효하다.
+        한 번의 호출 안에서는 토큰 사전을 비우지 않으므로 크기 제한을 잠시 넘을 수 있다.
+        """
+        if len(self.token_results) >= self.token_cache_size:
+            self._reset_tokens()
+        
+        ids = list(map(self._token_ids.get, tokens))
+        if None in ids:
+            for position, token_id in enumerate(ids):
+                if token_id is None:
+                    token = tokens[position]
+                    token_id = self._token_ids.get(token)
+                    ids[position] = token_id if token_id is not None else self._add_token(token)
+        return ids
+    
+    def _add_token(self, token: str) -> int:
+        """토큰을 오토마톤으로 조회해 토큰 사전에 추가"""
+        found = self.empty_entries | frozenset(
+            entry_id for _, _, entry_id in self.automaton.iter_matches(token)
+        )
+        
+        first = {POSITIVE: None, NEGATIVE: None}
+        for entry_id in found:
+            kind, _, weight, order = self.entries[entry_id]
+            if kind == NEGATION:
+                continue
+            current = first[kind]
+            if current is None or order < self.entries[current][3]:
+                first[kind] = entry_id
+        
+        token_id = len(self.token_results)
+        self._token_ids[token] = token_id
+        self.token_results.append((
+            self.entries[first[POSITIVE]][2] if first[POSITIVE] is not None else None,
+            self.entries[first[NEGATIVE]][2] if first[NEGATIVE] is not None else None,
+            found
+        ))
+        return token_id
+    
+    def _reset_tokens(self):
+        """토큰 사전 비우기 (기존 토큰 ID는 무효가 됨)"""
+        self._token_ids = {}
+        self.token_results = []
+        self.token_generation += 1
+    
+    def score(self, tokens: List[str], found: set) -> float:
+        """소문자화된 토큰 목록의 감성 점수 (포함된 항목 ID는 found에 누적)"""
+        score = 0.0
+        for token in tokens:
+            positive, negative, token_found = self.scan_token(token)
+            if positive is not None:
+                score += positive
+            if negative is not None:
+                score -= negative
+            found |= token_found
+        return score
+    
+    def scan(self, title: str, content: str) -> Tuple[float, float, bool, set]:
+        """전처리된 제목/본문을 한 번 훑어 (제목 점수, 본문 점수, 부정문 여부, 포함 항목) 반환"""
+        title_lower = title.lower()
+        content_lower = content.lower()
+        return self.scan_lower(
+            title_lower,
+            content_lower,
+            title_lower.split(),
+            content_lower.split()
+        )
+    
+    def scan_lower(
+        self,
+        title_lower: str,
+        content_lower: str,
+        title_tokens: List[str],
+        content_tokens: List[str]
+    ) -> Tuple[float, float, bool, set]:
+        """이미 소문자화/토큰화된 제목과 본문으로 scan 수행"""
+        found = set(self.empty_entries)
+        title_score = self.score(title_tokens, found)
+        content_score = self.score(content_tokens, found)
+        
+        if self.spaced_entries:
+            text = f"{title_lower} {content_lower}"
+            for entry_id in self.spaced_entries:
+                if self.entries[entry_id][1] in text:
+                    found.add(entry_id)
+        
+        negated = not found.isdisjoint(self.negation_entries)
+        return title_score, content_score, negated, found
+    
+    def rationale_tokens(self, found: set, top_n: int = 5) -> List[str]:
+        """포함된 항목을 근거 토큰 형식(+단어/-단어)으로 정렬"""
+        if not found:
+            return []
+        ranked = sorted(
+            (entry_id for entry_id in found if entry_id in self.rationale_rank),
+            key=self.rationale_rank.__getitem__
+        )
+        return [
+            f"{'+' if self.entries[entry_id][0] == POSITIVE else '-'}{self.entries[entry_id][1]}"
+            for entry_id in ranked[:top_n]
+        ]
@@ -0,0 +1,53 @@
+"""언어별 감성 분석기 레지스트리"""
+from typing import Dict, Iterable, List, Optional
+
+from sentiment.rule_based import RuleBasedSentimentAnalyzer
+
+
+# 분석기가 없는 언어의 기사에 저장하는 감성 행의 모델 버전
+# (조회 API가 sentiments와 INNER JOIN하므로 행이 없으면 기사가 피드/통계/알림에 나오지 않음)
+UNSUPPORTED_MODEL_VERSION = 'unsupported'
+
+
+def unsupported_sentiment(lang: Optional[str]) -> Dict:
+    """분석기가 없는 언어의 기사에 저장할 중립 감성 결과"""
+    return {
+        'label': 'neutral',
+        'score': 0.5,
+        'rationale': {
+            'tokens': [],
+            'unsupported_language': lang
+        }
+    }
+
+
+class SentimentAnalyzerRegistry:
+    """언어 코드 -> 감성 분석기 매핑
+    
+    분석기가 없는 언어의 기사는 감성 분석을 건너뛰고 unsupported_sentiment()의 중립 결과를 저장한다
+    (한국어 사전으로 영어 기사를 채점하는 낭비 방지, 나중에 분석기를 등록하면 모델 버전이 달라 재분석됨).
+    """
+    
+    def __init__(self, analyzers: Iterable = ()):
+        self.analyzers: Dict[str, object] = {}
+        for analyzer in analyzers:
+            self.register(analyzer)
+    
+    @classmethod
+    def default(cls) -> 'SentimentAnalyzerRegistry':
+        """기본 분석기 구성 (한국어 규칙 기반)"""
+        return cls([RuleBasedSentimentAnalyzer()])
+    
+    def register(self, analyzer, languages: Optional[List[str]] = None):
+        """분석기 등록 (languages가 없으면 분석기의 languages 속성 사용)"""
+        for lang in languages or analyzer.languages:
+            self.analyzers[lang] = analyzer
+    
+    def get(self, lang: Optional[str]):
+        """언어의 분석기 (없으면 None)"""
+        return self.analyzers.get(lang)
+    
+    @property
+    def languages(self) -> List[str]:
+        """분석기가 등록된 언어 코드"""
+        return list(self.analyzers)
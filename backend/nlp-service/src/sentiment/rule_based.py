@@ -1,11 +1,27 @@
 """규칙 기반 감성 분석기"""
 from typing import Dict, List, Tuple
-import re
+import hashlib
+import math
+
+from sentiment.lexicon import CompiledLexicon
+from text_processing.normalized_text import NormalizedText, clean_text
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
 
 
 class RuleBasedSentimentAnalyzer:
     """규칙 기반 감성 분석 클래스"""
     
+    # sentiments.model_ver에 기록되는 모델 버전
+    model_version = 'rule-based-v1'
+    # 분석 대상 언어 (사전이 한국어 단어로만 구성됨)
+    languages = ('ko',)
+    
     def __init__(self):
         # 긍정 단어 사전 (가중치 포함)
         self.positive_words = {
@@ -25,17 +41,198 @@ class RuleBasedSentimentAnalyzer:
         
         # 부정어
         self.negation_words = ['안', '않', '못', '없', '비', '불', '미']
+        
+        self.compile_lexicon()
+    
+    def compile_lexicon(self):
+        """감성 사전 컴파일 (사전을 바꾼 뒤에는 다시 호출)"""
+        self.lexicon = CompiledLexicon(
+            self.positive_words,
+            self.negative_words,
+            self.negation_words
+        )
+        # 일괄 분석용 토큰 사전 배열 (토큰 사전 세대, 토큰 수, 배열)
+        self._token_array_cache = None
     
     def preprocess(self, text: str) -> str:
-        """텍스트 전처리"""
-        # 이모지 제거
-        text = re.sub(r'[^\w\s가-힣]', ' ', text)
-        # 연속 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        """텍스트 전처리 (이모지 제거, 연속 공백 제거)"""
+        return clean_text(text)
+    
+    def compute_content_hash(self, title: str, content: str = "") -> str:
+        """분석 입력(전처리된 제목/본문)의 해시 - 같은 입력이면 결과도 같음"""
+        return self._hash_cleaned(self.preprocess(title), self.preprocess(content))
+    
+    def compute_normalized_hash(self, text: NormalizedText) -> str:
+        """정규화된 기사 텍스트의 compute_content_hash (전처리 결과 재사용)"""
+        return self._hash_cleaned(text.clean_title, text.clean_snippet)
+    
+    def _hash_cleaned(self, title: str, content: str) -> str:
+        """전처리된 제목/본문의 해시"""
+        return hashlib.sha256(f"{title}\n{content}".encode('utf-8')).hexdigest()
     
     def analyze(self, title: str, content: str = "") -> Dict:
-        """감성 분석 수행"""
+        """감성 분석 수행 (컴파일된 사전으로 텍스트를 한 번만 훑음)"""
+        title = self.preprocess(title)
+        content = self.preprocess(content)
+        
+        title_score, content_score, negated, found = self.lexicon.scan(title, content)
+        
+        return self._build_result(
+            title_score * 1.5,  # 제목 가중치 (1.5배)
+            content_score,
+            negated,
+            self.lexicon.rationale_tokens(found)
+        )
+    
+    def analyze_normalized(self, text: NormalizedText) -> Dict:
+        """정규화된 기사 텍스트 감성 분석 (전처리/소문자화/토큰화 결과 재사용)
+        
+        결과는 analyze(text.title, text.snippet)와 같다.
+        """
+        title_score, content_score, negated, found = self.lexicon.scan_lower(
+            text.title_lower,
+            text.snippet_lower,
+            text.title_tokens,
+            text.snippet_tokens
+        )
+        
+        return self._build_result(
+            title_score * 1.5,  # 제목 가중치 (1.5배)
+            content_score,
+            negated,
+            self.lexicon.rationale_tokens(found)
+        )
+    
+    def analyze_batch(self, articles: List[Tuple[str, str]]) -> List[Dict]:
+        """여러 기사 일괄 감성 분석 (기사별 결과는 analyze와 동일)
+        
+        토큰을 배치 내 ID로 바꾼 뒤 제목/본문 점수 합산, 부정문 보정,
+        정규화, 레이블 결정을 NumPy 배열 연산으로 한 번에 처리한다.
+        NumPy가 없으면 analyze를 반복 호출한다.
+        """
+        if not NUMPY_AVAILABLE or not articles:
+            return [self.analyze(title, content) for title, content in articles]
+        
+        lexicon = self.lexicon
+        count = len(articles)
+        
+        texts = [
+            (self.preprocess(title).lower(), self.preprocess(content).lower())
+            for title, content in articles
+        ]
+        
+        # 점수 칸: 제목은 i, 본문은 count + i
+        # (전처리로 공백이 한 칸씩만 남으므로 토큰 수는 공백 수 + 1)
+        ordered = [title for title, _ in texts] + [content for _, content in texts]
+        bins = np.repeat(
+            np.arange(count * 2),
+            np.fromiter((text.count(' ') + 1 if text else 0 for text in ordered), dtype=np.intp, count=count * 2)
+        )
+        
+        # 토큰 -> 토큰 사전 ID (처음 보는 토큰만 사전 조회)
+        occurrences = np.asarray(lexicon.token_ids(' '.join(ordered).split()), dtype=np.intp)
+        positive_weights, negative_weights, negation_flags, matched_flags = self._token_arrays()
+        
+        # 토큰마다 긍정 가중치를 더하고 부정 가중치를 빼는 순서 그대로 합산
+        # (bincount는 입력 순서대로 누적하므로 analyze와 부동소수점 결과가 같음)
+        weights = np.empty(occurrences.size * 2)
+        weights[0::2] = positive_weights[occurrences]
+        weights[1::2] = -negative_weights[occurrences]
+        scores = np.bincount(np.repeat(bins, 2), weights=weights, minlength=count * 2)
+        
+        # 제목 가중치 (1.5배)
+        title_scores = scores[:count] * 1.5
+        content_scores = scores[count:]
+        
+        # 부정어가 포함된 토큰이 하나라도 있으면 부정문
+        article_index = bins % count
+        negated = np.zeros(count, dtype=bool)
+        negated[article_index[negation_flags[occurrences]]] = True
+        
+        # 기사별로 포함된 사전 항목 (근거 토큰 계산용)
+        found_entries = [set(lexicon.empty_entries) for _ in range(count)]
+        matched = matched_flags[occurrences]
+        vocabulary_size = max(len(lexicon.token_results), 1)
+        pairs = np.unique(article_index[matched] * vocabulary_size + occurrences[matched])
+        for index, token_id in zip((pairs // vocabulary_size).tolist(), (pairs % vocabulary_size).tolist()):
+            found_entries[index] |= lexicon.token_results[token_id][2]
+        
+        # 공백이 들어간 사전 단어는 전체 텍스트에서 확인
+        if lexicon.spaced_entries or lexicon.empty_entries:
+            for index, (title, content) in enumerate(texts):
+                text = f"{title} {content}"
+                for entry_id in lexicon.spaced_entries:
+                    if lexicon.entries[entry_id][1] in text:
+                        found_entries[index].add(entry_id)
+                if not found_entries[index].isdisjoint(lexicon.negation_entries):
+                    negated[index] = True
+        
+        # 부정문 처리
+        total_scores = title_scores + content_scores
+        total_scores = np.where(negated, total_scores * -0.7, total_scores)
+        
+        # 정규화 - 고유 점수만 math.exp로 계산해 analyze와 같은 값 사용
+        unique_scores, inverse = np.unique(total_scores, return_inverse=True)
+        normalized_scores = np.array(
+            [self._normalize_score(score) for score in unique_scores.tolist()],
+            dtype=float
+        )[inverse]
+        
+        # 레이블 결정
+        labels = np.where(
+            normalized_scores >= 0.6,
+            'positive',
+            np.where(normalized_scores <= 0.4, 'negative', 'neutral')
+        )
+        
+        return [
+            {
+                'label': label,
+                'score': score,
+                'rationale': {
+                    'tokens': lexicon.rationale_tokens(found),
+                    'title_score': title_score,
+                    'content_score': content_score
+                }
+            }
+            for label, score, found, title_score, content_score in zip(
+                labels.tolist(),
+                normalized_scores.tolist(),
+                found_entries,
+                title_scores.tolist(),
+                content_scores.tolist()
+            )
+        ]
+    
+    def _token_arrays(self):
+        """토큰 사전 ID별 (긍정 가중치, 부정 가중치, 부정어 포함, 사전 단어 포함) 배열
+        
+        토큰 사전에 새로 추가된 토큰 부분만 계산해 이전 배열 뒤에 붙인다.
+        """
+        lexicon = self.lexicon
+        size = len(lexicon.token_results)
+        
+        cached = self._token_array_cache
+        if cached is None or cached[0] != lexicon.token_generation or cached[1] > size:
+            cached = (lexicon.token_generation, 0, tuple(np.empty(0, dtype=dtype) for dtype in (float, float, bool, bool)))
+        generation, cached_size, arrays = cached
+        if cached_size == size:
+            return arrays
+        
+        results = lexicon.token_results[cached_size:]
+        matched = [found - lexicon.empty_entries for _, _, found in results]
+        added = (
+            np.array([positive or 0.0 for positive, _, _ in results], dtype=float),
+            np.array([negative or 0.0 for _, negative, _ in results], dtype=float),
+            np.array([not found.isdisjoint(lexicon.negation_entries) for found in matched], dtype=bool),
+            np.array([bool(found) for found in matched], dtype=bool)
+        )
+        arrays = tuple(np.concatenate(pair) for pair in zip(arrays, added))
+        self._token_array_cache = (generation, size, arrays)
+        return arrays
+    
+    def analyze_reference(self, title: str, content: str = "") -> Dict:
+        """사전을 단어별로 순회하는 기준 구현 (analyze 결과 검증/벤치마크용)"""
         title = self.preprocess(title)
         content = self.preprocess(content)
         
@@ -43,11 +240,26 @@ class RuleBasedSentimentAnalyzer:
         title_score = self._calculate_score(title) * 1.5
         content_score = self._calculate_score(content)
         
+        return self._build_result(
+            title_score,
+            content_score,
+            self._has_negation(title, content),
+            self._extract_rationale_tokens(title, content)
+        )
+    
+    def _build_result(
+        self,
+        title_score: float,
+        content_score: float,
+        negated: bool,
+        rationale_tokens: List[str]
+    ) -> Dict:
+        """점수로부터 분석 결과 구성"""
         # 전체 점수 계산
         total_score = title_score + content_score
         
         # 부정문 처리
-        if self._has_negation(title, content):
+        if negated:
             total_score *= -0.7  # 부정문은 점수 감소
         
         # 정규화 (0~1 범위)
@@ -61,9 +273,6 @@ class RuleBasedSentimentAnalyzer:
         else:
             label = 'neutral'
         
-        # 근거 토큰 추출
-        rationale_tokens = self._extract_rationale_tokens(title, content)
-        
         return {
             'label': label,
             'score': normalized_score,
@@ -105,7 +314,6 @@ class RuleBasedSentimentAnalyzer:
     def _normalize_score(self, score: float) -> float:
         """점수를 0~1 범위로 정규화"""
         # 시그모이드 함수 사용
-        import math
         normalized = 1 / (1 + math.exp(-score / 10))
         return max(0.0, min(1.0, normalized))
     
@@ -0,0 +1,88 @@
+"""NLP 서비스 HTTP 서버 (감성 분석 일괄 처리)
+
+크롤러와 별도 프로세스/노드에서 감성 분석을 수행한다.
+RemoteSentimentAdapter가 모아 보낸 배치를 analyze_batch로 한 번에 채점한다.
+
+사용법:
+    python src/server.py --port 8100
+    python src/server.py --unix /tmp/onmi-nlp.sock
+"""
+import argparse
+import os
+import sys
+
+from aiohttp import web
+
+sys.path.append(os.path.dirname(__file__))
+from sentiment.rule_based import RuleBasedSentimentAnalyzer
+
+
+# 요청 하나에 담을 수 있는 최대 기사 수
+MAX_BATCH_SIZE = 5000
+
+
+def create_app(analyzer: RuleBasedSentimentAnalyzer = None) -> web.Application:
+    """감성 분석 엔드포인트를 등록한 애플리케이션 생성"""
+    analyzer = analyzer or RuleBasedSentimentAnalyzer()
+    
+    async def health(request: web.Request) -> web.Response:
+        """상태 확인"""
+        return web.json_response({'status': 'ok'})
+    
+    async def info(request: web.Request) -> web.Response:
+        """모델 버전과 지원 언어"""
+        return web.json_response({
+            'model_version': analyzer.model_version,
+            'languages': list(analyzer.languages)
+        })
+    
+    async def analyze_batch(request: web.Request) -> web.Response:
+        """기사 목록 감성 분석
+        
+        요청: {"articles": [{"title": str, "content": str}, ...]}
+        응답: {"model_version": str, "results": [analyze 결과, ...]}
+        """
+        try:
+            payload = await request.json()
+            articles = [
+                (str(article['title']), str(article.get('content') or ''))
+                for article in payload['articles']
+            ]
+        except (ValueError, KeyError, TypeError) as e:
+            raise web.HTTPBadRequest(reason=f"잘못된 요청 형식: {e}")
+        
+        if len(articles) > MAX_BATCH_SIZE:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=MAX_BATCH_SIZE,
+                actual_size=len(articles)
+            )
+        
+        return web.json_response({
+            'model_version': analyzer.model_version,
+            'results': analyzer.analyze_batch(articles)
+        })
+    
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_get('/health', health)
+    app.router.add_get('/v1/info', info)
+    app.router.add_post('/v1/sentiment/batch', analyze_batch)
+    return app
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="NLP 서비스 서버")
+    parser.add_argument('--host', default=os.getenv('NLP_SERVICE_HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('NLP_SERVICE_PORT', '8100')))
+    parser.add_argument('--unix', default=os.getenv('NLP_SERVICE_SOCKET'), help="유닉스 소켓 경로 (지정 시 TCP 대신 사용)")
+    args = parser.parse_args()
+    
+    app = create_app()
+    if args.unix:
+        web.run_app(app, path=args.unix)
+    else:
+        web.run_app(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""키워드별 적응형 크롤링 스케줄
+
+모든 키워드를 같은 주기로 수집하지 않고 키워드(같은 텍스트 묶음)마다 다음 수집 시각을 정한다.
+- 최근 신규 기사 수(yield)가 많을수록 자주, 기사가 없으면 최대 간격까지 드물게
+- notify_level이 high면 더 자주, low면 덜 자주
+- 다음 수집 시각 = last_crawled_at + 간격 (수집된 적 없으면 즉시)
+만기된 키워드는 우선순위 큐(다음 수집 시각 순)에서 꺼내 한 번의 작업으로 수집한다.
+"""
+import asyncio
+import heapq
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+# 공통 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../shared'))
+from config.settings import settings
+from database.connection import create_db_pool
+
+# 서비스 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../ingestor/src'))
+from processors.keyword_matcher import normalize_keyword
+
+sys.path.append(os.path.dirname(__file__))
+from crawl_queue import DatabaseCrawlTaskQueue
+
+
+# notify_level별 간격 배수 (작을수록 자주 수집)
+NOTIFY_LEVEL_FACTORS = {
+    'high': 0.5,
+    'standard': 1.0,
+    'low': 2.0
+}
+
+
+def compute_crawl_interval(
+    recent_articles: int,
+    notify_level: str = 'standard',
+    window_hours: float = 24,
+    target_articles: float = 5,
+    min_interval: timedelta = timedelta(minutes=15),
+    max_interval: timedelta = timedelta(hours=6)
+) -> timedelta:
+    """다음 수집까지의 간격
+    
+    최근 window_hours 동안의 시간당 신규 기사 수로 한 번 수집할 때
+    target_articles개 정도가 쌓이는 간격을 구하고 notify_level 배수를 곱한다.
+    """
+    rate = recent_articles / window_hours if window_hours > 0 else 0
+    if rate > 0:
+        interval = timedelta(hours=target_articles / rate)
+    else:
+        interval = max_interval
+    interval *= NOTIFY_LEVEL_FACTORS.get(notify_level, 1.0)
+    return min(max(interval, min_interval), max_interval)
+
+
+class AdaptiveCrawlScheduler:
+    """키워드 묶음별 다음 수집 시각을 관리하고 만기된 묶음을 워커로 보내는 스케줄러
+    
+    키워드 목록과 최근 기사 수는 refresh_interval마다, 그리고 작업이 끝날 때마다 DB에서 다시 읽는다.
+    한 번에 보내는 묶음 수는 dispatch_batch_size로 제한하며 가장 오래 밀린 묶음부터 보낸다.
+    use_task_queue면 직접 수집하지 않고 crawl_tasks 작업 큐에 넣어 여러 큐 워커가 나눠 수집하게 한다.
+    DB 연결 풀은 프로세스에서 하나만 만들어 키워드 조회와 수집 작업이 함께 쓴다.
+    """
+    
+    def __init__(
+        self,
+        worker,
+        min_interval: timedelta = timedelta(minutes=15),
+        max_interval: timedelta = timedelta(hours=6),
+        window_hours: float = 24,
+        target_articles: float = 5,
+        dispatch_batch_size: int = 200,
+        refresh_interval: timedelta = timedelta(minutes=10),
+        use_task_queue: bool = False
+    ):
+        self.worker = worker
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.window_hours = window_hours
+        self.target_articles = target_articles
+        self.dispatch_batch_size = dispatch_batch_size
+        self.refresh_interval = refresh_interval
+        self.use_task_queue = use_task_queue
+        
+        # (다음 수집 시각, 순번, 묶음) 힙
+        self._queue: List[Tuple[datetime, int, Dict]] = []
+        self._refreshed_at: Optional[datetime] = None
+        # 묶음별 마지막 전송 시각 (수집에 실패해 last_crawled_at이 그대로여도 최소 간격 뒤에 다시 시도)
+        self._dispatched_at: Dict[str, datetime] = {}
+    
+    async def load_keywords(self, db_conn) -> List:
+        """활성 키워드와 최근 window_hours 동안 연결된 기사 수"""
+        return await db_conn.fetch(
+            """
+            SELECT k.id, k.text, k.notify_level, k.last_crawled_at,
+                   COUNT(ka.id) AS recent_articles
+            FROM keywords k
+            LEFT JOIN keyword_articles ka
+                ON ka.keyword_id = k.id
+               AND ka.created_at > NOW() - make_interval(hours => $1)
+            WHERE k.status = 'active'
+            GROUP BY k.id
+            """,
+            int(self.window_hours)
+        )
+    
+    def plan(self, keywords: List) -> List[Dict]:
+        """같은 텍스트 묶음별 다음 수집 시각 계산
+        
+        묶음은 한 번에 수집되므로 가장 자주 수집해야 하는 키워드 기준으로 정한다.
+        (가장 높은 notify_level, 가장 많은 최근 기사 수, 가장 오래된 마지막 수집 시각)
+        """
+        groups: Dict[str, Dict] = {}
+        for keyword in keywords:
+            key = normalize_keyword(keyword['text'])
+            group = groups.setdefault(key, {
+                'key': key,
+                'text': keyword['text'],
+                'keyword_ids': [],
+                'recent_articles': 0,
+                'notify_factor': None,
+                'notify_level': 'standard',
+                'last_crawled_at': keyword['last_crawled_at']
+            })
+            group['keyword_ids'].append(str(keyword['id']))
+            group['recent_articles'] = max(group['recent_articles'], keyword['recent_articles'])
+            
+            notify_level = keyword['notify_level'] or 'standard'
+            factor = NOTIFY_LEVEL_FACTORS.get(notify_level, 1.0)
+            if group['notify_factor'] is None or factor < group['notify_factor']:
+                group['notify_factor'] = factor
+                group['notify_level'] = notify_level
+            
+            if keyword['last_crawled_at'] is None or group['last_crawled_at'] is None:
+                group['last_crawled_at'] = None
+            else:
+                group['last_crawled_at'] = min(group['last_crawled_at'], keyword['last_crawled_at'])
+        
+        for group in groups.values():
+            group['interval'] = compute_crawl_interval(
+                group['recent_articles'],
+                group['notify_level'],
+                self.window_hours,
+                self.target_articles,
+                self.min_interval,
+                self.max_interval
+            )
+            group['due_at'] = (
+                group['last_crawled_at'] + group['interval']
+                if group['last_crawled_at'] is not None
+                else datetime.now(timezone.utc)
+            )
+            dispatched_at = self._dispatched_at.get(group['key'])
+            if dispatched_at is not None:
+                group['due_at'] = max(group['due_at'], dispatched_at + self.min_interval)
+        return list(groups.values())
+    
+    async def refresh(self, db_conn):
+        """DB에서 키워드를 다시 읽어 우선순위 큐 재구성"""
+        expired_before = datetime.now(timezone.utc) - self.min_interval
+        self._dispatched_at = {
+            key: dispatched_at
+            for key, dispatched_at in self._dispatched_at.items() if dispatched_at > expired_before
+        }
+        groups = self.plan(await self.load_keywords(db_conn))
+        self._queue = [(group['due_at'], index, group) for index, group in enumerate(groups)]
+        heapq.heapify(self._queue)
+        self._refreshed_at = datetime.now(timezone.utc)
+    
+    def pop_due(self, now: datetime) -> List[Dict]:
+        """만기된 묶음을 다음 수집 시각 순으로 최대 dispatch_batch_size개 꺼냄"""
+        due = []
+        while self._queue and self._queue[0][0] <= now and len(due) < self.dispatch_batch_size:
+            due.append(heapq.heappop(self._queue)[2])
+        return due
+    
+    def seconds_until_next(self, now: datetime) -> float:
+        """다음 만기 또는 다음 재조회까지 남은 시간 (초)"""
+        waits = []
+        if self._queue:
+            waits.append((self._queue[0][0] - now).total_seconds())
+        if self._refreshed_at is not None:
+            waits.append((self._refreshed_at + self.refresh_interval - now).total_seconds())
+        return max(min(waits), 0) if waits else 0
+    
+    async def run_once(self, db_conn) -> Optional[Dict]:
+        """만기된 묶음이 있으면 한 번 수집하고 작업 결과 반환 (db_conn: 수집 작업과 공유하는 연결 풀)"""
+        if self._refreshed_at is None or datetime.now(timezone.utc) - self._refreshed_at >= self.refresh_interval:
+            await self.refresh(db_conn)
+        
+        now = datetime.now(timezone.utc)
+        due = self.pop_due(now)
+        if not due:
+            return None
+        for group in due:
+            self._dispatched_at[group['key']] = now
+        
+        if self.use_task_queue:
+            # 수집 결과는 큐 워커가 반영하므로 다음 재조회 때 다시 계산
+            added = await DatabaseCrawlTaskQueue(db_conn, "onmi-scheduler").enqueue(
+                [group['key'] for group in due]
+            )
+            print(f"만기 키워드 작업 추가: {added}개 (이미 대기/처리 중 {len(due) - added}개)")
+            return {'enqueued': added}
+        
+        keyword_ids = [keyword_id for group in due for keyword_id in group['keyword_ids']]
+        print(
+            f"만기 키워드 수집: 고유 텍스트 {len(due)}개, 키워드 {len(keyword_ids)}개 "
+            f"(대기 중 {len(self._queue)}개)"
+        )
+        try:
+            return await self.worker.run_crawl_job(keyword_ids=keyword_ids, db_pool=db_conn)
+        finally:
+            # 수집으로 바뀐 last_crawled_at과 기사 수를 반영해 다음 시각 재계산
+            await self.refresh(db_conn)
+    
+    async def run_forever(self, poll_seconds: float = 60):
+        """만기된 키워드를 계속 수집 (최대 poll_seconds마다 확인)"""
+        db_pool = await create_db_pool(
+            settings.database_url,
+            min_size=1,
+            max_size=settings.crawl_db_pool_size,
+            application_name="onmi-scheduler"
+        )
+        try:
+            while True:
+                try:
+                    await self.run_once(db_pool)
+                except Exception as e:
+                    print(f"적응형 스케줄 작업 오류: {e}")
+                    # 오류가 반복되어도 DB/피드에 요청이 몰리지 않도록 잠시 대기
+                    await asyncio.sleep(poll_seconds)
+                    continue
+                await asyncio.sleep(min(self.seconds_until_next(datetime.now(timezone.utc)), poll_seconds))
+        finally:
+            await db_pool.close()
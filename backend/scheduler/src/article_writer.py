@@ -0,0 +1,280 @@
+"""기사 일괄 저장 단계"""
+import json
+import os
+import sys
+from typing import Dict, List
+
+# 공통 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../shared'))
+from database.connection import acquire_connection
+
+
+# 배치 단위 스테이징 테이블 (트랜잭션 안에서 만들고 커밋 시 삭제: 연결이 트랜잭션마다 바뀌는 풀러에서도 안전)
+STAGING_TABLE = 'staging_crawled_articles'
+STAGING_COLUMNS = [
+    'article_id', 'url', 'title', 'snippet', 'source', 'published_at', 'lang',
+    'keyword_ids', 'match_score', 'match_type',
+    'label', 'score', 'rationale', 'model_ver', 'content_hash', 'content_changed'
+]
+
+
+class ArticleWriteError(Exception):
+    """일부 배치 저장 실패
+    
+    article_ids에는 실패 전후로 커밋된 배치의 URL -> article_id 매핑이 담긴다.
+    """
+    
+    def __init__(self, failed_batches: int, failed_records: int, article_ids: Dict[str, str], errors: List[str]):
+        super().__init__(
+            f"기사 배치 {failed_batches}개({failed_records}건) 저장 실패: {errors[0]}"
+        )
+        self.failed_batches = failed_batches
+        self.failed_records = failed_records
+        self.article_ids = article_ids
+        self.errors = errors
+
+
+class ArticleBatchWriter:
+    """수집 기사를 배치 단위로 articles, keyword_articles, sentiments에 저장
+    
+    배치마다 COPY로 임시 스테이징 테이블에 적재한 뒤 집합 연산 쿼리로
+    세 테이블에 병합하므로 기사 수와 무관하게 왕복 횟수가 일정하다.
+    배치 하나는 하나의 트랜잭션으로 커밋된다.
+    db_conn에 연결 풀을 넘기면 배치마다 연결을 빌려 쓰므로
+    여러 키워드를 동시에 저장해도 연결을 오래 점유하지 않는다.
+    
+    이미 저장된 기사(article_id가 주어진 레코드)는 articles를 다시 쓰지 않고
+    키워드 매핑만 추가한다. 단, 내용이 바뀐 기사(content_changed)는
+    제목과 요약을 갱신한다.
+    """
+    
+    def __init__(self, batch_size: int = 500, known_cache_size: int = 50000):
+        self.batch_size = batch_size
+        # 감성 분석까지 저장된 것으로 확인된 기사 (프로세스 로컬 캐시)
+        self.known_cache_size = known_cache_size
+        self.known_articles: Dict[str, Dict] = {}
+    
+    async def resolve_known_urls(self, db_conn, urls: List[str]) -> Dict[str, Dict]:
+        """이미 저장된 기사 조회 (단일 ANY 쿼리)
+        
+        반환값: {url: {'id', 'has_sentiment', 'content_hash', 'model_ver'}}
+        """
+        known = {
+            url: self.known_articles[url]
+            for url in urls if url in self.known_articles
+        }
+        
+        missing = list({url for url in urls if url not in known})
+        if missing:
+            rows = await db_conn.fetch(
+                """
+                SELECT a.id, a.url, s.article_id IS NOT NULL AS has_sentiment,
+                       s.content_hash, s.model_ver
+                FROM articles a
+                LEFT JOIN sentiments s ON s.article_id = a.id
+                WHERE a.url = ANY($1::text[])
+                """,
+                missing
+            )
+            for row in rows:
+                known[row['url']] = {
+                    'id': row['id'],
+                    'has_sentiment': row['has_sentiment'],
+                    'content_hash': row['content_hash'],
+                    'model_ver': row['model_ver']
+                }
+                if row['has_sentiment']:
+                    self._remember(row['url'], known[row['url']])
+        
+        return known
+    
+    async def write(self, db_conn, records: List[Dict]) -> Dict[str, str]:
+        """기사 레코드 저장 후 URL -> article_id 매핑 반환
+        
+        record: 기사 필드(url, title, snippet, source, published_at, lang)와
+        keyword_ids, match_score, match_type, sentiment(선택), model_ver, content_hash,
+        article_id(기존 기사), content_changed(기존 기사 내용 변경 여부)
+        
+        한 배치가 실패해도 나머지 배치는 저장한 뒤 ArticleWriteError를 발생시킨다
+        (호출자가 부분 저장을 성공으로 처리하지 않도록).
+        """
+        article_ids: Dict[str, str] = {}
+        failed_batches = 0
+        failed_records = 0
+        errors: List[str] = []
+        
+        for start in range(0, len(records), self.batch_size):
+            batch = records[start:start + self.batch_size]
+            try:
+                article_ids.update(await self.write_batch(db_conn, batch))
+            except Exception as e:
+                failed_batches += 1
+                failed_records += len(batch)
+                errors.append(str(e))
+        
+        if failed_batches:
+            raise ArticleWriteError(failed_batches, failed_records, article_ids, errors)
+        return article_ids
+    
+    async def write_batch(self, db_conn, records: List[Dict]) -> Dict[str, str]:
+        """배치 하나를 트랜잭션으로 저장"""
+        if not records:
+            return {}
+        
+        async with acquire_connection(db_conn) as conn:
+            return await self._write_batch(conn, records)
+    
+    async def _write_batch(self, db_conn, records: List[Dict]) -> Dict[str, str]:
+        """빌린 연결 하나에서 배치 저장 트랜잭션 수행"""
+        async with db_conn.transaction():
+            await db_conn.execute(
+                f"""
+                CREATE TEMP TABLE {STAGING_TABLE} (
+                    article_id UUID,
+                    url TEXT,
+                    title TEXT,
+                    snippet TEXT,
+                    source VARCHAR(255),
+                    published_at TIMESTAMPTZ,
+                    lang VARCHAR(10),
+                    keyword_ids UUID[],
+                    match_score FLOAT,
+                    match_type VARCHAR(20),
+                    label VARCHAR(10),
+                    score FLOAT,
+                    rationale TEXT,
+                    model_ver VARCHAR(20),
+                    content_hash VARCHAR(64),
+                    content_changed BOOLEAN
+                ) ON COMMIT DROP
+                """
+            )
+            
+            await db_conn.copy_records_to_table(
+                STAGING_TABLE,
+                records=[self._to_staging_row(record) for record in records],
+                columns=STAGING_COLUMNS
+            )
+            
+            # 새 기사만 삽입 (배치 안의 중복 URL은 하나만 사용)
+            # 이미 있는 행은 다시 쓰지 않아 updated_at 트리거와 테이블 팽창을 피함
+            rows = await db_conn.fetch(
+                f"""
+                INSERT INTO articles (url, title, snippet, source, published_at, lang)
+                SELECT DISTINCT ON (url) url, title, snippet, source, published_at, lang
+                FROM {STAGING_TABLE}
+                WHERE article_id IS NULL
+                ORDER BY url
+                ON CONFLICT (url) DO NOTHING
+                RETURNING id, url
+                """
+            )
+            
+            # 다른 키워드 작업이 동시에 먼저 삽입한 기사는 RETURNING에 없으므로 따로 조회
+            new_urls = {record['url'] for record in records if not record.get('article_id')}
+            if len(rows) < len(new_urls):
+                rows = await db_conn.fetch(
+                    f"""
+                    SELECT DISTINCT a.id, a.url
+                    FROM {STAGING_TABLE} s
+                    JOIN articles a ON a.url = s.url
+                    WHERE s.article_id IS NULL
+                    """
+                )
+            
+            # 내용이 바뀐 기존 기사의 제목/요약 갱신
+            # (동시에 같은 기사를 갱신하는 배치끼리 교착되지 않도록 id 순서로 먼저 잠금)
+            if any(record.get('content_changed') for record in records):
+                await db_conn.execute(
+                    f"""
+                    SELECT a.id FROM articles a
+                    WHERE a.id IN (SELECT article_id FROM {STAGING_TABLE} WHERE content_changed)
+                    ORDER BY a.id
+                    FOR UPDATE
+                    """
+                )
+                await db_conn.execute(
+                    f"""
+                    UPDATE articles a
+                    SET title = s.title, snippet = s.snippet
+                    FROM {STAGING_TABLE} s
+                    WHERE s.article_id = a.id AND s.content_changed
+                    """
+                )
+            
+            # 키워드-기사 매핑 병합
+            await db_conn.execute(
+                f"""
+                INSERT INTO keyword_articles (keyword_id, article_id, match_score, match_type)
+                SELECT DISTINCT ON (k.keyword_id, a.id) k.keyword_id, a.id, s.match_score, s.match_type
+                FROM {STAGING_TABLE} s
+                CROSS JOIN LATERAL unnest(s.keyword_ids) AS k(keyword_id)
+                JOIN articles a ON a.url = s.url
+                ORDER BY k.keyword_id, a.id, s.match_score DESC
+                ON CONFLICT (keyword_id, article_id) DO NOTHING
+                """
+            )
+            
+            # 감성 분석 결과 병합 (분석 결과가 있는 행만)
+            await db_conn.execute(
+                f"""
+                INSERT INTO sentiments (article_id, label, score, rationale, model_ver, content_hash)
+                SELECT DISTINCT ON (a.id)
+                    a.id, s.label, s.score, s.rationale::jsonb, s.model_ver, s.content_hash
+                FROM {STAGING_TABLE} s
+                JOIN articles a ON a.url = s.url
+                WHERE s.label IS NOT NULL
+                ORDER BY a.id
+                ON CONFLICT (article_id) DO UPDATE SET
+                    label = EXCLUDED.label,
+                    score = EXCLUDED.score,
+                    rationale = EXCLUDED.rationale,
+                    model_ver = EXCLUDED.model_ver,
+                    content_hash = EXCLUDED.content_hash
+                """
+            )
+        
+        article_ids = {
+            record['url']: record['article_id']
+            for record in records if record.get('article_id')
+        }
+        article_ids.update({row['url']: row['id'] for row in rows})
+        
+        for record in records:
+            if record.get('sentiment') and record['url'] in article_ids:
+                self._remember(record['url'], {
+                    'id': article_ids[record['url']],
+                    'has_sentiment': True,
+                    'content_hash': record.get('content_hash'),
+                    'model_ver': record.get('model_ver')
+                })
+        
+        return article_ids
+    
+    def _remember(self, url: str, known_article: Dict):
+        """저장 확인된 기사를 로컬 캐시에 기록 (크기 초과 시 비움)"""
+        if len(self.known_articles) >= self.known_cache_size:
+            self.known_articles.clear()
+        self.known_articles[url] = known_article
+    
+    def _to_staging_row(self, record: Dict) -> tuple:
+        """레코드를 스테이징 테이블 행으로 변환"""
+        sentiment = record.get('sentiment')
+        return (
+            record.get('article_id'),
+            record['url'],
+            record['title'],
+            record.get('snippet', ''),
+            record.get('source', ''),
+            record.get('published_at'),
+            record.get('lang', 'ko'),
+            list(record.get('keyword_ids', [])),
+            record.get('match_score', 1.0),
+            record.get('match_type', 'exact'),
+            sentiment['label'] if sentiment else None,
+            sentiment['score'] if sentiment else None,
+            json.dumps(sentiment['rationale'], ensure_ascii=False) if sentiment else None,
+            record.get('model_ver') if sentiment else None,
+            record.get('content_hash') if sentiment else None,
+            bool(record.get('content_changed'))
+        )
@@ -0,0 +1,134 @@
+"""시간 예산 크롤링 작업의 진행 커서 저장소"""
+import json
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class DatabaseCrawlCheckpointStore:
+    """crawl_checkpoints 테이블 기반 라운드/진행 위치 저장소
+    
+    라운드는 활성 키워드 전체를 한 번씩 수집하는 단위이며 여러 호출에 걸쳐 진행된다.
+    키워드는 오래 수집되지 않은 순서(last_crawled_at, id)로 처리하고,
+    앞선 키워드가 모두 끝난 마지막 위치를 기록한다.
+    
+    다음 호출의 남은 키워드는 기록된 위치 이후이면서 라운드 시작 이후에 수집되지 않은 키워드다.
+    (수집에 성공한 키워드는 last_crawled_at이 갱신되어 빠지고,
+    실패한 키워드는 위치가 커서 이전이라 같은 라운드에서 다시 시도하지 않는다.)
+    
+    피드 상태(검증자/워터마크)는 라운드 첫 호출에서 받은 것을 보관했다가 라운드를 실패 없이 마쳤을 때만 넘긴다.
+    이후 호출에서 받은 상태는 그 전에 끝난 키워드가 보지 못한 항목까지 지나가므로 저장하지 않는다.
+    """
+    
+    def __init__(self, db_conn, job_name: str = 'crawl'):
+        self.db_conn = db_conn
+        self.job_name = job_name
+    
+    async def load(self) -> Optional[Dict]:
+        """진행 중인 라운드 조회 (없으면 None)"""
+        row = await self.db_conn.fetchrow(
+            """
+            SELECT round_started_at, position_crawled_at, position_keyword_id
+            FROM crawl_checkpoints
+            WHERE job_name = $1
+            """,
+            self.job_name
+        )
+        return dict(row) if row else None
+    
+    async def start_round(self) -> Dict:
+        """새 라운드 시작 (진행 위치 초기화)"""
+        row = await self.db_conn.fetchrow(
+            """
+            INSERT INTO crawl_checkpoints (job_name, round_started_at)
+            VALUES ($1, NOW())
+            ON CONFLICT (job_name) DO UPDATE SET
+                round_started_at = EXCLUDED.round_started_at,
+                position_crawled_at = NULL,
+                position_keyword_id = NULL,
+                feed_states = NULL,
+                failed_keywords = 0,
+                updated_at = NOW()
+            RETURNING round_started_at, position_crawled_at, position_keyword_id
+            """,
+            self.job_name
+        )
+        return dict(row)
+    
+    async def fetch_pending_keywords(self, checkpoint: Dict) -> List:
+        """라운드에서 남은 활성 키워드 (오래 수집되지 않은 순서)"""
+        return await self.db_conn.fetch(
+            """
+            SELECT id, text, last_crawled_at
+            FROM keywords
+            WHERE status = 'active'
+              AND COALESCE(last_crawled_at, '-infinity'::timestamptz) < $1
+              AND (
+                  $3::uuid IS NULL
+                  OR (COALESCE(last_crawled_at, '-infinity'::timestamptz), id)
+                     > (COALESCE($2::timestamptz, '-infinity'::timestamptz), $3::uuid)
+              )
+            ORDER BY COALESCE(last_crawled_at, '-infinity'::timestamptz), id
+            """,
+            checkpoint['round_started_at'],
+            checkpoint['position_crawled_at'],
+            checkpoint['position_keyword_id']
+        )
+    
+    async def save_position(self, keyword: Dict):
+        """처리를 마친 마지막 키워드 위치 기록 (조회 당시의 last_crawled_at 기준)"""
+        await self.db_conn.execute(
+            """
+            UPDATE crawl_checkpoints
+            SET position_crawled_at = $2, position_keyword_id = $3, updated_at = NOW()
+            WHERE job_name = $1
+            """,
+            self.job_name,
+            keyword['last_crawled_at'],
+            keyword['id']
+        )
+    
+    async def save_feed_states(self, feed_states: Dict[str, Dict]):
+        """라운드 첫 호출에서 받은 피드 상태 보관"""
+        await self.db_conn.execute(
+            """
+            UPDATE crawl_checkpoints
+            SET feed_states = $2::jsonb, updated_at = NOW()
+            WHERE job_name = $1
+            """,
+            self.job_name,
+            json.dumps(feed_states, default=self._to_json)
+        )
+    
+    async def record_failures(self, count: int):
+        """라운드 중 수집에 실패한 키워드 수 누적"""
+        await self.db_conn.execute(
+            """
+            UPDATE crawl_checkpoints
+            SET failed_keywords = failed_keywords + $2, updated_at = NOW()
+            WHERE job_name = $1
+            """,
+            self.job_name,
+            count
+        )
+    
+    async def finish_round(self) -> Optional[Dict[str, Dict]]:
+        """라운드 종료 (다음 호출은 새 라운드로 시작)
+        
+        반환값: 저장해도 되는 피드 상태 (실패한 키워드가 있었거나 보관된 상태가 없으면 None)
+        """
+        row = await self.db_conn.fetchrow(
+            """
+            DELETE FROM crawl_checkpoints WHERE job_name = $1
+            RETURNING feed_states, failed_keywords
+            """,
+            self.job_name
+        )
+        if row is None or row['failed_keywords'] or row['feed_states'] is None:
+            return None
+        return json.loads(row['feed_states'])
+    
+    def _to_json(self, value):
+        """피드 상태의 시각 값 직렬화"""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"JSON으로 변환할 수 없는 값: {value!r}")
@@ -0,0 +1,176 @@
+"""여러 크롤러 프로세스가 나눠 처리하는 키워드 수집 작업 큐 (crawl_tasks 임대)"""
+from typing import Dict, List
+
+
+class DatabaseCrawlTaskQueue:
+    """crawl_tasks 테이블 기반 작업 큐
+    
+    작업 하나는 정규화한 키워드 텍스트 하나(group_keywords의 key)이며
+    같은 텍스트의 대기/처리 중 작업은 하나만 둔다 (부분 유니크 인덱스).
+    
+    - claim: FOR UPDATE SKIP LOCKED로 다른 워커가 잡고 있는 행을 건너뛰며 가져가고 임대를 건다
+    - heartbeat: 처리 중인 작업의 임대 연장 (워커가 죽으면 연장이 멈추고 만료 후 다른 워커가 가져감)
+    - complete: 처리를 마친 작업 삭제
+    - fail: 시도마다 두 배로 늘어나는 대기 후 재시도, max_attempts를 넘으면 dead로 보관
+    모든 갱신은 lease_owner가 자신인 임대 중 작업만 대상으로 하므로
+    임대가 만료되어 다른 워커에게 넘어간 작업은 건드리지 않는다.
+    """
+    
+    def __init__(
+        self,
+        db_conn,
+        worker_id: str,
+        lease_seconds: int = 300,
+        max_attempts: int = 5,
+        retry_base_seconds: int = 60,
+        retry_max_seconds: int = 3600
+    ):
+        self.db_conn = db_conn
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+    
+    async def enqueue(self, keyword_keys: List[str]) -> int:
+        """키워드 텍스트별 작업 추가 (이미 대기/처리 중인 텍스트는 건너뜀)
+        
+        반환값: 새로 추가된 작업 수
+        """
+        if not keyword_keys:
+            return 0
+        rows = await self.db_conn.fetch(
+            """
+            INSERT INTO crawl_tasks (keyword_key)
+            SELECT DISTINCT unnest($1::text[])
+            ON CONFLICT (keyword_key) WHERE status IN ('pending', 'leased') DO NOTHING
+            RETURNING id
+            """,
+            list(keyword_keys)
+        )
+        return len(rows)
+    
+    async def claim(self, limit: int) -> List[Dict]:
+        """가져갈 수 있는 작업을 최대 limit개 임대
+        
+        대기 시간이 지난 작업과 임대가 만료된 작업(죽은 워커의 작업)이 대상이다.
+        임대가 만료된 채 시도 한도에 이른 작업은 가져가지 않고 dead로 옮긴다.
+        반환값: [{'id', 'keyword_key', 'attempts'}]
+        """
+        await self.db_conn.execute(
+            """
+            UPDATE crawl_tasks
+            SET status = 'dead',
+                lease_owner = NULL,
+                lease_expires_at = NULL,
+                last_error = COALESCE(last_error, '임대 만료'),
+                updated_at = NOW()
+            WHERE status = 'leased' AND lease_expires_at < NOW() AND attempts >= $1
+            """,
+            self.max_attempts
+        )
+        rows = await self.db_conn.fetch(
+            """
+            WITH claimable AS (
+                SELECT id FROM crawl_tasks
+                WHERE (status = 'pending' AND available_at <= NOW())
+                   OR (status = 'leased' AND lease_expires_at < NOW())
+                ORDER BY available_at, id
+                LIMIT $2
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE crawl_tasks t
+            SET status = 'leased',
+                lease_owner = $1,
+                lease_expires_at = NOW() + make_interval(secs => $3),
+                attempts = t.attempts + 1,
+                updated_at = NOW()
+            FROM claimable
+            WHERE t.id = claimable.id
+            RETURNING t.id, t.keyword_key, t.attempts
+            """,
+            self.worker_id,
+            limit,
+            float(self.lease_seconds)
+        )
+        return [dict(row) for row in rows]
+    
+    async def heartbeat(self, task_ids: List[int]) -> List[int]:
+        """임대 연장
+        
+        반환값: 연장하지 못한 작업 ID (임대가 만료되어 다른 워커가 가져간 작업)
+        """
+        if not task_ids:
+            return []
+        rows = await self.db_conn.fetch(
+            """
+            UPDATE crawl_tasks
+            SET lease_expires_at = NOW() + make_interval(secs => $3), updated_at = NOW()
+            WHERE id = ANY($1::bigint[]) AND lease_owner = $2 AND status = 'leased'
+            RETURNING id
+            """,
+            list(task_ids),
+            self.worker_id,
+            float(self.lease_seconds)
+        )
+        renewed = {row['id'] for row in rows}
+        return [task_id for task_id in task_ids if task_id not in renewed]
+    
+    async def complete(self, task_ids: List[int]) -> int:
+        """처리를 마친 작업 삭제
+        
+        반환값: 삭제한 작업 수 (임대를 잃은 작업은 제외)
+        """
+        if not task_ids:
+            return 0
+        rows = await self.db_conn.fetch(
+            """
+            DELETE FROM crawl_tasks
+            WHERE id = ANY($1::bigint[]) AND lease_owner = $2 AND status = 'leased'
+            RETURNING id
+            """,
+            list(task_ids),
+            self.worker_id
+        )
+        return len(rows)
+    
+    async def fail(self, task_ids: List[int], error: str) -> Dict[str, int]:
+        """실패한 작업을 재시도 대기로 되돌리거나 시도 한도를 넘었으면 dead로 보관
+        
+        재시도 대기: retry_base_seconds x 2^(시도 횟수 - 1), 최대 retry_max_seconds
+        반환값: {'retry': 재시도 예약 수, 'dead': dead 처리 수}
+        """
+        if not task_ids:
+            return {'retry': 0, 'dead': 0}
+        rows = await self.db_conn.fetch(
+            """
+            UPDATE crawl_tasks
+            SET status = CASE WHEN attempts >= $3 THEN 'dead' ELSE 'pending' END,
+                available_at = NOW() + make_interval(
+                    secs => LEAST($4 * power(2, GREATEST(attempts - 1, 0)), $5)
+                ),
+                lease_owner = NULL,
+                lease_expires_at = NULL,
+                last_error = $6,
+                updated_at = NOW()
+            WHERE id = ANY($1::bigint[]) AND lease_owner = $2 AND status = 'leased'
+            RETURNING status
+            """,
+            list(task_ids),
+            self.worker_id,
+            self.max_attempts,
+            float(self.retry_base_seconds),
+            float(self.retry_max_seconds),
+            error
+        )
+        dead = sum(1 for row in rows if row['status'] == 'dead')
+        return {'retry': len(rows) - dead, 'dead': dead}
+    
+    async def stats(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        rows = await self.db_conn.fetch(
+            "SELECT status, COUNT(*) AS count FROM crawl_tasks GROUP BY status"
+        )
+        counts = {'pending': 0, 'leased': 0, 'dead': 0}
+        counts.update({row['status']: row['count'] for row in rows})
+        return counts
@@ -0,0 +1,195 @@
+"""crawl_tasks 작업 큐를 소비하는 크롤러 워커
+
+여러 프로세스/노드에서 동시에 실행하면 키워드 텍스트 단위로 작업을 나눠 가져간다.
+    python -m scheduler.src.queue_worker               # 계속 실행
+    python -m scheduler.src.queue_worker --enqueue-all # 모든 활성 키워드 작업 추가
+"""
+import argparse
+import asyncio
+import os
+import socket
+import sys
+from typing import Dict, List, Optional
+
+# 공통 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../shared'))
+from config.settings import settings
+from database.connection import create_db_pool
+
+# 서비스 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../ingestor/src'))
+from processors.keyword_matcher import normalize_keyword
+
+sys.path.append(os.path.dirname(__file__))
+from crawl_queue import DatabaseCrawlTaskQueue
+from worker import CrawlerWorker
+
+
+def default_worker_id() -> str:
+    """호스트 이름과 프로세스 ID로 만든 워커 ID"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class CrawlQueueWorker:
+    """작업을 임대해 CrawlerWorker로 수집하고 결과에 따라 완료/재시도 처리
+    
+    한 번에 가져간 작업(키워드 텍스트)들은 run_crawl_job(keyword_ids=...) 한 번으로 수집해
+    피드 수집을 함께 쓴다 (피드는 워커의 공유 스냅샷에서 조건부 요청으로 갱신).
+    DB 연결 풀은 프로세스에서 하나만 만들어 큐 갱신과 수집 작업이 함께 쓴다.
+    수집 중에는 임대 시간의 1/3마다 하트비트로 임대를 연장한다.
+    다른 워커와 같은 기사를 동시에 저장해도 저장 단계가 ON CONFLICT로 병합하므로 중복 행은 생기지 않는다.
+    """
+    
+    def __init__(
+        self,
+        worker: CrawlerWorker,
+        worker_id: Optional[str] = None,
+        claim_size: int = 50,
+        poll_seconds: float = 10
+    ):
+        self.worker = worker
+        self.worker_id = worker_id or default_worker_id()
+        self.claim_size = claim_size
+        self.poll_seconds = poll_seconds
+    
+    def create_task_queue(self, db_conn) -> DatabaseCrawlTaskQueue:
+        """설정값으로 작업 큐 생성"""
+        return DatabaseCrawlTaskQueue(
+            db_conn,
+            self.worker_id,
+            lease_seconds=settings.crawl_queue_lease_seconds,
+            max_attempts=settings.crawl_queue_max_attempts,
+            retry_base_seconds=settings.crawl_queue_retry_base_seconds,
+            retry_max_seconds=settings.crawl_queue_retry_max_seconds
+        )
+    
+    async def resolve_keyword_ids(self, db_conn) -> Dict[str, List[str]]:
+        """정규화한 키워드 텍스트 -> 활성 키워드 ID 목록"""
+        rows = await db_conn.fetch("SELECT id, text FROM keywords WHERE status = 'active'")
+        keyword_ids: Dict[str, List[str]] = {}
+        for row in rows:
+            keyword_ids.setdefault(normalize_keyword(row['text']), []).append(str(row['id']))
+        return keyword_ids
+    
+    async def enqueue_active_keywords(self, task_queue: DatabaseCrawlTaskQueue, db_conn) -> int:
+        """모든 활성 키워드 텍스트의 작업 추가"""
+        return await task_queue.enqueue(list(await self.resolve_keyword_ids(db_conn)))
+    
+    async def keep_leases(self, task_queue: DatabaseCrawlTaskQueue, task_ids: List[int]):
+        """수집이 끝날 때까지 임대 연장 (취소될 때까지 실행)"""
+        interval = max(task_queue.lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                lost = await task_queue.heartbeat(task_ids)
+            except Exception as e:
+                print(f"작업 임대 연장 오류: {e}")
+                continue
+            if lost:
+                # 임대가 만료되어 다른 워커가 가져감 (결과는 해당 워커가 처리)
+                print(f"작업 임대 상실: {len(lost)}개")
+                lost_ids = set(lost)
+                task_ids = [task_id for task_id in task_ids if task_id not in lost_ids]
+    
+    async def run_once(self, db_conn) -> Optional[Dict]:
+        """작업을 한 번 가져와 수집 (가져갈 작업이 없으면 None, db_conn: 수집 작업과 공유하는 연결 풀)"""
+        task_queue = self.create_task_queue(db_conn)
+        tasks = await task_queue.claim(self.claim_size)
+        if not tasks:
+            return None
+        
+        keyword_ids_by_key = await self.resolve_keyword_ids(db_conn)
+        keyword_ids = [
+            keyword_id
+            for task in tasks for keyword_id in keyword_ids_by_key.get(task['keyword_key'], [])
+        ]
+        print(f"[{self.worker_id}] 작업 {len(tasks)}개 임대 (키워드 {len(keyword_ids)}개)")
+        
+        task_ids = [task['id'] for task in tasks]
+        heartbeat = asyncio.create_task(self.keep_leases(task_queue, task_ids))
+        try:
+            # 비활성화/삭제되어 키워드가 없는 작업은 수집 없이 완료
+            result = (
+                await self.worker.run_crawl_job(keyword_ids=keyword_ids, db_pool=db_conn)
+                if keyword_ids else {'failed_keyword_ids': []}
+            )
+        except Exception as e:
+            outcome = await task_queue.fail(task_ids, str(e))
+            print(f"[{self.worker_id}] 수집 작업 오류: {e} (재시도 {outcome['retry']}개, dead {outcome['dead']}개)")
+            return {'completed': 0, **outcome}
+        finally:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+        
+        # 묶음의 키워드가 하나라도 실패한 작업은 재시도
+        failed_keyword_ids = set(result['failed_keyword_ids'])
+        failed_task_ids = [
+            task['id'] for task in tasks
+            if failed_keyword_ids.intersection(keyword_ids_by_key.get(task['keyword_key'], []))
+        ]
+        failed = set(failed_task_ids)
+        completed = await task_queue.complete([task_id for task_id in task_ids if task_id not in failed])
+        outcome = await task_queue.fail(failed_task_ids, "키워드 수집 실패")
+        print(
+            f"[{self.worker_id}] 작업 결과: 완료 {completed}개, "
+            f"재시도 {outcome['retry']}개, dead {outcome['dead']}개"
+        )
+        return {'completed': completed, **outcome}
+    
+    async def run_forever(self, once: bool = False):
+        """작업을 계속 가져와 수집 (once면 남은 작업이 없을 때 종료)"""
+        # 수집 작업의 연결 + 하트비트용 연결 하나
+        db_pool = await create_db_pool(
+            settings.database_url,
+            min_size=1,
+            max_size=settings.crawl_db_pool_size + 1,
+            application_name="onmi-crawl-queue"
+        )
+        try:
+            while True:
+                try:
+                    result = await self.run_once(db_pool)
+                except Exception as e:
+                    print(f"[{self.worker_id}] 작업 큐 오류: {e}")
+                    result = None
+                if result is None:
+                    if once:
+                        break
+                    await asyncio.sleep(self.poll_seconds)
+        finally:
+            await db_pool.close()
+
+
+async def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="크롤링 작업 큐 워커")
+    parser.add_argument('--worker-id', default=None, help="워커 ID (기본값: 호스트 이름-프로세스 ID)")
+    parser.add_argument('--claim-size', type=int, default=settings.crawl_queue_claim_size)
+    parser.add_argument('--enqueue-all', action='store_true', help="모든 활성 키워드 작업을 추가하고 종료")
+    parser.add_argument('--once', action='store_true', help="남은 작업이 없으면 종료")
+    args = parser.parse_args()
+    
+    queue_worker = CrawlQueueWorker(
+        CrawlerWorker(),
+        args.worker_id,
+        claim_size=args.claim_size,
+        poll_seconds=settings.crawl_queue_poll_seconds
+    )
+    if args.enqueue_all:
+        db_pool = await create_db_pool(settings.database_url, min_size=1, max_size=1)
+        try:
+            task_queue = queue_worker.create_task_queue(db_pool)
+            added = await queue_worker.enqueue_active_keywords(task_queue, db_pool)
+            print(f"작업 추가: {added}개, 상태별 작업 수: {await task_queue.stats()}")
+        finally:
+            await db_pool.close()
+        return
+    
+    await queue_worker.run_forever(once=args.once)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,4 +1,5 @@
 """스케줄러 메인 스크립트"""
+from datetime import timedelta
 import schedule
 import time
 import asyncio
@@ -8,6 +9,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../shared'))
 from config.settings import settings
 from scheduler.src.worker import CrawlerWorker
+from scheduler.src.adaptive_schedule import AdaptiveCrawlScheduler
 
 
 def run_crawler():
@@ -16,8 +18,29 @@ def run_crawler():
     asyncio.run(worker.run_crawl_job())
 
 
+def run_adaptive_scheduler():
+    """키워드별 다음 수집 시각에 맞춰 만기된 키워드만 계속 수집
+    
+    작업 큐를 쓰면 만기 키워드를 crawl_tasks에 넣기만 하고 수집은 queue_worker 프로세스들이 나눠 맡는다.
+    """
+    adaptive_scheduler = AdaptiveCrawlScheduler(
+        None if settings.crawl_queue_enabled else CrawlerWorker(),
+        min_interval=timedelta(minutes=settings.crawl_min_interval_minutes),
+        max_interval=timedelta(minutes=settings.crawl_max_interval_minutes),
+        window_hours=settings.crawl_yield_window_hours,
+        target_articles=settings.crawl_target_articles_per_run,
+        dispatch_batch_size=settings.crawl_dispatch_batch_size,
+        use_task_queue=settings.crawl_queue_enabled
+    )
+    asyncio.run(adaptive_scheduler.run_forever())
+
+
 def main():
     """스케줄러 메인 함수"""
+    if settings.adaptive_scheduling_enabled:
+        run_adaptive_scheduler()
+        return
+    
     # 2시간마다 크롤링 실행
     schedule.every(settings.scheduler_interval_hours).hours.do(run_crawler)
     
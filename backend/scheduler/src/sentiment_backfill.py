@@ -0,0 +1,348 @@
+"""감성 분석 전체 재분석(백필) 명령
+
+감성 사전이나 레이블 기준을 바꾼 뒤(분석기 model_version 변경) 기존 articles/sentiments 전체를
+현재 분석기 버전으로 다시 채점한다. 크롤러는 분석기 버전과 저장된 model_ver를 비교해
+재분석 여부를 정하므로 다른 버전 이름으로는 저장하지 않는다.
+
+사용법:
+    python src/sentiment_backfill.py [--workers 8]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import asyncpg
+
+# 공통 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../shared'))
+from config.settings import settings
+
+# 서비스 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../nlp-service/src'))
+from sentiment.rule_based import RuleBasedSentimentAnalyzer
+
+
+# 배치 단위 스테이징 테이블 (트랜잭션 안에서 만들고 커밋 시 삭제: 연결이 트랜잭션마다 바뀌는 풀러에서도 안전)
+STAGING_TABLE = 'staging_sentiment_backfill'
+STAGING_COLUMNS = ['article_id', 'label', 'score', 'rationale', 'model_ver', 'content_hash']
+
+# sentiments.model_ver 컬럼 길이
+MODEL_VER_MAX_LENGTH = 20
+
+# 워커 프로세스별 분석기 (프로세스 시작 시 한 번 생성)
+_analyzer: Optional[RuleBasedSentimentAnalyzer] = None
+
+
+def _init_worker():
+    """워커 프로세스 초기화 (사전 컴파일은 프로세스당 한 번)"""
+    global _analyzer
+    _analyzer = RuleBasedSentimentAnalyzer()
+
+
+def score_chunk(rows: List[Tuple[str, str, str]], model_ver: str) -> List[tuple]:
+    """워커 프로세스에서 기사 묶음 채점 후 스테이징 테이블 행으로 반환
+    
+    rows: (article_id, title, snippet)
+    """
+    results = _analyzer.analyze_batch([(title, snippet) for _, title, snippet in rows])
+    return [
+        (
+            article_id,
+            result['label'],
+            result['score'],
+            json.dumps(result['rationale'], ensure_ascii=False),
+            model_ver,
+            _analyzer.compute_content_hash(title, snippet)
+        )
+        for (article_id, title, snippet), result in zip(rows, results)
+    ]
+
+
+class BackfillCheckpoint:
+    """백필 진행 위치를 기록하는 로컬 JSON 파일
+    
+    실행 조건(SentimentBackfill.run_key: model_ver, force, 대상 언어)마다
+    마지막으로 저장된 article_id(정렬 기준)와 처리 건수를 남긴다.
+    실행이 끝까지 완료되면 해당 항목을 지운다.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    def _read(self) -> Dict:
+        """저장된 전체 항목 (파일이 없거나 깨졌으면 빈 dict)"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"체크포인트 파일 읽기 오류 ({self.path}): {e}")
+            return {}
+    
+    def load(self, run_key: str) -> Dict:
+        """실행 조건의 진행 위치 조회 (없으면 처음부터)"""
+        return self._read().get(run_key, {'last_article_id': None, 'processed': 0})
+    
+    def save(self, run_key: str, last_article_id: str, processed: int):
+        """실행 조건의 진행 위치 저장 (다른 항목은 유지)"""
+        checkpoints = self._read()
+        checkpoints[run_key] = {'last_article_id': last_article_id, 'processed': processed}
+        self._write(checkpoints)
+    
+    def clear(self, run_key: str):
+        """완료된 실행 조건의 진행 위치 삭제 (다음 실행은 처음부터)"""
+        checkpoints = self._read()
+        if checkpoints.pop(run_key, None) is not None:
+            self._write(checkpoints)
+    
+    def _write(self, checkpoints: Dict):
+        """전체 항목 저장"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # 중간에 종료되어도 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoints, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+class SentimentBackfill:
+    """기사 전체 감성 재분석
+    
+    - 읽기: 서버 측 커서로 article id 순서대로 스트리밍 (체크포인트 이후부터)
+    - 채점: 프로세스 풀에서 묶음 단위로 analyze_batch 수행 (모든 코어 사용)
+    - 쓰기: 배치마다 COPY로 스테이징 테이블에 적재한 뒤 sentiments에 병합
+    
+    배치는 읽은 순서대로 저장되고 저장이 커밋된 뒤에만 체크포인트가 전진하므로,
+    중단 후 같은 조건으로 다시 실행하면 마지막으로 커밋된 배치 다음부터 이어서 처리한다.
+    (article id는 무작위 UUID라 위치는 같은 실행을 이어갈 때만 의미가 있으므로
+    실행 조건별로 기록하고 끝까지 완료되면 지운다)
+    이미 같은 model_ver로 저장된 기사는 건너뛴다(force면 모두 다시 채점).
+    분석기가 지원하는 언어(articles.lang)의 기사만 대상으로 한다.
+    """
+    
+    def __init__(
+        self,
+        model_ver: Optional[str] = None,
+        workers: Optional[int] = None,
+        batch_size: int = 20000,
+        checkpoint: Optional[BackfillCheckpoint] = None,
+        force: bool = False,
+        languages: Optional[List[str]] = None
+    ):
+        analyzer_version = RuleBasedSentimentAnalyzer.model_version
+        model_ver = model_ver or analyzer_version
+        if model_ver != analyzer_version:
+            # 크롤러가 오래된 결과로 보고 다시 채점해 덮어쓰게 됨
+            raise ValueError(
+                f"model_ver는 분석기 버전({analyzer_version})과 같아야 합니다: {model_ver!r}"
+            )
+        if len(model_ver) > MODEL_VER_MAX_LENGTH:
+            raise ValueError(f"model_ver는 1~{MODEL_VER_MAX_LENGTH}자여야 합니다: {model_ver!r}")
+        
+        self.model_ver = model_ver
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.checkpoint = checkpoint
+        self.force = force
+        self.languages = list(languages or RuleBasedSentimentAnalyzer.languages)
+    
+    @property
+    def run_key(self) -> str:
+        """체크포인트 항목 키 (대상 기사 집합을 정하는 실행 조건)"""
+        return json.dumps(
+            {'model_ver': self.model_ver, 'force': self.force, 'languages': sorted(self.languages)},
+            sort_keys=True
+        )
+    
+    async def run(self, database_url: str) -> int:
+        """백필 실행 후 이번 실행에서 저장한 기사 수 반환"""
+        state = (
+            self.checkpoint.load(self.run_key) if self.checkpoint
+            else {'last_article_id': None, 'processed': 0}
+        )
+        last_article_id = state['last_article_id']
+        processed = state['processed']
+        
+        # 읽기(커서 트랜잭션)와 쓰기(배치 트랜잭션)는 별도 연결 사용
+        read_conn = await asyncpg.connect(database_url)
+        write_conn = await asyncpg.connect(database_url)
+        loop = asyncio.get_running_loop()
+        
+        try:
+            total = await read_conn.fetchval(
+                f"SELECT count(*) FROM articles a {self._pending_filter()}",
+                *self._pending_args(last_article_id)
+            )
+            print(
+                f"감성 재분석 시작: model_ver={self.model_ver}, 대상 {total}건, "
+                f"워커 {self.workers}개"
+                + (f" (체크포인트 {processed}건 이후부터)" if last_article_id else "")
+            )
+            
+            started = time.perf_counter()
+            written = 0
+            
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as executor:
+                # 배치 안의 묶음은 워커마다 하나씩 동시에 채점
+                # 다음 배치를 읽는 동안 이전 배치 채점이 진행되도록 최대 두 배치까지 미리 제출
+                pending = deque()
+                
+                async with read_conn.transaction(readonly=True):
+                    cursor = await read_conn.cursor(
+                        f"""
+                        SELECT a.id, a.title, COALESCE(a.snippet, '') AS snippet
+                        FROM articles a
+                        {self._pending_filter()}
+                        ORDER BY a.id
+                        """,
+                        *self._pending_args(last_article_id)
+                    )
+                    
+                    while True:
+                        rows = await cursor.fetch(self.batch_size)
+                        if rows:
+                            chunk_size = -(-len(rows) // self.workers)
+                            chunks = [
+                                [(row['id'], row['title'], row['snippet']) for row in rows[start:start + chunk_size]]
+                                for start in range(0, len(rows), chunk_size)
+                            ]
+                            pending.append((
+                                rows[-1]['id'],
+                                [
+                                    loop.run_in_executor(executor, score_chunk, chunk, self.model_ver)
+                                    for chunk in chunks
+                                ]
+                            ))
+                        
+                        # 가장 오래된 배치부터 순서대로 저장
+                        while pending and (len(pending) > 1 or not rows):
+                            batch_last_id, futures = pending.popleft()
+                            staged = [row for chunk in await asyncio.gather(*futures) for row in chunk]
+                            await self.write_batch(write_conn, staged)
+                            
+                            written += len(staged)
+                            processed += len(staged)
+                            if self.checkpoint:
+                                self.checkpoint.save(self.run_key, str(batch_last_id), processed)
+                            self._report(written, total, started)
+                        
+                        if not rows:
+                            break
+        
+        finally:
+            await read_conn.close()
+            await write_conn.close()
+        
+        # 끝까지 처리했으므로 다음 실행(--force 재채점 포함)은 처음부터
+        if self.checkpoint:
+            self.checkpoint.clear(self.run_key)
+        print(f"감성 재분석 완료: {written}건 저장 (누적 {processed}건)")
+        return written
+    
+    def _pending_filter(self) -> str:
+        """체크포인트 이후이면서 아직 새 model_ver로 저장되지 않은 기사 조건"""
+        condition = """
+            WHERE ($1::uuid IS NULL OR a.id > $1::uuid)
+              AND a.lang = ANY($2::text[])
+        """
+        if self.force:
+            return condition
+        return condition + """
+              AND NOT EXISTS (
+                  SELECT 1 FROM sentiments s
+                  WHERE s.article_id = a.id AND s.model_ver = $3
+              )
+        """
+    
+    def _pending_args(self, last_article_id: Optional[str]) -> list:
+        """_pending_filter 조건의 쿼리 인자"""
+        args = [last_article_id, self.languages]
+        return args if self.force else args + [self.model_ver]
+    
+    async def write_batch(self, db_conn, rows: List[tuple]):
+        """채점 결과 배치를 트랜잭션으로 sentiments에 병합"""
+        if not rows:
+            return
+        
+        async with db_conn.transaction():
+            await db_conn.execute(
+                f"""
+                CREATE TEMP TABLE {STAGING_TABLE} (
+                    article_id UUID,
+                    label VARCHAR(10),
+                    score FLOAT,
+                    rationale TEXT,
+                    model_ver VARCHAR(20),
+                    content_hash VARCHAR(64)
+                ) ON COMMIT DROP
+                """
+            )
+            
+            await db_conn.copy_records_to_table(
+                STAGING_TABLE,
+                records=rows,
+                columns=STAGING_COLUMNS
+            )
+            
+            await db_conn.execute(
+                f"""
+                INSERT INTO sentiments (article_id, label, score, rationale, model_ver, content_hash)
+                SELECT article_id, label, score, rationale::jsonb, model_ver, content_hash
+                FROM {STAGING_TABLE}
+                ON CONFLICT (article_id) DO UPDATE SET
+                    label = EXCLUDED.label,
+                    score = EXCLUDED.score,
+                    rationale = EXCLUDED.rationale,
+                    model_ver = EXCLUDED.model_ver,
+                    content_hash = EXCLUDED.content_hash
+                """
+            )
+    
+    def _report(self, written: int, total: int, started: float):
+        """진행률과 처리 속도 출력"""
+        elapsed = time.perf_counter() - started
+        rate = written / elapsed if elapsed else 0.0
+        remaining = (total - written) / rate if rate else 0.0
+        percent = written / total * 100 if total else 100.0
+        print(
+            f"  {written}/{total}건 ({percent:.1f}%) - "
+            f"{rate:,.0f}건/초, 남은 시간 약 {remaining:,.0f}초"
+        )
+
+
+async def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="기존 기사 전체 감성 재분석")
+    parser.add_argument(
+        '--model-ver',
+        default=None,
+        help="저장할 model_ver 확인용 (현재 분석기 버전과 다르면 실행하지 않음)"
+    )
+    parser.add_argument('--workers', type=int, default=settings.sentiment_backfill_workers or None)
+    parser.add_argument('--batch-size', type=int, default=settings.sentiment_backfill_batch_size)
+    parser.add_argument('--checkpoint', default=settings.sentiment_backfill_checkpoint_path)
+    parser.add_argument('--force', action='store_true', help="이미 같은 model_ver인 기사도 다시 채점")
+    args = parser.parse_args()
+    
+    backfill = SentimentBackfill(
+        args.model_ver,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        checkpoint=BackfillCheckpoint(args.checkpoint) if args.checkpoint else None,
+        force=args.force
+    )
+    await backfill.run(settings.database_url)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,151 +1,696 @@
 """스케줄러 워커"""
 import asyncio
-import asyncpg
 import sys
 import os
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Dict, Optional, Tuple
 
 # 공통 모듈 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../shared'))
 from config.settings import settings
+from database.connection import create_db_pool
 
 # 서비스 모듈 경로 추가
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../ingestor/src'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../nlp-service/src'))
 
 from collectors.rss_collector import RSSCollector
+from collectors.feed_cache import FeedSnapshotCache
+from collectors.feed_state import DatabaseFeedStateStore, FileFeedStateStore
 from processors.deduplicator import Deduplicator
+from processors.dedup_store import RotatingBloomFilter
+from processors.keyword_matcher import KeywordMatcher, normalize_keyword
+from processors.simhash_index import SimhashIndex, DatabaseSimhashIndexStore
+from intent.keyword_intent import KeywordIntentExpander
+from sentiment.cache import SentimentCache, DatabaseSentimentLookup
+from sentiment.registry import SentimentAnalyzerRegistry, UNSUPPORTED_MODEL_VERSION, unsupported_sentiment
 from sentiment.rule_based import RuleBasedSentimentAnalyzer
+from text_processing.normalized_text import NormalizedText
+
+# 감성 분석 어댑터 모듈 경로 추가
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../api-gateway/src/services'))
+from nlp_service_adapters import create_sentiment_adapter
+
+# 워커 단계 모듈 경로 추가
+sys.path.append(os.path.dirname(__file__))
+from article_writer import ArticleBatchWriter
+from crawl_checkpoint import DatabaseCrawlCheckpointStore
 
 
 class CrawlerWorker:
     """크롤러 워커 클래스"""
     
-    def __init__(self):
-        self.rss_collector = RSSCollector()
-        self.deduplicator = Deduplicator()
+    def __init__(self, force_rescore: Optional[bool] = None):
+        self.rss_collector = RSSCollector(
+            timeout=settings.rss_fetch_timeout_seconds,
+            max_connections=settings.rss_fetch_max_connections,
+            max_connections_per_host=settings.rss_fetch_max_connections_per_host,
+            watermark_lookback=timedelta(hours=settings.feed_watermark_lookback_hours),
+            parser_backend=settings.rss_parser_backend
+        )
+        # 실행 간/소스 간 근사 중복 판별용 SimHash 인덱스 (작업 시작 시 DB에서 증분 로드)
+        self.near_duplicate_index = (
+            SimhashIndex(settings.near_duplicate_max_distance)
+            if settings.near_duplicate_enabled else None
+        )
+        # 최근 본 URL/제목 지문 (세대 교체형 Bloom 필터, 장시간 실행해도 메모리 고정)
+        self.deduplicator = Deduplicator(
+            self.near_duplicate_index,
+            seen_urls=self.create_dedup_store(),
+            seen_hashes=self.create_dedup_store()
+        )
+        # 키워드 동의어/표기 변형 확장 (매처 컴파일 시 패턴으로 추가, 키워드별 캐시)
+        self.keyword_expander = (
+            KeywordIntentExpander() if settings.keyword_synonym_expansion else None
+        )
+        # 감성 분석 어댑터 (워커 프로세스 내 분석 또는 원격 nlp-service에 배치 요청)
+        self.sentiment_adapter = create_sentiment_adapter(
+            settings.nlp_backend,
+            settings.nlp_service_url,
+            max_batch_size=settings.nlp_batch_size,
+            max_wait_ms=settings.nlp_batch_max_wait_ms
+        )
+        # 언어별 감성 분석기 (어댑터 준비 후 등록, 분석기가 없는 언어의 기사는 감성 분석 생략)
+        self.sentiment_analyzers = SentimentAnalyzerRegistry()
+        self.sentiment_adapter_opened = False
+        # 내용 해시 계산용 (전처리 규칙은 언어/분석 백엔드와 무관)
         self.sentiment_analyzer = RuleBasedSentimentAnalyzer()
+        # 내용 해시/모델 버전별 분석 결과 캐시 (같은 제목/요약의 신디케이션 기사 재사용)
+        self.sentiment_cache = SentimentCache(settings.sentiment_cache_size)
+        self.sentiment_cache_db_lookup = settings.sentiment_cache_db_lookup
+        self.sentiment_db_hits = 0
+        # True면 내용/모델 버전이 같아도 감성 분석을 다시 수행 (사전 변경 배포 시)
+        self.force_rescore = (
+            settings.sentiment_force_rescore if force_rescore is None else force_rescore
+        )
+        self.article_writer = ArticleBatchWriter(settings.crawl_write_batch_size)
+        # 일부 키워드 수집 작업이 공유하는 피드 스냅샷 (조건부 요청 검증자와 파싱된 항목)
+        self.feed_snapshot_cache = FeedSnapshotCache(settings.feed_snapshot_max_age_seconds)
     
-    async def crawl_keyword(self, keyword_id: str, keyword_text: str, db_conn):
-        """키워드별 기사 수집 및 처리"""
-        print(f"키워드 수집 시작: {keyword_text} (ID: {keyword_id})")
-        
-        # RSS 소스에서 기사 수집
-        all_articles = []
-        for rss_url in settings.rss_sources:
-            articles = self.rss_collector.collect_from_rss(rss_url)
-            # 키워드 매칭 필터링
-            matched_articles = [
-                article for article in articles
-                if keyword_text.lower() in article['title'].lower() or
-                   keyword_text.lower() in article.get('snippet', '').lower()
-            ]
-            all_articles.extend(matched_articles)
-        
-        # 중복 제거
-        unique_articles = self.deduplicator.filter_duplicates(all_articles)
-        
-        # 데이터베이스에 저장
-        saved_count = 0
-        for article in unique_articles:
-            try:
-                # 기사 저장 또는 조회
-                article_id = await db_conn.fetchval(
-                    """
-                    INSERT INTO articles (url, title, snippet, source, published_at, lang)
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                    ON CONFLICT (url) DO UPDATE SET title = EXCLUDED.title
-                    RETURNING id
-                    """,
-                    article['url'],
-                    article['title'],
-                    article.get('snippet', ''),
-                    article.get('source', ''),
-                    article.get('published_at'),
-                    article.get('lang', 'ko')
-                )
-                
-                # 키워드-기사 매핑 저장
-                await db_conn.execute(
-                    """
-                    INSERT INTO keyword_articles (keyword_id, article_id, match_score, match_type)
-                    VALUES ($1, $2, 1.0, 'exact')
-                    ON CONFLICT (keyword_id, article_id) DO NOTHING
-                    """,
-                    keyword_id, article_id
-                )
-                
-                # 감성 분석 수행
-                sentiment_result = self.sentiment_analyzer.analyze(
-                    article['title'],
-                    article.get('snippet', '')
-                )
-                
-                # 감성 분석 결과 저장
-                await db_conn.execute(
-                    """
-                    INSERT INTO sentiments (article_id, label, score, rationale, model_ver)
-                    VALUES ($1, $2, $3, $4, 'rule-based-v1')
-                    ON CONFLICT (article_id) DO UPDATE SET
-                        label = EXCLUDED.label,
-                        score = EXCLUDED.score,
-                        rationale = EXCLUDED.rationale
-                    """,
-                    article_id,
-                    sentiment_result['label'],
-                    sentiment_result['score'],
-                    sentiment_result['rationale']
+    def create_dedup_store(self) -> RotatingBloomFilter:
+        """설정에 따른 완전 중복 판별 저장소 생성"""
+        return RotatingBloomFilter(
+            generation_seconds=settings.dedup_generation_hours * 3600,
+            generations=settings.dedup_generations,
+            capacity=settings.dedup_generation_capacity,
+            error_rate=settings.dedup_false_positive_rate
+        )
+    
+    def create_feed_state_store(self, db_conn):
+        """설정에 따른 피드 상태 저장소 생성"""
+        if settings.feed_state_store == 'database':
+            return DatabaseFeedStateStore(db_conn)
+        if settings.feed_state_store == 'file':
+            return FileFeedStateStore(settings.feed_state_path)
+        return None
+    
+    async def collect_feed_snapshot(
+        self,
+        feed_states: Optional[Dict[str, Dict]] = None,
+        feed_cache: Optional[FeedSnapshotCache] = None
+    ) -> List[Dict]:
+        """모든 RSS 소스를 한 번씩 수집한 작업 단위 피드 스냅샷 생성"""
+        # RSS 소스에서 기사 수집 (모든 소스를 동시에 수집)
+        feeds = await self.rss_collector.collect_many(settings.rss_sources, feed_states, feed_cache)
+        
+        snapshot = []
+        for articles in feeds.values():
+            snapshot.extend(articles)
+        
+        stats = self.rss_collector.last_run_stats
+        print(
+            f"피드 스냅샷 수집 완료: {stats['sources']}개 소스 "
+            f"(수집 {stats['fetched']}, 변경 없음 {stats['not_modified']}, "
+            f"캐시 재사용 {stats['cached']}, 실패 {stats['failed']}), 새 기사 {len(snapshot)}개 "
+            f"(이미 수집 {stats['skipped_seen']}개 제외)"
+        )
+        return snapshot
+    
+    def match_snapshot(
+        self,
+        matcher: KeywordMatcher,
+        snapshot: List[Dict]
+    ) -> Dict[str, List[Dict]]:
+        """스냅샷의 각 기사를 한 번씩 훑어 키워드별 매칭 기사 목록 생성
+        
+        매칭 기사에는 match_type, match_score가 함께 기록된다.
+        """
+        matched_by_keyword: Dict[str, List[Dict]] = {}
+        for article in snapshot:
+            for keyword_id, match in matcher.match(article).items():
+                matched_by_keyword.setdefault(keyword_id, []).append({**article, **match})
+        return matched_by_keyword
+    
+    def seen_until_by_group(self, keywords: List) -> Dict[str, Optional[datetime]]:
+        """텍스트 묶음별로 이미 수집한 시점 (묶음 키워드의 가장 오래된 last_crawled_at, 수집된 적 없으면 None)"""
+        seen_until: Dict[str, Optional[datetime]] = {}
+        for keyword in keywords:
+            key = normalize_keyword(keyword['text'])
+            crawled_at = keyword['last_crawled_at']
+            if key not in seen_until:
+                seen_until[key] = crawled_at
+            elif seen_until[key] is not None:
+                seen_until[key] = None if crawled_at is None else min(seen_until[key], crawled_at)
+        return seen_until
+    
+    def filter_unseen(self, articles: List[Dict], crawled_at: Optional[datetime]) -> List[Dict]:
+        """crawled_at - lookback 이후에 발행된 기사 (발행 시각이 없는 항목은 남김)"""
+        if crawled_at is None:
+            return articles
+        cutoff = crawled_at - timedelta(hours=settings.feed_watermark_lookback_hours)
+        return [
+            article for article in articles
+            if article.get('published_at') is None or article['published_at'] > cutoff
+        ]
+    
+    def filter_seen_articles(
+        self,
+        matched_by_keyword: Dict[str, List[Dict]],
+        seen_until: Dict[str, Optional[datetime]]
+    ) -> Dict[str, List[Dict]]:
+        """묶음별 워터마크 적용: 마지막 수집 시점 - lookback 이전에 발행된 기사 제외
+        
+        일부 키워드 수집 작업은 전역 피드 워터마크를 쓸 수 없으므로 피드 전체 항목에서
+        각 묶음이 이미 본 구간을 키워드의 last_crawled_at으로 걸러낸다.
+        (다시 저장되는 기사가 있어도 키워드 매핑만 추가됨)
+        """
+        return {
+            key: self.filter_unseen(articles, seen_until.get(key))
+            for key, articles in matched_by_keyword.items()
+        }
+    
+    async def open_sentiment_adapter(self):
+        """감성 분석 어댑터를 준비하고 지원 언어를 레지스트리에 등록
+        
+        원격 서비스에 연결할 수 없으면 이번 실행은 감성 분석 없이 저장한다
+        (감성 분석이 없는 기사는 다음 실행에서 다시 분석됨).
+        """
+        if self.sentiment_adapter_opened:
+            return
+        self.sentiment_adapter_opened = True
+        
+        try:
+            await self.sentiment_adapter.open()
+        except Exception as e:
+            print(f"감성 분석 어댑터 준비 실패: {e}")
+            return
+        self.sentiment_analyzers.register(self.sentiment_adapter)
+    
+    async def close_sentiment_adapter(self):
+        """감성 분석 어댑터 종료 (다음 작업에서 다시 준비)"""
+        await self.sentiment_adapter.close()
+        self.sentiment_analyzers = SentimentAnalyzerRegistry()
+        self.sentiment_adapter_opened = False
+    
+    async def analyze_sentiments(
+        self,
+        analyzer,
+        items: List[Tuple[str, NormalizedText]],
+        db_conn
+    ) -> List[Dict]:
+        """(내용 해시, 정규화 텍스트) 목록의 감성 분석 결과
+        
+        내용 해시마다 한 번만 분석하고 메모리 캐시, sentiments 조회, 분석기 순으로 찾는다.
+        force_rescore면 캐시와 기존 결과를 쓰지 않고 모두 다시 분석한다.
+        """
+        if self.force_rescore:
+            return await analyzer.analyze_many([normalized for _, normalized in items])
+        
+        model_version = analyzer.model_version
+        results: Dict[str, Dict] = {}
+        missing: Dict[str, NormalizedText] = {}
+        for content_hash, normalized in items:
+            # 같은 요청 안의 동일 내용은 한 번만 조회
+            if content_hash in results or content_hash in missing:
+                continue
+            cached = self.sentiment_cache.get(content_hash, model_version)
+            if cached is not None:
+                results[content_hash] = cached
+            else:
+                missing[content_hash] = normalized
+        
+        if missing and self.sentiment_cache_db_lookup:
+            stored = await DatabaseSentimentLookup(db_conn).load(missing, model_version)
+            self.sentiment_db_hits += len(stored)
+            for content_hash, result in stored.items():
+                results[content_hash] = result
+                self.sentiment_cache.put(content_hash, model_version, result)
+                del missing[content_hash]
+        
+        if missing:
+            analyzed = await analyzer.analyze_many(list(missing.values()))
+            for content_hash, result in zip(missing, analyzed):
+                results[content_hash] = result
+                self.sentiment_cache.put(content_hash, model_version, result)
+        
+        return [results[content_hash] for content_hash, _ in items]
+    
+    def needs_sentiment(self, existing: Optional[Dict], content_hash: str, analyzer) -> bool:
+        """감성 분석(재분석) 필요 여부 (기사 언어의 분석기가 없으면 항상 False)"""
+        if analyzer is None:
+            return False
+        if self.force_rescore or not existing or not existing['has_sentiment']:
+            return True
+        return (
+            existing['content_hash'] != content_hash
+            or existing['model_ver'] != analyzer.model_version
+        )
+    
+    def needs_unsupported_sentiment(self, existing: Optional[Dict], content_hash: str) -> bool:
+        """분석기가 없는 언어의 기사에 중립 감성 행을 새로 써야 하는지 여부
+        
+        감성 행이 없거나 내용이 바뀐 기사만 쓰고, 이미 분석된 결과는 그대로 둔다.
+        """
+        if not existing or not existing['has_sentiment']:
+            return True
+        return existing['content_hash'] != content_hash
+    
+    async def crawl_keyword(
+        self,
+        keyword_id: str,
+        keyword_text: str,
+        db_conn,
+        matched_articles: Optional[List[Dict]] = None,
+        keyword_ids: Optional[List[str]] = None
+    ):
+        """키워드별 기사 수집 및 처리
+        
+        matched_articles가 주어지면 피드를 다시 수집하지 않고
+        작업 단위 매칭 결과를 그대로 저장한다.
+        keyword_ids가 주어지면 같은 텍스트를 가진 키워드 전체에 한 번의 처리 결과를 연결한다.
+        db_conn은 연결 또는 연결 풀 (풀이면 조회/배치 저장마다 연결을 빌려 씀)
+        """
+        keyword_ids = keyword_ids or [keyword_id]
+        print(f"키워드 수집 시작: {keyword_text} (ID: {keyword_id}, 같은 텍스트 키워드 {len(keyword_ids)}개)")
+        
+        await self.open_sentiment_adapter()
+        
+        if matched_articles is None:
+            snapshot = self.deduplicator.filter_duplicates(await self.collect_feed_snapshot())
+            matcher = KeywordMatcher([(keyword_id, keyword_text)], self.keyword_expander)
+            matched_articles = self.match_snapshot(matcher, snapshot).get(keyword_id, [])
+        
+        # 이미 저장된 기사 일괄 확인 (기존 기사는 키워드 매핑만 추가)
+        known = await self.article_writer.resolve_known_urls(
+            db_conn,
+            [article['url'] for article in matched_articles]
+        )
+        
+        # 새 기사와 내용/모델 버전이 바뀐 기사만 감성 분석 수행
+        records = []
+        # 분석기별 감성 분석 대상 (레코드, 정규화 텍스트)
+        pending_sentiment: Dict[object, List] = {}
+        new_count = 0
+        unsupported_count = 0
+        for article in matched_articles:
+            existing = known.get(article['url'])
+            # 수집기가 만든 정규화 텍스트를 해시/감성 분석에 재사용
+            normalized = article.get('normalized') or NormalizedText(
+                article['title'],
+                article.get('snippet', '')
+            )
+            content_hash = self.sentiment_analyzer.compute_normalized_hash(normalized)
+            record = {**article, 'keyword_ids': keyword_ids, 'content_hash': content_hash}
+            
+            if existing:
+                record['article_id'] = existing['id']
+                record['content_changed'] = (
+                    existing['has_sentiment'] and existing['content_hash'] != content_hash
                 )
-                
-                saved_count += 1
+            else:
+                new_count += 1
+            
+            # 기사 언어의 분석기로 라우팅
+            analyzer = self.sentiment_analyzers.get(article.get('lang'))
+            if analyzer is None:
+                # 감성 행이 없으면 조회 API(sentiments INNER JOIN)에서 기사가 빠지므로 중립 결과 저장
+                unsupported_count += 1
+                if self.needs_unsupported_sentiment(existing, content_hash):
+                    record['sentiment'] = unsupported_sentiment(article.get('lang'))
+                    record['model_ver'] = UNSUPPORTED_MODEL_VERSION
+            elif self.needs_sentiment(existing, content_hash, analyzer):
+                pending_sentiment.setdefault(analyzer, []).append((record, normalized))
             
+            records.append(record)
+        
+        # 분석기별로 한 번에 요청 (원격 백엔드는 마이크로 배치로 묶여 전송, 같은 내용은 캐시 재사용)
+        for analyzer, items in pending_sentiment.items():
+            try:
+                results = await self.analyze_sentiments(
+                    analyzer,
+                    [(record['content_hash'], normalized) for record, normalized in items],
+                    db_conn
+                )
             except Exception as e:
-                print(f"기사 저장 오류: {e}")
+                # 감성 분석 없이 저장 (다음 실행에서 다시 분석)
+                print(f"감성 분석 오류 ({len(items)}건): {e}")
                 continue
+            for (record, _), result in zip(items, results):
+                record['sentiment'] = result
+                record['model_ver'] = analyzer.model_version
+        
+        # 데이터베이스에 배치 단위로 저장
+        # (배치가 하나라도 실패하면 ArticleWriteError로 키워드 수집 실패 처리, last_crawled_at 유지)
+        article_ids = await self.article_writer.write(db_conn, records)
+        saved_count = len(article_ids)
         
-        # 키워드의 last_crawled_at 업데이트
+        # 키워드의 last_crawled_at 업데이트 (같은 텍스트 키워드 전체)
         await db_conn.execute(
-            "UPDATE keywords SET last_crawled_at = NOW() WHERE id = $1",
-            keyword_id
+            "UPDATE keywords SET last_crawled_at = NOW() WHERE id = ANY($1::uuid[])",
+            keyword_ids
         )
         
-        print(f"키워드 수집 완료: {keyword_text} - {saved_count}개 기사 저장")
+        print(
+            f"키워드 수집 완료: {keyword_text} - {saved_count}개 기사 저장 "
+            f"(신규 {new_count}개, 기존 {len(records) - new_count}개, "
+            f"감성 분석 미지원 언어 {unsupported_count}개)"
+        )
         return saved_count
     
-    async def run_crawl_job(self):
-        """크롤링 작업 실행"""
+    def group_keywords(self, keywords: List) -> List[Dict]:
+        """활성 키워드를 매칭 형태가 같은 텍스트별로 묶음 (처음 나온 순서 유지)
+        
+        여러 사용자가 같은 키워드를 등록해도 매칭/중복 제거/감성 분석은 텍스트당 한 번만 하고
+        저장할 때 keyword_articles에 묶음의 모든 키워드 ID를 한 번에 연결한다.
+        묶음의 id/last_crawled_at은 첫 키워드 기준이다 (진행 커서 기록용).
+        """
+        groups: Dict[str, Dict] = {}
+        for keyword in keywords:
+            key = normalize_keyword(keyword['text'])
+            group = groups.get(key)
+            if group is None:
+                groups[key] = {
+                    'key': key,
+                    'id': keyword['id'],
+                    'text': keyword['text'],
+                    'last_crawled_at': keyword.get('last_crawled_at'),
+                    'keyword_ids': [str(keyword['id'])]
+                }
+            else:
+                group['keyword_ids'].append(str(keyword['id']))
+        return list(groups.values())
+    
+    async def crawl_keywords(
+        self,
+        groups: List[Dict],
+        db_pool,
+        matched_by_keyword: Dict[str, List[Dict]],
+        deadline: Optional[float] = None,
+        on_progress=None
+    ) -> Tuple[int, int, List[str]]:
+        """키워드 묶음(group_keywords)을 순서대로 동시에 최대 crawl_keyword_concurrency개씩 처리
+        
+        묶음마다 풀에서 연결을 빌려 짧은 트랜잭션(배치 저장)으로 처리하며
+        한 묶음의 실패는 다른 묶음에 영향을 주지 않는다.
+        deadline(이벤트 루프 시각)이 지나거나 지금까지 가장 오래 걸린 묶음만큼의 시간도 남지 않으면
+        새 묶음을 시작하지 않고 진행 중인 묶음만 마친다.
+        on_progress(group)는 앞선 묶음이 모두 끝난 마지막 묶음으로 호출된다 (진행 커서 기록용).
+        
+        반환값: (성공한 키워드 수, 시작한 묶음 수, 실패한 키워드 ID 목록)
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max(settings.crawl_keyword_concurrency, 1))
+        progress_lock = asyncio.Lock()
+        finished = [False] * len(groups)
+        # 아직 끝나지 않은 첫 묶음 위치 / 마지막으로 기록한 위치
+        first_unfinished = 0
+        recorded = 0
+        succeeded = 0
+        failed_keyword_ids: List[str] = []
+        # 가장 오래 걸린 묶음 처리 시간 (예산 안에 끝나지 않을 묶음을 시작하지 않도록)
+        longest = 0.0
+        
+        async def crawl_one(index: int, group: Dict):
+            nonlocal first_unfinished, recorded, succeeded, longest
+            started_at = loop.time()
+            try:
+                await self.crawl_keyword(
+                    str(group['id']),
+                    group['text'],
+                    db_pool,
+                    matched_by_keyword.get(group['key'], []),
+                    group['keyword_ids']
+                )
+                succeeded += len(group['keyword_ids'])
+            except Exception as e:
+                print(f"키워드 수집 오류 ({group['text']}): {e}")
+                failed_keyword_ids.extend(group['keyword_ids'])
+            finally:
+                longest = max(longest, loop.time() - started_at)
+                semaphore.release()
+            
+            finished[index] = True
+            while first_unfinished < len(finished) and finished[first_unfinished]:
+                first_unfinished += 1
+            if on_progress is None:
+                return
+            
+            # 완료 순서가 뒤바뀌어도 커서가 뒤로 가지 않도록 순서대로 기록
+            async with progress_lock:
+                position = first_unfinished
+                if position <= recorded:
+                    return
+                try:
+                    await on_progress(groups[position - 1])
+                    recorded = position
+                except Exception as e:
+                    print(f"진행 위치 기록 오류: {e}")
+        
+        tasks = []
+        for index, group in enumerate(groups):
+            await semaphore.acquire()
+            if deadline is not None and loop.time() + longest >= deadline:
+                semaphore.release()
+                print(f"시간 예산 소진: 남은 키워드 {len(groups) - index}종은 다음 실행에서 이어서 처리")
+                break
+            tasks.append(asyncio.create_task(crawl_one(index, group)))
+        
+        await asyncio.gather(*tasks)
+        return succeeded, len(tasks), failed_keyword_ids
+    
+    async def run_crawl_job(
+        self,
+        time_budget_seconds: Optional[float] = None,
+        keyword_ids: Optional[List[str]] = None,
+        db_pool=None
+    ) -> Dict:
+        """크롤링 작업 실행
+        
+        time_budget_seconds가 주어지면 체크포인트 모드로 실행한다 (서버리스 Cron용).
+        - 오래 수집되지 않은 키워드부터 처리하고 처리를 마친 위치를 crawl_checkpoints에 기록
+        - 예산은 피드 수집부터 계산하며, 피드 수집이 예산을 넘기면 아무것도 저장하지 않고 실패
+        - 예산이 지나면 새 키워드를 시작하지 않고 진행 중인 키워드만 마친 뒤 종료
+        - 다음 호출은 기록된 위치부터 이어서 처리하고 남은 키워드가 없으면 라운드를 마침
+        
+        keyword_ids가 주어지면 해당 활성 키워드만 수집한다 (적응형 스케줄러/작업 큐의 키워드).
+        다른 키워드가 아직 받지 못한 기사를 건너뛰지 않도록 전역 피드 워터마크는 쓰지 않고
+        프로세스 공유 피드 스냅샷(feed_snapshot_cache: 조건부 요청, 304면 재파싱 없음)의 전체 항목에
+        묶음별 워터마크(키워드의 last_crawled_at - lookback)를 적용한다.
+        
+        db_pool이 주어지면 작업마다 풀을 만들지 않고 호출자의 풀을 쓴다 (장시간 실행 프로세스용).
+        
+        반환값: {'keywords': 대상 키워드 수, 'succeeded', 'failed_keyword_ids', 'remaining', 'round_completed'}
+        """
         print(f"크롤링 작업 시작: {datetime.now()}")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + time_budget_seconds if time_budget_seconds is not None else None
         
-        # 데이터베이스 연결
-        conn = await asyncpg.connect(settings.database_url)
+        # 데이터베이스 연결 풀 (키워드 동시 처리 수만큼 연결을 나눠 씀)
+        pool = db_pool or await create_db_pool(
+            settings.database_url,
+            min_size=1,
+            max_size=settings.crawl_db_pool_size,
+            application_name="onmi-crawler"
+        )
         
+        deduplicator = self.deduplicator
         try:
-            # 활성 키워드 조회
-            keywords = await conn.fetch(
-                """
-                SELECT id, text FROM keywords WHERE status = 'active'
-                """
-            )
+            checkpoint_store = None
+            checkpoint = None
+            round_started = False
+            if deadline is not None:
+                # 진행 중인 라운드가 있으면 이어서, 없으면 새 라운드 시작
+                checkpoint_store = DatabaseCrawlCheckpointStore(pool)
+                checkpoint = await checkpoint_store.load()
+                if checkpoint is not None:
+                    print(f"이전 라운드 이어서 수집 (라운드 시작: {checkpoint['round_started_at']})")
+                else:
+                    checkpoint = await checkpoint_store.start_round()
+                    round_started = True
+                keywords = await checkpoint_store.fetch_pending_keywords(checkpoint)
+            elif keyword_ids is not None:
+                keywords = await pool.fetch(
+                    """
+                    SELECT id, text, last_crawled_at
+                    FROM keywords
+                    WHERE status = 'active' AND id = ANY($1::uuid[])
+                    """,
+                    keyword_ids
+                )
+            else:
+                # 활성 키워드 조회
+                keywords = await pool.fetch(
+                    """
+                    SELECT id, text FROM keywords WHERE status = 'active'
+                    """
+                )
             
-            print(f"수집 대상 키워드 수: {len(keywords)}")
+            # 같은 텍스트의 키워드는 한 번만 처리하고 결과를 모든 키워드에 연결
+            groups = self.group_keywords(keywords)
+            print(f"수집 대상 키워드 수: {len(keywords)} (고유 텍스트 {len(groups)}개)")
             
-            # 각 키워드별 수집
-            for keyword in keywords:
+            # 라운드 중간 호출/일부 키워드 수집은 앞선 작업이 저장한 기사도 이번 키워드에 연결해야 하므로
+            # 이번 작업 전용 중복 제거기를 쓰고 근사 중복은 이번 키워드가 이미 본 시점 이전의 지문과만 비교
+            # (라운드 시작 시각, 또는 키워드의 가장 오래된 마지막 수집 시각)
+            near_duplicate_index = self.near_duplicate_index
+            fingerprints_before = None
+            if checkpoint is not None or keyword_ids is not None:
+                if checkpoint is not None:
+                    fingerprints_before = checkpoint['round_started_at']
+                else:
+                    crawled_at = [keyword['last_crawled_at'] for keyword in keywords]
+                    if crawled_at and None not in crawled_at:
+                        fingerprints_before = min(crawled_at)
+                near_duplicate_index = (
+                    SimhashIndex(settings.near_duplicate_max_distance)
+                    if settings.near_duplicate_enabled and fingerprints_before is not None else None
+                )
+                deduplicator = Deduplicator(
+                    near_duplicate_index,
+                    seen_urls=self.create_dedup_store(),
+                    seen_hashes=self.create_dedup_store()
+                )
+            
+            # 소스별 조건부 요청 검증자 조회
+            feed_state_store = self.create_feed_state_store(pool) if keyword_ids is None else None
+            feed_states = None
+            if feed_state_store and keywords:
+                feed_states = await feed_state_store.load(settings.rss_sources)
+            
+            # 최근 기사 지문을 근사 중복 인덱스에 증분 로드
+            near_duplicate_store = None
+            if near_duplicate_index is not None and keywords:
+                near_duplicate_store = DatabaseSimhashIndexStore(
+                    pool,
+                    settings.near_duplicate_window_days
+                )
+                loaded = await near_duplicate_store.load(near_duplicate_index, fingerprints_before)
+                print(f"근사 중복 인덱스 로드: {loaded}개 추가 (총 {len(near_duplicate_index)}개)")
+            
+            # 피드는 작업당 한 번만 수집하고 모든 키워드가 공유
+            snapshot = []
+            seen_until = None
+            if keywords and keyword_ids is not None:
+                seen_until = self.seen_until_by_group(keywords)
+                snapshot = await self.collect_feed_snapshot(feed_cache=self.feed_snapshot_cache)
+                # 모든 묶음이 이미 본 구간은 중복 제거/매칭 전에 제외
+                snapshot = self.filter_unseen(
+                    snapshot,
+                    None if None in seen_until.values() else min(seen_until.values())
+                )
+            elif keywords and deadline is not None:
                 try:
-                    await self.crawl_keyword(
-                        str(keyword['id']),
-                        keyword['text'],
-                        conn
+                    snapshot = await asyncio.wait_for(
+                        self.collect_feed_snapshot(feed_states),
+                        max(deadline - loop.time(), 0)
                     )
-                except Exception as e:
-                    print(f"키워드 수집 오류 ({keyword['text']}): {e}")
-                    continue
+                except asyncio.TimeoutError:
+                    raise RuntimeError("시간 예산 안에 피드 수집을 마치지 못했습니다")
+            elif keywords:
+                snapshot = await self.collect_feed_snapshot(feed_states)
+            if round_started and feed_states:
+                # 라운드의 모든 키워드가 보게 되는 지점은 첫 호출에서 받은 피드까지
+                await checkpoint_store.save_feed_states(feed_states)
+            
+            # 중복 제거는 매칭 전에 스냅샷 단위로 한 번만 수행
+            # (여러 키워드에 매칭된 기사도 모든 키워드에 연결되도록)
+            # 새 기사 기록은 키워드 저장이 끝난 뒤 커밋된 기사만 반영
+            snapshot = deduplicator.filter_duplicates(snapshot, defer=True)
+            
+            # 고유 키워드 텍스트 전체를 하나의 매처로 컴파일해 기사당 한 번만 매칭
+            matcher = KeywordMatcher(
+                [(group['key'], group['text']) for group in groups],
+                self.keyword_expander
+            )
+            matched_by_keyword = self.match_snapshot(matcher, snapshot)
+            if seen_until is not None:
+                matched_by_keyword = self.filter_seen_articles(matched_by_keyword, seen_until)
+            
+            # 동시 처리 전에 감성 분석 어댑터를 한 번 준비 (모든 키워드가 같은 분석기 사용)
+            if keywords:
+                await self.open_sentiment_adapter()
+            
+            # 키워드 동시 수집 (체크포인트 모드면 예산 안에서 시작한 키워드까지)
+            succeeded, started, failed_keyword_ids = await self.crawl_keywords(
+                groups,
+                pool,
+                matched_by_keyword,
+                deadline,
+                checkpoint_store.save_position if checkpoint_store else None
+            )
+            remaining = sum(len(group['keyword_ids']) for group in groups[started:])
+            print(
+                f"키워드 처리 결과: 성공 {succeeded}개, "
+                f"실패 {len(keywords) - remaining - succeeded}개, 남은 키워드 {remaining}개"
+            )
+            
+            round_completed = remaining == 0
+            
+            # 실패했거나 시작하지 못한 키워드 묶음의 기사는 중복 판별/지문에 기록하지 않음
+            # (다음 실행에서 다시 받아 저장하고, 그 지문이 재시도 때 다른 소스 사본을 막지 않도록)
+            failed = set(failed_keyword_ids)
+            uncommitted_urls = {
+                article['url']
+                for index, group in enumerate(groups)
+                if index >= started or failed.intersection(group['keyword_ids'])
+                for article in matched_by_keyword.get(group['key'], [])
+            }
+            deduplicator.commit(uncommitted_urls)
+            
+            # 검증자/워터마크는 모든 키워드의 기사가 커밋된 뒤에만 저장
+            # (실패한 키워드/배치의 기사를 다음 실행에서 이미 본 항목으로 걸러내지 않도록)
+            # 체크포인트 모드는 라운드를 마쳤을 때 라운드 첫 호출의 상태를 저장
+            # (남은 키워드가 다음 호출에서도 같은 기사를 받도록, 중간에 중단되면 다음 실행에서 전체 재수집)
+            states_to_save = None
+            if checkpoint_store:
+                if failed_keyword_ids:
+                    await checkpoint_store.record_failures(len(failed_keyword_ids))
+                if round_completed:
+                    states_to_save = await checkpoint_store.finish_round()
+            elif not failed_keyword_ids:
+                states_to_save = feed_states
+            if feed_state_store and states_to_save:
+                await feed_state_store.save(states_to_save)
+            elif feed_state_store and feed_states and failed_keyword_ids:
+                print(f"수집 실패 키워드 {len(failed_keyword_ids)}개: 피드 상태를 저장하지 않음 (다음 실행에서 다시 수집)")
+            if near_duplicate_store:
+                await near_duplicate_store.save(near_duplicate_index.drain_pending())
+                await near_duplicate_store.prune()
         
         finally:
-            await conn.close()
+            await self.close_sentiment_adapter()
+            if db_pool is None:
+                await pool.close()
         
+        cache_stats = self.sentiment_cache.stats()
+        print(
+            f"감성 분석 캐시: 적중 {cache_stats['hits']}, DB 적중 {self.sentiment_db_hits}, "
+            f"실패 {cache_stats['misses']} (캐시 크기 {cache_stats['size']})"
+        )
+        for name, dedup_stats in deduplicator.stats().items():
+            print(
+                f"중복 판별 저장소({name}): {dedup_stats['items']}개, 세대 {dedup_stats['generations']}개, "
+                f"메모리 {dedup_stats['memory_bytes'] / 1024:.0f}KB, "
+                f"예상 오탐률 {dedup_stats['false_positive_rate']:.4%}"
+            )
         print(f"크롤링 작업 완료: {datetime.now()}")
+        return {
+            'keywords': len(keywords),
+            'succeeded': succeeded,
+            'failed_keyword_ids': failed_keyword_ids,
+            'remaining': remaining,
+            'round_completed': round_completed
+        }
 
 
 async def main():
@@ -0,0 +1,6 @@
+"""scheduler 테스트 공통 설정"""
+import os
+import sys
+
+# 서비스 모듈 경로 추가 (scheduler/src의 모듈을 직접 import)
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
@@ -0,0 +1,236 @@
+"""DatabaseCrawlTaskQueue 상태 전이 테스트
+
+crawl_tasks 테이블을 메모리로 흉내 내는 가짜 연결로 큐가 보내는 각 쿼리의 결과를 재현한다.
+(pending -> leased -> 삭제 / pending(재시도) / dead, 임대 만료 후 다른 워커의 재임대)
+"""
+import asyncio
+
+import pytest
+
+from crawl_queue import DatabaseCrawlTaskQueue
+
+
+class FakeCrawlTasksConnection:
+    """crawl_tasks 쿼리를 메모리 행으로 처리하는 가짜 연결 (시각은 now 초 단위로 직접 조정)"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.rows = {}
+        self.next_id = 1
+    
+    def _active_keys(self):
+        return {row['keyword_key'] for row in self.rows.values() if row['status'] in ('pending', 'leased')}
+    
+    def _lease_expired(self, row):
+        return row['status'] == 'leased' and row['lease_expires_at'] < self.now
+    
+    async def execute(self, query, *args):
+        if "SET status = 'dead'" in query:
+            (max_attempts,) = args
+            for row in self.rows.values():
+                if self._lease_expired(row) and row['attempts'] >= max_attempts:
+                    row.update(status='dead', lease_owner=None, lease_expires_at=None)
+                    row['last_error'] = row['last_error'] or '임대 만료'
+            return
+        raise AssertionError(f"예상하지 못한 쿼리: {query}")
+    
+    async def fetch(self, query, *args):
+        if 'INSERT INTO crawl_tasks' in query:
+            (keys,) = args
+            inserted = []
+            for key in dict.fromkeys(keys):
+                if key in self._active_keys():
+                    continue
+                row = {
+                    'id': self.next_id, 'keyword_key': key, 'status': 'pending', 'attempts': 0,
+                    'available_at': self.now, 'lease_owner': None, 'lease_expires_at': None,
+                    'last_error': None
+                }
+                self.rows[self.next_id] = row
+                self.next_id += 1
+                inserted.append({'id': row['id']})
+            return inserted
+        
+        if 'WITH claimable' in query:
+            worker_id, limit, lease_seconds = args
+            claimable = sorted(
+                (
+                    row for row in self.rows.values()
+                    if (row['status'] == 'pending' and row['available_at'] <= self.now)
+                    or self._lease_expired(row)
+                ),
+                key=lambda row: (row['available_at'], row['id'])
+            )[:limit]
+            for row in claimable:
+                row.update(
+                    status='leased',
+                    lease_owner=worker_id,
+                    lease_expires_at=self.now + lease_seconds,
+                    attempts=row['attempts'] + 1
+                )
+            return [
+                {'id': row['id'], 'keyword_key': row['keyword_key'], 'attempts': row['attempts']}
+                for row in claimable
+            ]
+        
+        if 'SET lease_expires_at' in query:
+            task_ids, worker_id, lease_seconds = args
+            renewed = []
+            for row in self._owned(task_ids, worker_id):
+                row['lease_expires_at'] = self.now + lease_seconds
+                renewed.append({'id': row['id']})
+            return renewed
+        
+        if 'DELETE FROM crawl_tasks' in query:
+            task_ids, worker_id = args
+            deleted = [{'id': row['id']} for row in self._owned(task_ids, worker_id)]
+            for row in deleted:
+                del self.rows[row['id']]
+            return deleted
+        
+        if 'CASE WHEN attempts' in query:
+            task_ids, worker_id, max_attempts, base, maximum, error = args
+            updated = []
+            for row in self._owned(task_ids, worker_id):
+                row.update(
+                    status='dead' if row['attempts'] >= max_attempts else 'pending',
+                    available_at=self.now + min(base * 2 ** max(row['attempts'] - 1, 0), maximum),
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    last_error=error
+                )
+                updated.append({'status': row['status']})
+            return updated
+        
+        if 'GROUP BY status' in query:
+            counts = {}
+            for row in self.rows.values():
+                counts[row['status']] = counts.get(row['status'], 0) + 1
+            return [{'status': status, 'count': count} for status, count in counts.items()]
+        
+        raise AssertionError(f"예상하지 못한 쿼리: {query}")
+    
+    def _owned(self, task_ids, worker_id):
+        return [
+            self.rows[task_id] for task_id in task_ids
+            if task_id in self.rows
+            and self.rows[task_id]['lease_owner'] == worker_id
+            and self.rows[task_id]['status'] == 'leased'
+        ]
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def conn():
+    return FakeCrawlTasksConnection()
+
+
+def make_queue(conn, worker_id='w1', **kwargs):
+    options = dict(lease_seconds=300, max_attempts=3, retry_base_seconds=60, retry_max_seconds=100)
+    options.update(kwargs)
+    return DatabaseCrawlTaskQueue(conn, worker_id, **options)
+
+
+def test_enqueue_skips_active_duplicates(conn):
+    queue = make_queue(conn)
+    
+    assert run(queue.enqueue(['ai', 'ai', '반도체'])) == 2
+    assert run(queue.enqueue(['ai', 'ev'])) == 1
+    assert run(queue.enqueue([])) == 0
+    assert run(queue.stats()) == {'pending': 3, 'leased': 0, 'dead': 0}
+
+
+def test_claim_leases_each_task_once(conn):
+    first, second = make_queue(conn, 'w1'), make_queue(conn, 'w2')
+    run(first.enqueue(['a', 'b', 'c']))
+    
+    claimed = run(first.claim(2))
+    
+    assert [task['keyword_key'] for task in claimed] == ['a', 'b']
+    assert all(task['attempts'] == 1 for task in claimed)
+    assert [task['keyword_key'] for task in run(second.claim(10))] == ['c']
+    assert run(second.claim(10)) == []
+
+
+def test_complete_deletes_and_allows_requeue(conn):
+    queue = make_queue(conn)
+    run(queue.enqueue(['a']))
+    task_ids = [task['id'] for task in run(queue.claim(10))]
+    
+    assert run(queue.complete(task_ids)) == 1
+    assert run(queue.stats()) == {'pending': 0, 'leased': 0, 'dead': 0}
+    assert run(queue.enqueue(['a'])) == 1
+
+
+def test_fail_backs_off_then_dead_letters(conn):
+    queue = make_queue(conn)
+    run(queue.enqueue(['a']))
+    
+    task_ids = [task['id'] for task in run(queue.claim(10))]
+    assert run(queue.fail(task_ids, 'error')) == {'retry': 1, 'dead': 0}
+    # 첫 재시도 대기 60초 전에는 가져갈 수 없음
+    conn.now = 59
+    assert run(queue.claim(10)) == []
+    
+    conn.now = 60
+    task_ids = [task['id'] for task in run(queue.claim(10))]
+    assert run(queue.fail(task_ids, 'error')) == {'retry': 1, 'dead': 0}
+    # 두 번째 대기는 120초지만 retry_max_seconds(100초)로 제한
+    assert conn.rows[task_ids[0]]['available_at'] == 160
+    
+    conn.now = 160
+    tasks = run(queue.claim(10))
+    assert tasks[0]['attempts'] == 3
+    assert run(queue.fail([tasks[0]['id']], 'error')) == {'retry': 0, 'dead': 1}
+    
+    conn.now = 10000
+    assert run(queue.claim(10)) == []
+    assert run(queue.stats()) == {'pending': 0, 'leased': 0, 'dead': 1}
+    # dead 작업은 같은 텍스트의 새 작업을 막지 않음
+    assert run(queue.enqueue(['a'])) == 1
+
+
+def test_expired_lease_is_reclaimed_by_other_worker(conn):
+    first, second = make_queue(conn, 'w1'), make_queue(conn, 'w2')
+    run(first.enqueue(['a']))
+    task_ids = [task['id'] for task in run(first.claim(10))]
+    
+    conn.now = 301
+    reclaimed = run(second.claim(10))
+    
+    assert [task['id'] for task in reclaimed] == task_ids
+    assert reclaimed[0]['attempts'] == 2
+    # 임대를 잃은 워커의 완료/실패/연장은 무시됨
+    assert run(first.heartbeat(task_ids)) == task_ids
+    assert run(first.complete(task_ids)) == 0
+    assert run(first.fail(task_ids, 'error')) == {'retry': 0, 'dead': 0}
+    assert run(second.complete(task_ids)) == 1
+
+
+def test_heartbeat_extends_lease(conn):
+    first, second = make_queue(conn, 'w1'), make_queue(conn, 'w2')
+    run(first.enqueue(['a']))
+    task_ids = [task['id'] for task in run(first.claim(10))]
+    
+    conn.now = 200
+    assert run(first.heartbeat(task_ids)) == []
+    conn.now = 400
+    
+    assert run(second.claim(10)) == []
+
+
+def test_expired_lease_at_attempt_limit_becomes_dead(conn):
+    queue = make_queue(conn, max_attempts=1)
+    run(queue.enqueue(['a']))
+    run(queue.claim(10))
+    
+    # 워커가 죽어 임대가 만료된 작업은 시도 한도에 이르렀으면 다시 가져가지 않음
+    conn.now = 301
+    assert run(queue.claim(10)) == []
+    
+    row = next(iter(conn.rows.values()))
+    assert row['status'] == 'dead'
+    assert row['last_error'] == '임대 만료'
@@ -28,6 +28,83 @@ class Settings(BaseSettings):
     # Scheduler (Vercel Cron Jobs)
     scheduler_interval_hours: int = int(os.getenv("SCHEDULER_INTERVAL_HOURS", "2"))
     
+    # 근사 중복 판별 (제목 SimHash 해밍 거리, 영구 인덱스)
+    near_duplicate_enabled: bool = os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true"
+    near_duplicate_max_distance: int = int(os.getenv("NEAR_DUPLICATE_MAX_DISTANCE", "3"))
+    near_duplicate_window_days: int = int(os.getenv("NEAR_DUPLICATE_WINDOW_DAYS", "7"))
+    
+    # URL/제목 완전 중복 판별 (세대 교체형 Bloom 필터, 최근 세대 수 x 세대 기간 동안 기억)
+    dedup_generation_hours: float = float(os.getenv("DEDUP_GENERATION_HOURS", "24"))
+    dedup_generations: int = int(os.getenv("DEDUP_GENERATIONS", "2"))
+    dedup_generation_capacity: int = int(os.getenv("DEDUP_GENERATION_CAPACITY", "100000"))
+    dedup_false_positive_rate: float = float(os.getenv("DEDUP_FALSE_POSITIVE_RATE", "0.001"))
+    
+    # 키워드 동의어/표기 변형 확장 매칭 (keyword_articles.match_type = 'synonym')
+    keyword_synonym_expansion: bool = os.getenv("KEYWORD_SYNONYM_EXPANSION", "true").lower() == "true"
+    
+    # 감성 분석 강제 재분석 (감성 사전 변경 배포 시 사용)
+    sentiment_force_rescore: bool = os.getenv("SENTIMENT_FORCE_RESCORE", "false").lower() == "true"
+    
+    # 감성 분석 결과 캐시 (내용 해시 + 모델 버전, LRU) 및 기존 sentiments 조회 여부
+    sentiment_cache_size: int = int(os.getenv("SENTIMENT_CACHE_SIZE", "10000"))
+    sentiment_cache_db_lookup: bool = os.getenv("SENTIMENT_CACHE_DB_LOOKUP", "true").lower() == "true"
+    
+    # 감성 분석 백엔드 ('inprocess': 워커 프로세스에서 분석, 'remote': nlp-service에 요청)
+    nlp_backend: str = os.getenv("NLP_BACKEND", "inprocess")
+    # 원격 nlp-service 주소 (http://host:port 또는 unix:///path/to/nlp.sock)
+    nlp_service_url: Optional[str] = os.getenv("NLP_SERVICE_URL")
+    # 원격 요청 마이크로 배치 (최대 기사 수, 첫 요청 후 최대 대기 시간)
+    nlp_batch_size: int = int(os.getenv("NLP_BATCH_SIZE", "64"))
+    nlp_batch_max_wait_ms: int = int(os.getenv("NLP_BATCH_MAX_WAIT_MS", "10"))
+    
+    # 크롤링 결과 일괄 저장 배치 크기
+    crawl_write_batch_size: int = int(os.getenv("CRAWL_WRITE_BATCH_SIZE", "500"))
+    
+    # 크롤링 작업 DB 연결 풀 크기와 동시에 처리할 키워드 수
+    crawl_db_pool_size: int = int(os.getenv("CRAWL_DB_POOL_SIZE", "5"))
+    crawl_keyword_concurrency: int = int(os.getenv("CRAWL_KEYWORD_CONCURRENCY", "4"))
+    # 서버리스 Cron 크롤링 함수의 maxDuration (vercel.json의 api/cron/crawl.py와 같게)
+    crawl_function_max_duration_seconds: int = int(os.getenv("CRAWL_FUNCTION_MAX_DURATION_SECONDS", "300"))
+    # 서버리스 Cron 크롤링 시간 예산 (초, 남은 키워드는 다음 호출에서 이어서)
+    # 지정하지 않으면 maxDuration에서 진행 중인 키워드 마무리/상태 저장/응답에 쓸 45초를 뺀 값
+    crawl_time_budget_seconds: float = float(
+        os.getenv("CRAWL_TIME_BUDGET_SECONDS")
+        or int(os.getenv("CRAWL_FUNCTION_MAX_DURATION_SECONDS", "300")) - 45
+    )
+    
+    # 적응형 스케줄 (키워드별 다음 수집 시각 = 마지막 수집 + 최근 기사 수/notify_level로 정한 간격)
+    # 기본값은 꺼 둠 (켜면 SCHEDULER_INTERVAL_HOURS 대신 키워드별 간격으로 수집)
+    adaptive_scheduling_enabled: bool = os.getenv("ADAPTIVE_SCHEDULING_ENABLED", "false").lower() == "true"
+    crawl_min_interval_minutes: int = int(os.getenv("CRAWL_MIN_INTERVAL_MINUTES", "15"))
+    crawl_max_interval_minutes: int = int(os.getenv("CRAWL_MAX_INTERVAL_MINUTES", "360"))
+    # 최근 기사 수를 세는 기간 (시간)
+    crawl_yield_window_hours: int = int(os.getenv("CRAWL_YIELD_WINDOW_HOURS", "24"))
+    # 한 번 수집할 때 새로 쌓이길 기대하는 기사 수 (작을수록 자주 수집)
+    crawl_target_articles_per_run: float = float(os.getenv("CRAWL_TARGET_ARTICLES_PER_RUN", "5"))
+    # 한 작업에 보내는 만기 키워드(고유 텍스트) 최대 개수
+    crawl_dispatch_batch_size: int = int(os.getenv("CRAWL_DISPATCH_BATCH_SIZE", "100"))
+    
+    # 크롤링 작업 큐 (true면 스케줄러는 만기 키워드를 crawl_tasks에 넣고 crawl_queue 워커들이 나눠 수집)
+    crawl_queue_enabled: bool = os.getenv("CRAWL_QUEUE_ENABLED", "false").lower() == "true"
+    # 작업 임대 시간 (초, 하트비트가 이 시간의 1/3마다 연장, 워커가 죽으면 만료 후 다른 워커가 가져감)
+    crawl_queue_lease_seconds: int = int(os.getenv("CRAWL_QUEUE_LEASE_SECONDS", "300"))
+    # 워커가 한 번에 가져가는 작업 수 (피드 수집 한 번을 함께 쓰는 키워드 텍스트 수)
+    crawl_queue_claim_size: int = int(os.getenv("CRAWL_QUEUE_CLAIM_SIZE", "50"))
+    # 재시도 한도 (넘으면 dead) / 재시도 대기 (초, 시도마다 두 배, 최대값까지)
+    crawl_queue_max_attempts: int = int(os.getenv("CRAWL_QUEUE_MAX_ATTEMPTS", "5"))
+    crawl_queue_retry_base_seconds: int = int(os.getenv("CRAWL_QUEUE_RETRY_BASE_SECONDS", "60"))
+    crawl_queue_retry_max_seconds: int = int(os.getenv("CRAWL_QUEUE_RETRY_MAX_SECONDS", "3600"))
+    # 가져갈 작업이 없을 때 다시 확인하는 간격 (초)
+    crawl_queue_poll_seconds: float = float(os.getenv("CRAWL_QUEUE_POLL_SECONDS", "10"))
+    
+    # 감성 분석 전체 재분석(백필) - 워커 수 0이면 CPU 코어 수만큼 사용
+    sentiment_backfill_workers: int = int(os.getenv("SENTIMENT_BACKFILL_WORKERS", "0"))
+    sentiment_backfill_batch_size: int = int(os.getenv("SENTIMENT_BACKFILL_BATCH_SIZE", "20000"))
+    sentiment_backfill_checkpoint_path: str = os.getenv(
+        "SENTIMENT_BACKFILL_CHECKPOINT_PATH",
+        "data/sentiment_backfill.json"
+    )
+    
     # Rate Limiting (선택사항 - Vercel에서 제공하는 Rate Limiting 사용 가능)
     rate_limit_per_minute: int = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
     rate_limit_per_hour: int = int(os.getenv("RATE_LIMIT_PER_HOUR", "1000"))
@@ -38,6 +115,23 @@ class Settings(BaseSettings):
         "https://rss.cnn.com/rss/edition.rss,https://feeds.bbci.co.uk/news/rss.xml"
     ).split(",")
     
+    # RSS 수집 (비동기 연결 풀)
+    rss_fetch_timeout_seconds: int = int(os.getenv("RSS_FETCH_TIMEOUT_SECONDS", "10"))
+    rss_fetch_max_connections: int = int(os.getenv("RSS_FETCH_MAX_CONNECTIONS", "20"))
+    rss_fetch_max_connections_per_host: int = int(os.getenv("RSS_FETCH_MAX_CONNECTIONS_PER_HOST", "4"))
+    rss_parser_backend: str = os.getenv("RSS_PARSER_BACKEND", "feedparser")  # 'feedparser', 'lxml'
+    
+    # RSS 조건부 요청 검증자(ETag/Last-Modified) 저장소
+    feed_state_store: str = os.getenv("FEED_STATE_STORE", "database")  # 'database', 'file', 'none'
+    feed_state_path: str = os.getenv("FEED_STATE_PATH", "data/feed_states.json")
+    
+    # 증분 수집 워터마크 이전 항목을 다시 확인하는 구간 (늦게 게시/수정된 항목 대응)
+    feed_watermark_lookback_hours: int = int(os.getenv("FEED_WATERMARK_LOOKBACK_HOURS", "6"))
+    
+    # 일부 키워드 수집 작업(적응형 스케줄/작업 큐)이 공유하는 피드 스냅샷을 요청 없이 재사용하는 시간 (초)
+    # 지나면 캐시된 검증자로 조건부 요청 (변경 없으면 다시 파싱하지 않음)
+    feed_snapshot_max_age_seconds: int = int(os.getenv("FEED_SNAPSHOT_MAX_AGE_SECONDS", "300"))
+    
     # Redis (선택사항 - 필요시 Upstash 사용)
     redis_url: Optional[str] = os.getenv("REDIS_URL")
     
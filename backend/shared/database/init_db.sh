@@ -3,7 +3,11 @@
 
 echo "데이터베이스 초기화 중..."
 
-psql -h localhost -U onmi -d onmi_db -f migrations/001_init_schema.sql
+# 마이그레이션 파일을 번호 순서대로 실행
+for migration in migrations/*.sql; do
+    echo "마이그레이션 실행: $migration"
+    psql -h localhost -U onmi -d onmi_db -f "$migration"
+done
 
 echo "데이터베이스 초기화 완료!"
 
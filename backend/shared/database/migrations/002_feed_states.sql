@@ -0,0 +1,11 @@
+-- RSS 소스별 수집 상태 (조건부 요청 검증자)
+-- Supabase PostgreSQL 호환
+
+-- feed_states 테이블
+CREATE TABLE IF NOT EXISTS feed_states (
+    source_url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
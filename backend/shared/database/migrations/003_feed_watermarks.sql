@@ -0,0 +1,6 @@
+-- RSS 소스별 증분 수집 워터마크
+-- Supabase PostgreSQL 호환
+
+ALTER TABLE feed_states ADD COLUMN IF NOT EXISTS last_entry_guid TEXT;
+ALTER TABLE feed_states ADD COLUMN IF NOT EXISTS last_published_at TIMESTAMPTZ;
+ALTER TABLE feed_states ADD COLUMN IF NOT EXISTS recent_guids JSONB DEFAULT '[]'::jsonb;
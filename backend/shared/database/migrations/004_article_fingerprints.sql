@@ -0,0 +1,13 @@
+-- 근사 중복 판별용 기사 제목 SimHash 지문
+-- Supabase PostgreSQL 호환
+
+-- article_fingerprints 테이블
+CREATE TABLE IF NOT EXISTS article_fingerprints (
+    id BIGSERIAL PRIMARY KEY,
+    simhash BIGINT NOT NULL,
+    url TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- 인덱스
+CREATE INDEX IF NOT EXISTS idx_article_fingerprints_created_at ON article_fingerprints(created_at DESC);
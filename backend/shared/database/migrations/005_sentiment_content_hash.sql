@@ -0,0 +1,4 @@
+-- 감성 분석 입력 내용 해시 (내용/모델 버전이 같으면 재분석 생략)
+-- Supabase PostgreSQL 호환
+
+ALTER TABLE sentiments ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
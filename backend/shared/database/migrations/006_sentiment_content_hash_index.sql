@@ -0,0 +1,4 @@
+-- 내용 해시 기반 감성 분석 결과 조회 (같은 제목/요약의 신디케이션 기사 재사용)
+-- Supabase PostgreSQL 호환
+
+CREATE INDEX IF NOT EXISTS idx_sentiments_content_hash ON sentiments(content_hash, model_ver);
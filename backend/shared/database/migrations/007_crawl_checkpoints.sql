@@ -0,0 +1,13 @@
+-- 시간 예산 크롤링 작업의 진행 커서 (서버리스 호출 간 이어서 수집)
+-- Supabase PostgreSQL 호환
+
+-- crawl_checkpoints 테이블
+-- round_started_at: 현재 라운드 시작 시각 (이후에 수집된 키워드는 이번 라운드에서 제외)
+-- position_crawled_at, position_keyword_id: 우선순위 순서상 처리를 마친 마지막 키워드 위치
+CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+    job_name TEXT PRIMARY KEY,
+    round_started_at TIMESTAMPTZ NOT NULL,
+    position_crawled_at TIMESTAMPTZ,
+    position_keyword_id UUID,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
@@ -0,0 +1,32 @@
+-- 여러 크롤러 프로세스가 나눠 처리하는 키워드 수집 작업 큐 (임대 방식)
+-- Supabase PostgreSQL 호환
+
+-- crawl_tasks 테이블
+-- keyword_key: 정규화한 키워드 텍스트 (같은 텍스트의 키워드는 한 작업으로 수집)
+-- status: pending(대기) / leased(처리 중) / dead(재시도 한도 초과, 확인용으로 보관)
+-- attempts: 임대된 횟수 (임대가 만료된 경우도 포함)
+-- available_at: 재시도 대기가 끝나 다시 가져갈 수 있는 시각
+-- lease_owner, lease_expires_at: 처리 중인 워커와 임대 만료 시각 (하트비트로 연장)
+CREATE TABLE IF NOT EXISTS crawl_tasks (
+    id BIGSERIAL PRIMARY KEY,
+    keyword_key TEXT NOT NULL,
+    status VARCHAR(10) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    lease_owner TEXT,
+    lease_expires_at TIMESTAMPTZ,
+    last_error TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    CONSTRAINT crawl_tasks_status_check CHECK (status IN ('pending', 'leased', 'dead'))
+);
+
+-- 같은 키워드 텍스트의 대기/처리 중 작업은 하나만
+CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_tasks_open_keyword_key
+    ON crawl_tasks(keyword_key) WHERE status IN ('pending', 'leased');
+
+-- 가져갈 작업 조회 (대기 작업은 available_at 순, 처리 중 작업은 임대 만료 순)
+CREATE INDEX IF NOT EXISTS idx_crawl_tasks_pending
+    ON crawl_tasks(available_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_crawl_tasks_lease_expires_at
+    ON crawl_tasks(lease_expires_at) WHERE status = 'leased';
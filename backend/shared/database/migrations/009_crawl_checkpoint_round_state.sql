@@ -0,0 +1,7 @@
+-- 시간 예산 크롤링 라운드의 피드 상태/실패 기록
+-- Supabase PostgreSQL 호환
+
+-- feed_states: 라운드 첫 호출에서 받은 피드 검증자/워터마크 (라운드를 실패 없이 마치면 feed_states 테이블에 저장)
+-- failed_keywords: 라운드 중 수집에 실패한 키워드 수 (0이 아니면 라운드를 마쳐도 피드 상태를 저장하지 않음)
+ALTER TABLE crawl_checkpoints ADD COLUMN IF NOT EXISTS feed_states JSONB;
+ALTER TABLE crawl_checkpoints ADD COLUMN IF NOT EXISTS failed_keywords INTEGER NOT NULL DEFAULT 0;
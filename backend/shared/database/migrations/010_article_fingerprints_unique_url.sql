@@ -0,0 +1,10 @@
+-- 기사 URL당 지문 하나만 저장 (체크포인트/일부 키워드 작업이 같은 기사 지문을 반복 저장하지 않도록)
+-- Supabase PostgreSQL 호환
+
+-- 이미 중복 저장된 지문은 가장 먼저 기록된 행만 남김
+DELETE FROM article_fingerprints a
+USING article_fingerprints b
+WHERE a.url = b.url AND a.id > b.id;
+
+-- 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS idx_article_fingerprints_url ON article_fingerprints(url);
@@ -0,0 +1,15 @@
+-- 감성 분석기가 없는 언어의 기존 기사에 중립 감성 행 추가
+-- (조회 API가 sentiments와 INNER JOIN하므로 행이 없는 영어 기사 등은 피드/통계/알림에 나오지 않았음)
+-- Supabase PostgreSQL 호환
+
+INSERT INTO sentiments (article_id, label, score, rationale, model_ver)
+SELECT
+    a.id,
+    'neutral',
+    0.5,
+    jsonb_build_object('tokens', '[]'::jsonb, 'unsupported_language', a.lang),
+    'unsupported'
+FROM articles a
+WHERE a.lang IS DISTINCT FROM 'ko'
+  AND NOT EXISTS (SELECT 1 FROM sentiments s WHERE s.article_id = a.id)
+ON CONFLICT (article_id) DO NOTHING;
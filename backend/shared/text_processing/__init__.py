@@ -0,0 +1,4 @@
+# 공통 텍스트 처리 모듈
+
+
+
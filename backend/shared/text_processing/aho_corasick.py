@@ -0,0 +1,82 @@
+"""Aho-Corasick 다중 패턴 문자열 매칭"""
+from collections import deque
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class AhoCorasickAutomaton:
+    """여러 패턴을 하나의 오토마톤으로 컴파일해 텍스트를 한 번만 훑는 매처
+    
+    매칭 비용은 패턴 수와 무관하게 텍스트 길이(+ 매칭 수)에 비례한다.
+    """
+    
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, Any]]] = [[]]
+        self._built = False
+    
+    def add(self, pattern: str, value: Any):
+        """패턴 추가 (빈 패턴은 무시)"""
+        if not pattern:
+            return
+        if self._built:
+            raise RuntimeError("이미 컴파일된 오토마톤에는 패턴을 추가할 수 없습니다")
+        
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        
+        self._outputs[state].append((len(pattern), value))
+    
+    def build(self):
+        """실패 링크 계산 (BFS)"""
+        queue = deque(self._goto[0].values())
+        
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail_target if fail_target != next_state else 0
+                
+                # 실패 링크 쪽에서 끝나는 패턴도 함께 출력
+                self._outputs[next_state] = (
+                    self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                )
+        
+        self._built = True
+        return self
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """텍스트의 모든 매칭을 (시작 위치, 끝 위치, 값) 형태로 반환"""
+        if not self._built:
+            self.build()
+        
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            
+            for length, value in outputs[state]:
+                end = index + 1
+                yield end - length, end, value
+    
+    def __len__(self) -> int:
+        """상태 수"""
+        return len(self._goto)
@@ -0,0 +1,34 @@
+"""문자 비율 기반 언어 감지 (모델 없이 한글/라틴 문자 수로 판별)"""
+import re
+
+
+# HTML 태그 안의 라틴 문자는 세지 않음 (요약에 태그가 남아 있는 피드 대응)
+TAG_PATTERN = re.compile(r'<[^>]*>')
+HANGUL_PATTERN = re.compile(r'[가-힣\u3131-\u318e\u1100-\u11ff]')
+LATIN_PATTERN = re.compile(r'[A-Za-z\u00c0-\u024f]')
+
+# 한글 음절 하나는 라틴 문자 2~3개 분량이므로 가중치를 두고 비교
+HANGUL_WEIGHT = 3
+# 가중치를 준 한글 비율이 이 값 이상이면 한국어 (영문 고유명사가 섞인 한국어 기사 대응)
+KOREAN_MIN_SHARE = 0.3
+
+DEFAULT_LANGUAGE = 'ko'
+
+
+def detect_language(text: str, default: str = DEFAULT_LANGUAGE) -> str:
+    """텍스트의 언어 코드 ('ko' 또는 'en', 판별할 문자가 없으면 default)
+    
+    라틴 문자가 우세한 텍스트는 수집 소스 특성상 영어로 취급한다.
+    """
+    if not text:
+        return default
+    
+    if '<' in text:
+        text = TAG_PATTERN.sub(' ', text)
+    
+    hangul = HANGUL_PATTERN.subn('', text)[1] * HANGUL_WEIGHT
+    latin = LATIN_PATTERN.subn('', text)[1]
+    if not hangul and not latin:
+        return default
+    
+    return 'ko' if hangul >= KOREAN_MIN_SHARE * (hangul + latin) else 'en'
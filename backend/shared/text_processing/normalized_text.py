@@ -0,0 +1,91 @@
+"""기사 텍스트 정규화 (기사당 한 번 계산해 매칭/중복 제거/감성 분석이 공유)"""
+import re
+from functools import cached_property
+from itertools import groupby
+from typing import Dict, List
+
+from text_processing.language import detect_language
+
+
+# 감성 분석 전처리: 단어/공백/한글 외 문자(이모지, 문장 부호)를 공백으로
+CLEAN_PATTERN = re.compile(r'[^\w\s가-힣]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# SimHash 특징 추출 (simhash 패키지의 기본 토큰화와 동일)
+SHINGLE_PATTERN = re.compile(r'[\w\u4e00-\u9fcc]+')
+SHINGLE_WIDTH = 4
+
+
+def clean_text(text: str) -> str:
+    """이모지/문장 부호를 제거하고 공백을 한 칸으로 정리"""
+    text = CLEAN_PATTERN.sub(' ', text)
+    text = WHITESPACE_PATTERN.sub(' ', text)
+    return text.strip()
+
+
+def shingle_features(text: str) -> Dict[str, int]:
+    """SimHash 입력 특징 (소문자 4글자 shingle -> 등장 횟수)"""
+    content = ''.join(SHINGLE_PATTERN.findall(text.lower()))
+    shingles = [
+        content[i:i + SHINGLE_WIDTH]
+        for i in range(max(len(content) - SHINGLE_WIDTH + 1, 1))
+    ]
+    return {shingle: sum(1 for _ in group) for shingle, group in groupby(sorted(shingles))}
+
+
+class NormalizedText:
+    """기사 제목/요약의 정규화 결과
+    
+    수집기가 기사마다 하나 만들어 article['normalized']에 붙이면
+    키워드 매처, 중복 제거기, 감성 분석기가 같은 결과를 재사용한다.
+    각 형태는 처음 사용할 때 한 번만 계산된다.
+    """
+    
+    def __init__(self, title: str, snippet: str = ""):
+        self.title = title or ''
+        self.snippet = snippet or ''
+    
+    @cached_property
+    def match_text(self) -> str:
+        """키워드 매칭용 소문자 원문 (제목과 요약 사이는 개행으로 구분)"""
+        return f"{self.title.lower()}\n{self.snippet.lower()}"
+    
+    @cached_property
+    def clean_title(self) -> str:
+        """감성 분석 전처리된 제목"""
+        return clean_text(self.title)
+    
+    @cached_property
+    def clean_snippet(self) -> str:
+        """감성 분석 전처리된 요약"""
+        return clean_text(self.snippet)
+    
+    @cached_property
+    def title_lower(self) -> str:
+        """전처리된 제목의 소문자 형태"""
+        return self.clean_title.lower()
+    
+    @cached_property
+    def snippet_lower(self) -> str:
+        """전처리된 요약의 소문자 형태"""
+        return self.clean_snippet.lower()
+    
+    @cached_property
+    def title_tokens(self) -> List[str]:
+        """전처리된 소문자 제목의 공백 단위 토큰"""
+        return self.title_lower.split()
+    
+    @cached_property
+    def snippet_tokens(self) -> List[str]:
+        """전처리된 소문자 요약의 공백 단위 토큰"""
+        return self.snippet_lower.split()
+    
+    @cached_property
+    def lang(self) -> str:
+        """제목과 요약의 문자 비율로 감지한 언어 코드"""
+        return detect_language(f"{self.title} {self.snippet}")
+    
+    @cached_property
+    def title_shingles(self) -> Dict[str, int]:
+        """제목 SimHash 특징"""
+        return shingle_features(self.title)
@@ -66,6 +66,7 @@ CREATE TABLE IF NOT EXISTS sentiments (
     score FLOAT NOT NULL,
     rationale JSONB,
     model_ver VARCHAR(20),
+    content_hash VARCHAR(64),
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
     UNIQUE(article_id),
@@ -96,6 +97,52 @@ CREATE TABLE IF NOT EXISTS share_history (
     CONSTRAINT share_history_channel_check CHECK (channel IN ('kakao', 'email', 'sms', 'clipboard', 'auto', 'other'))
 );
 
+-- feed_states 테이블 (RSS 소스별 수집 상태)
+CREATE TABLE IF NOT EXISTS feed_states (
+    source_url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    last_entry_guid TEXT,
+    last_published_at TIMESTAMPTZ,
+    recent_guids JSONB DEFAULT '[]'::jsonb,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- article_fingerprints 테이블 (근사 중복 판별용 제목 SimHash 지문)
+CREATE TABLE IF NOT EXISTS article_fingerprints (
+    id BIGSERIAL PRIMARY KEY,
+    simhash BIGINT NOT NULL,
+    url TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- crawl_checkpoints 테이블 (시간 예산 크롤링 작업의 진행 커서)
+CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+    job_name TEXT PRIMARY KEY,
+    round_started_at TIMESTAMPTZ NOT NULL,
+    position_crawled_at TIMESTAMPTZ,
+    position_keyword_id UUID,
+    feed_states JSONB,
+    failed_keywords INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- crawl_tasks 테이블 (여러 크롤러 프로세스가 임대 방식으로 나눠 처리하는 키워드 수집 작업 큐)
+CREATE TABLE IF NOT EXISTS crawl_tasks (
+    id BIGSERIAL PRIMARY KEY,
+    keyword_key TEXT NOT NULL,
+    status VARCHAR(10) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    lease_owner TEXT,
+    lease_expires_at TIMESTAMPTZ,
+    last_error TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    CONSTRAINT crawl_tasks_status_check CHECK (status IN ('pending', 'leased', 'dead'))
+);
+
 -- ============================================
 -- 인덱스 생성
 -- ============================================
@@ -123,6 +170,7 @@ CREATE INDEX IF NOT EXISTS idx_keyword_articles_match_score ON keyword_articles(
 CREATE INDEX IF NOT EXISTS idx_sentiments_article_id ON sentiments(article_id);
 CREATE INDEX IF NOT EXISTS idx_sentiments_label ON sentiments(label);
 CREATE INDEX IF NOT EXISTS idx_sentiments_score ON sentiments(score DESC);
+CREATE INDEX IF NOT EXISTS idx_sentiments_content_hash ON sentiments(content_hash, model_ver);
 
 -- user_actions 테이블 인덱스
 CREATE INDEX IF NOT EXISTS idx_user_actions_user_id ON user_actions(user_id);
@@ -143,6 +191,15 @@ CREATE INDEX IF NOT EXISTS idx_share_history_channel ON share_history(channel);
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at DESC);
 
+-- article_fingerprints 테이블 인덱스
+CREATE INDEX IF NOT EXISTS idx_article_fingerprints_created_at ON article_fingerprints(created_at DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_article_fingerprints_url ON article_fingerprints(url);
+
+-- crawl_tasks 테이블 인덱스 (같은 키워드 텍스트의 대기/처리 중 작업은 하나만)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_tasks_open_keyword_key ON crawl_tasks(keyword_key) WHERE status IN ('pending', 'leased');
+CREATE INDEX IF NOT EXISTS idx_crawl_tasks_pending ON crawl_tasks(available_at) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_crawl_tasks_lease_expires_at ON crawl_tasks(lease_expires_at) WHERE status = 'leased';
+
 -- ============================================
 -- 업데이트 트리거 함수 (updated_at 자동 갱신)
 -- ============================================